@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Headless entry point for the Brand Positioning Intelligence Platform.
+Serves the analysis HTTP API without loading Streamlit.
+"""
+
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+if __name__ == "__main__":
+    import uvicorn
+    from brand_positioning.config import Config
+    
+    # Launch the API
+    uvicorn.run("brand_positioning.api.app:app", host=Config.API_HOST, port=Config.API_PORT)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Batch entry point for the Brand Positioning Intelligence Platform.
+Analyzes every brand in a CSV or JSONL file and appends results to a JSONL file.
+Re-running the same command resumes an interrupted batch.
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+if __name__ == "__main__":
+    from brand_positioning.core.batch import BATCH_MODES, load_brands, run_batch
+    from brand_positioning.core.process_pool import EXECUTOR_BACKENDS
+    
+    parser = argparse.ArgumentParser(description="Analyze a portfolio of brands")
+    parser.add_argument("input", help="CSV (brand, product, target columns) or JSONL file of brands")
+    parser.add_argument("-o", "--output", help="Results JSONL file (default: <input>.results.jsonl)")
+    parser.add_argument("--mode", choices=BATCH_MODES, default="focused", help="Analysis type (default: focused)")
+    parser.add_argument("--workers", type=int, help="Brands analyzed concurrently (default: BATCH_MAX_WORKERS)")
+    parser.add_argument("--executor", choices=EXECUTOR_BACKENDS,
+                        help="Run analyses on threads or in worker processes (default: ANALYSIS_EXECUTOR)")
+    parser.add_argument("--no-llm-cache", action="store_true", help="Bypass cached LLM completions")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    
+    output = args.output or os.path.splitext(args.input)[0] + ".results.jsonl"
+    summary = run_batch(
+        load_brands(args.input),
+        output,
+        mode=args.mode,
+        max_workers=args.workers,
+        llm_cache=False if args.no_llm_cache else None,
+        executor=args.executor
+    )
+    print(json.dumps(summary, indent=2))
+    sys.exit(1 if summary["failed"] else 0)
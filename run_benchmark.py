@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark entry point for the Brand Positioning Intelligence Platform.
+Runs the workflows end to end against local SerpAPI and LLM stand-ins, so no
+API keys or quota are needed, and reports latency, throughput and memory.
+"""
+
+import sys
+import os
+import argparse
+import json
+import logging
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+if __name__ == "__main__":
+    from brand_positioning.benchmark.harness import BENCHMARK_MODES, format_report, run_benchmark
+    
+    parser = argparse.ArgumentParser(description="Benchmark the analysis workflows against local API stand-ins")
+    parser.add_argument("--modes", nargs="+", choices=BENCHMARK_MODES, default=list(BENCHMARK_MODES),
+                        help="Workflows to run (default: all)")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4],
+                        help="Concurrent analyses per level (default: 1 4)")
+    parser.add_argument("--runs", type=int, help="Analyses per level (default: twice the concurrency)")
+    parser.add_argument("--serp-latency", default="lognormal:0.8:2.0",
+                        help="fixed:<s>, uniform:<low>:<high> or lognormal:<median>:<p95> (default: lognormal:0.8:2.0)")
+    parser.add_argument("--llm-latency", default="lognormal:1.5:4.0", help="Same format (default: lognormal:1.5:4.0)")
+    parser.add_argument("--serp-recordings", help="JSON file mapping queries to recorded SerpAPI responses")
+    parser.add_argument("--llm-responses", help="JSON file with a list of recorded final answers to replay")
+    parser.add_argument("--caches", action="store_true", help="Enable search and LLM caches (in a temporary directory)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--seed", type=int, default=0, help="Latency sampling seed (default: 0)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    
+    def load(path):
+        if not path:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    
+    report = run_benchmark(
+        modes=args.modes,
+        concurrency_levels=args.concurrency,
+        runs_per_level=args.runs,
+        serp_latency=args.serp_latency,
+        llm_latency=args.llm_latency,
+        serp_recordings=load(args.serp_recordings),
+        llm_responses=load(args.llm_responses),
+        caches=args.caches,
+        seed=args.seed
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    sys.exit(1 if any(row["failures"] for row in report["rows"]) else 0)
@@ -1,28 +1,40 @@
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from brand_positioning.tools.tools import CompetitorResearchTool, CustomerInsightTool, MarketTrendTool
+from brand_positioning.tools.async_tools import (
+    AsyncCompetitorResearchTool,
+    AsyncCustomerInsightTool,
+    AsyncMarketTrendTool
+)
 from brand_positioning.config import Config
+from brand_positioning.agents.llm import AgentLLM
 
 def _get_llm():
-    """Get LLM instance with current API key"""
-    return ChatOpenAI(
+    """Get rate-limited LLM instance with current API key"""
+    return AgentLLM(
         model=Config.OPENAI_MODEL,
         api_key=Config.OPENAI_API_KEY,
+        base_url=Config.OPENAI_BASE_URL,
         temperature=0.1
     )
 
-def _get_tools():
-    """Get tool instances"""
+def _get_tools(async_tools=False):
+    """Get tool instances (asyncio variants run searches on a non-blocking client)"""
+    if async_tools:
+        return {
+            'competitor': AsyncCompetitorResearchTool(),
+            'customer': AsyncCustomerInsightTool(),
+            'trend': AsyncMarketTrendTool()
+        }
     return {
         'competitor': CompetitorResearchTool(),
         'customer': CustomerInsightTool(),
         'trend': MarketTrendTool()
     }
 
-def create_market_intelligence_agent():
+def create_market_intelligence_agent(async_tools=False):
     """Create agent for competitive and market intelligence gathering"""
     llm = _get_llm()
-    tools = _get_tools()
+    tools = _get_tools(async_tools)
     return Agent(
         role="Market Intelligence Specialist",
         goal="Discover and analyze competitors, customer insights, and market trends for strategic positioning",
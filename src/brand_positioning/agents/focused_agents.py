@@ -4,15 +4,23 @@ Streamlined for founders who need clear, actionable insights.
 """
 
 from crewai import Agent
-from langchain_openai import ChatOpenAI
 from brand_positioning.tools.focused_tools import CompetitorGapTool, PositioningOpportunityTool
-from brand_positioning.config import Config
+from brand_positioning.tools.async_tools import AsyncCompetitorGapTool, AsyncPositioningOpportunityTool
+from brand_positioning.agents.agents import _get_llm
 
-def create_positioning_specialist_agent():
+def create_positioning_specialist_agent(async_tools=False, research_tools=True):
     """
     Single focused agent that finds positioning opportunities and strategic moves.
     Designed for founders who need specific, actionable insights.
+    research_tools=False builds it without tools, for tasks whose research is attached up front.
     """
+    if not research_tools:
+        tools = []
+    elif async_tools:
+        tools = [AsyncCompetitorGapTool(), AsyncPositioningOpportunityTool()]
+    else:
+        tools = [CompetitorGapTool(), PositioningOpportunityTool()]
+    
     return Agent(
         role="Brand Positioning Specialist",
         goal="Find the exact niche a brand should dominate and the one strategic move to get there",
@@ -34,13 +42,6 @@ def create_positioning_specialist_agent():
         Be forensically specific. Every recommendation must trace back to actual research findings.""",
         verbose=True,
         allow_delegation=False,
-        llm=ChatOpenAI(
-            model=Config.OPENAI_MODEL,
-            api_key=Config.OPENAI_API_KEY,
-            temperature=0.1
-        ),
-        tools=[
-            CompetitorGapTool(),
-            PositioningOpportunityTool()
-        ]
+        llm=_get_llm(),
+        tools=tools
     )
\ No newline at end of file
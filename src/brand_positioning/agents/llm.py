@@ -0,0 +1,109 @@
+"""
+LLM client used by every agent factory.
+Routes completions through the process-wide LLM rate limiter and the shared
+completion cache, can stream tokens to a per-run callback, and records to or
+replays from the active cassette.
+"""
+
+import threading
+from typing import Callable, Optional
+from crewai import LLM
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+import logging
+
+from brand_positioning.cassette import get_cassette
+from brand_positioning.metrics import LLM as LLM_SPAN, MetricsRecorder, count, span
+from brand_positioning.rate_limiter import get_llm_limiter
+from brand_positioning.agents.llm_cache import LLMCacheSession, count_tokens, get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+
+class AgentLLM(LLM):
+    """CrewAI LLM that serves exact-match prompts from cache and otherwise waits on the shared LLM budget"""
+
+    # Per-run cache switch and counters; None means cache according to configuration
+    cache_session: LLMCacheSession = None
+    
+    # Per-run receiver for streamed tokens; None means the completion is returned in one piece
+    token_callback: Optional[Callable[[str], None]] = None
+    
+    # Per-run recorder for call timings and token counts
+    metrics: Optional[MetricsRecorder] = None
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None,
+             from_task=None, from_agent=None):
+        cassette = get_cassette()
+        if cassette and cassette.replaying:
+            response = cassette.replay_completion(self.model, self.temperature, messages)
+            if self.token_callback:
+                self.token_callback(response)
+            return response
+
+        session = self.cache_session
+        use_cache = (session is None or session.enabled) and not tools and not available_functions
+        cache = get_llm_cache() if use_cache else None
+        key = cache.make_key(self.model, self.temperature, messages) if cache else None
+
+        if cache:
+            cached = cache.get(key)
+            if session:
+                session.record(cached is not None, cached[1] if cached else 0)
+            if cached is not None:
+                logger.info("LLM response served from cache")
+                count("llm_cache_hits", recorder=self.metrics)
+                if cassette:
+                    cassette.record_completion(self.model, self.temperature, messages, cached[0])
+                if self.token_callback:
+                    self.token_callback(cached[0])
+                return cached[0]
+
+        with span(LLM_SPAN, self.model, recorder=self.metrics, model=self.model) as record:
+            waited = get_llm_limiter().acquire()
+            if waited:
+                logger.info(f"LLM call throttled for {waited:.2f}s")
+            record["attributes"]["queue_wait"] = waited
+            response = super().call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent
+            )
+
+            prompt_tokens = count_tokens(self.model, messages=messages)
+            completion_tokens = count_tokens(self.model, text=response) if isinstance(response, str) else 0
+            record["attributes"].update(tokens_in=prompt_tokens, tokens_out=completion_tokens)
+
+        if cache and isinstance(response, str) and response:
+            cache.set(key, response, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        if cassette and isinstance(response, str):
+            cassette.record_completion(self.model, self.temperature, messages, response)
+        return response
+
+
+def _forward_stream_chunk(source, event):
+    """Event bus handler: hand streamed text chunks to the emitting LLM's token callback"""
+    callback = getattr(source, "token_callback", None)
+    if isinstance(source, AgentLLM) and callback and event.chunk and not event.tool_call:
+        callback(event.chunk)
+
+
+_stream_handler_lock = threading.Lock()
+
+
+def bind_token_callback(agents, callback: Optional[Callable[[str], None]]):
+    """Stream the completions of these agents' LLMs to callback (None switches streaming off)"""
+    with _stream_handler_lock:
+        # Checked on every bind: crewai's scoped_handlers() can swap the handler table out
+        handlers = crewai_event_bus._handlers.get(LLMStreamChunkEvent, [])
+        if callback and _forward_stream_chunk not in handlers:
+            crewai_event_bus.register_handler(LLMStreamChunkEvent, _forward_stream_chunk)
+
+    for agent in agents:
+        llm = getattr(agent, "llm", None)
+        if isinstance(llm, AgentLLM):
+            llm.token_callback = callback
+            llm.stream = callback is not None
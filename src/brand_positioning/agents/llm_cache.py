@@ -0,0 +1,200 @@
+"""
+Persistent LLM completion cache shared by every agent factory.
+Completions are keyed on model, temperature and the exact prompt and kept in SQLite,
+so re-running an analysis over the same evidence skips the LLM round trips.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def count_tokens(model: str, messages=None, text: Optional[str] = None) -> int:
+    """Token count via litellm's tokenizer, with a character estimate as fallback"""
+    if isinstance(messages, str):
+        text = messages
+    try:
+        import litellm
+        if text is not None:
+            return litellm.token_counter(model=model, text=text)
+        return litellm.token_counter(model=model, messages=messages)
+    except Exception:
+        content = text if text is not None else json.dumps(messages, default=str)
+        return len(content) // 4
+
+
+class LLMCache:
+    """SQLite-backed completion cache with TTL expiry and size-bounded LRU eviction"""
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, temperature: Optional[float], messages) -> str:
+        """Build a stable content address from the model, temperature and prompt"""
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "messages": messages},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, int]]:
+        """Return (completion, tokens_saved) for this key, or None on a miss"""
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, prompt_tokens, completion_tokens, created_at FROM llm_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, prompt_tokens, completion_tokens, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return response, prompt_tokens + completion_tokens
+
+    def set(self, key: str, response: str, prompt_tokens: int = 0, completion_tokens: int = 0):
+        """Store a completion and evict least recently used entries beyond the size bound"""
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO llm_cache
+                   (key, response, prompt_tokens, completion_tokens, created_at, last_access)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (key, response, prompt_tokens, completion_tokens, now, now)
+            )
+
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?
+                    )""",
+                    (overflow,)
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every cached completion"""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+
+class LLMCacheSession:
+    """Per-run cache switch and counters, bound onto the LLM instances of one analysis"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool, tokens_saved: int = 0):
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self.tokens_saved += tokens_saved
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio and tokens saved during this run"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "tokens_saved": self.tokens_saved
+            }
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Get the process-wide LLM cache, or None when caching is disabled"""
+    global _cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            path = os.path.join(Config.DATA_DIR, "llm_cache.sqlite3")
+            try:
+                _cache = LLMCache(
+                    path,
+                    ttl_seconds=Config.LLM_CACHE_TTL_HOURS * 3600,
+                    max_entries=Config.LLM_CACHE_MAX_ENTRIES
+                )
+                logger.info(f"LLM cache opened at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"LLM cache unavailable: {e}")
+                return None
+        return _cache
+
+
+def bind_llm_cache_session(agents, session: LLMCacheSession):
+    """Attach a run's cache session to the LLM of each agent"""
+    for agent in agents:
+        llm = getattr(agent, "llm", None)
+        if llm is not None and hasattr(llm, "cache_session"):
+            llm.cache_session = session
@@ -0,0 +1,90 @@
+"""
+Process-level pool of pre-built agents and orchestrators.
+Building an agent constructs its LLM client, tools and CrewAI executor; pooling
+lets each analysis check out a ready instance and hand it back afterwards, so
+repeat runs skip construction and keep the provider's HTTP connections warm.
+"""
+
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Tuple
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _credentials_key() -> Tuple[str, str, str]:
+    """Instances built for one API key, model and endpoint are never handed to another"""
+    api_key = Config.OPENAI_API_KEY or os.getenv("OPENAI_API_KEY") or ""
+    return api_key, Config.OPENAI_MODEL, Config.OPENAI_BASE_URL or ""
+
+
+class AgentPool:
+    """Thread-safe pool keyed by API key, model, factory and factory arguments"""
+
+    def __init__(self, max_idle_per_key: int = 4):
+        self.max_idle_per_key = max_idle_per_key
+        self.created = 0
+        self.reused = 0
+        self._idle: Dict[tuple, list] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(factory: Callable, args: tuple) -> tuple:
+        return (*_credentials_key(), factory.__module__, factory.__qualname__, args)
+
+    def acquire(self, factory: Callable, *args) -> Any:
+        """Take an idle instance for this factory, building one if none is free"""
+        key = self.make_key(factory, args)
+        with self._lock:
+            if self._idle[key]:
+                self.reused += 1
+                return self._idle[key].pop()
+            self.created += 1
+
+        logger.info(f"Building pooled {factory.__qualname__}")
+        return factory(*args)
+
+    def release(self, instance: Any, factory: Callable, *args):
+        """Return an instance so the next run can reuse it"""
+        # Agents remember tool results between tasks; a reused agent starts clean
+        if hasattr(instance, "tools_results"):
+            instance.tools_results = []
+
+        key = self.make_key(factory, args)
+        with self._lock:
+            if len(self._idle[key]) < self.max_idle_per_key:
+                self._idle[key].append(instance)
+
+    @contextmanager
+    def checkout(self, factory: Callable, *args):
+        """Hold an instance exclusively for the duration of one run"""
+        instance = self.acquire(factory, *args)
+        yield instance
+        # Only reached on success: an instance whose run blew up part way through is dropped
+        self.release(instance, factory, *args)
+
+    def clear(self):
+        """Drop every idle instance (e.g. after credentials change)"""
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """How many instances were built versus reused"""
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": sum(len(instances) for instances in self._idle.values())
+            }
+
+
+_pool = AgentPool()
+
+
+def get_agent_pool() -> AgentPool:
+    """Get the process-wide agent pool"""
+    return _pool
@@ -0,0 +1 @@
+# Headless HTTP API for running analyses
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Headless HTTP API for the three analysis modes.
+Analyses run as background jobs; clients submit one, then poll it or follow its
+progress as server-sent events. Nothing here imports Streamlit.
+"""
+
+import asyncio
+import json
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from brand_positioning.config import Config
+from brand_positioning.core.jobs import JobRunner, get_job_runner, COMPLETED, FINISHED_STATUSES
+from brand_positioning.metrics import otlp_payload
+import logging
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_MODES = ("focused", "quick", "full")
+EVENT_POLL_SECONDS = 0.5
+
+
+def _job_summary(job: dict) -> dict:
+    """Job status without the (large) result and partial payloads"""
+    return {key: value for key, value in job.items() if key not in ("result", "partial")}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def create_app(runner: JobRunner = None, max_active_jobs: int = None) -> Starlette:
+    """Build the API application around a job runner (the process-wide one by default)"""
+    max_active_jobs = Config.API_MAX_ACTIVE_JOBS if max_active_jobs is None else max_active_jobs
+    # One submission at a time so the active-job check and the submit can't interleave
+    submit_lock = asyncio.Lock()
+
+    def get_runner() -> JobRunner:
+        return runner or get_job_runner()
+
+    async def health(request: Request):
+        return JSONResponse({"status": "ok"})
+
+    async def submit_analysis(request: Request):
+        try:
+            payload = await request.json()
+        except ValueError:
+            return JSONResponse({"error": "Request body must be JSON"}, status_code=400)
+        if not isinstance(payload, dict):
+            return JSONResponse({"error": "Request body must be a JSON object"}, status_code=400)
+
+        mode = payload.get("mode", "focused")
+        brand_info = payload.get("brand_info") or {}
+        if not isinstance(brand_info, dict):
+            return JSONResponse({"error": "brand_info must be an object"}, status_code=400)
+        if mode not in ANALYSIS_MODES:
+            return JSONResponse({"error": f"mode must be one of {', '.join(ANALYSIS_MODES)}"}, status_code=400)
+        if not str(brand_info.get("brand", "")).strip() or not str(brand_info.get("product", "")).strip():
+            return JSONResponse({"error": "brand_info requires brand and product"}, status_code=400)
+        brand_info.setdefault("target", "general market")
+        max_age_hours = payload.get("max_age_hours")
+        if max_age_hours is not None and (
+                isinstance(max_age_hours, bool) or not isinstance(max_age_hours, (int, float)) or max_age_hours < 0):
+            return JSONResponse({"error": "max_age_hours must be null or a non-negative number"}, status_code=400)
+        refresh = payload.get("refresh", False)
+        if not isinstance(refresh, bool):
+            return JSONResponse({"error": "refresh must be true or false"}, status_code=400)
+
+        async with submit_lock:
+            job_runner = get_runner()
+            if await run_in_threadpool(job_runner.active_count) >= max_active_jobs:
+                return JSONResponse(
+                    {"error": "Too many analyses in progress, retry later"},
+                    status_code=429,
+                    headers={"Retry-After": "30"}
+                )
+            job_id = await run_in_threadpool(
+                job_runner.submit,
+                mode,
+                brand_info,
+                max_age_hours=max_age_hours,
+                refresh=refresh
+            )
+
+        return JSONResponse({"job_id": job_id, "status": "pending"}, status_code=202)
+
+    async def get_analysis(request: Request):
+        job = await run_in_threadpool(get_runner().poll, request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        return JSONResponse(_job_summary(job))
+
+    async def get_result(request: Request):
+        job = await run_in_threadpool(get_runner().poll, request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        if job["status"] != COMPLETED:
+            return JSONResponse(_job_summary(job), status_code=409)
+        return JSONResponse(job["result"])
+
+    async def get_trace(request: Request):
+        job = await run_in_threadpool(get_runner().poll, request.path_params["job_id"])
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        if job["status"] != COMPLETED:
+            return JSONResponse(_job_summary(job), status_code=409)
+        # OTLP/JSON body, ready to POST to a collector's /v1/traces
+        return JSONResponse(otlp_payload(job["result"].get("trace", [])))
+
+    async def cancel_analysis(request: Request):
+        cancelled = await run_in_threadpool(get_runner().cancel, request.path_params["job_id"])
+        if not cancelled:
+            return JSONResponse({"error": "Job not found or already finished"}, status_code=409)
+        return JSONResponse({"job_id": request.path_params["job_id"], "cancelled": True})
+
+    async def analysis_events(request: Request):
+        job_id = request.path_params["job_id"]
+        job_runner = get_runner()
+        if await run_in_threadpool(job_runner.poll, job_id) is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+
+        async def events():
+            last_progress = last_partial = None
+            while True:
+                job = await run_in_threadpool(job_runner.poll, job_id)
+                progress = (job["status"], job["progress"], job["message"])
+                if progress != last_progress:
+                    last_progress = progress
+                    yield _sse("progress", _job_summary(job))
+                if job["partial"] and job["partial"] != last_partial:
+                    last_partial = job["partial"]
+                    yield _sse("partial", job["partial"])
+                if job["status"] in FINISHED_STATUSES:
+                    yield _sse("result" if job["status"] == COMPLETED else "end", job["result"] or _job_summary(job))
+                    return
+                if await request.is_disconnected():
+                    return
+                await asyncio.sleep(EVENT_POLL_SECONDS)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+
+    return Starlette(routes=[
+        Route("/health", health),
+        Route("/analyses", submit_analysis, methods=["POST"]),
+        Route("/analyses/{job_id}", get_analysis),
+        Route("/analyses/{job_id}", cancel_analysis, methods=["DELETE"]),
+        Route("/analyses/{job_id}/result", get_result),
+        Route("/analyses/{job_id}/trace", get_trace),
+        Route("/analyses/{job_id}/events", analysis_events)
+    ])
+
+
+app = create_app()
@@ -0,0 +1 @@
+# Offline benchmark harness with local SerpAPI and LLM stand-ins
\ No newline at end of file
@@ -0,0 +1,210 @@
+"""
+Offline benchmark of the focused, quick and full workflows.
+Runs each workflow end to end against the local stand-ins at several concurrency
+levels and reports latency percentiles, throughput and peak memory.
+"""
+
+import contextlib
+import io
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence
+from brand_positioning.config import Config
+from brand_positioning.benchmark.stand_ins import FakeLLMServer, FakeSerpAPIServer, LatencyDistribution
+import logging
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_MODES = ("focused", "quick", "full")
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """q-th percentile (0-100) with linear interpolation between ranks"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _workflow(mode: str):
+    from brand_positioning.core.focused_workflow import run_focused_positioning_analysis
+    from brand_positioning.core.parallel_crews import run_parallel_analysis_sync, run_parallel_intelligence_sync
+
+    return {
+        "focused": run_focused_positioning_analysis,
+        "quick": run_parallel_intelligence_sync,
+        "full": run_parallel_analysis_sync
+    }[mode]
+
+
+def _reset_shared_clients():
+    """Drop process-wide clients, caches and pools so the next use picks up the current Config"""
+    from brand_positioning import rate_limiter
+    from brand_positioning.agents import llm_cache
+    from brand_positioning.agents.pool import get_agent_pool
+    from brand_positioning.core import result_store
+    from brand_positioning.tools import search_cache, search_client
+
+    with search_client._client_lock:
+        if search_client._client:
+            search_client._client.close()
+        search_client._client = None
+    search_client.close_search_loop()
+    rate_limiter._serp_limiter = rate_limiter._llm_limiter = None
+    search_cache._cache = None
+    llm_cache._cache = None
+    result_store._store = None
+    get_agent_pool().clear()
+
+
+@contextlib.contextmanager
+def stand_in_environment(serp: FakeSerpAPIServer, llm: FakeLLMServer, caches: bool = False):
+    """Point the app at the stand-ins, with caches in a throwaway data directory, and restore afterwards"""
+    overrides = {
+        "SERPAPI_BASE_URL": serp.url,
+        "OPENAI_BASE_URL": f"{llm.url}/v1",
+        "OPENAI_API_KEY": "benchmark-key",
+        "SERP_API_KEY": "benchmark-key",
+        "SEARCH_CACHE_ENABLED": caches,
+        "LLM_CACHE_ENABLED": caches,
+        "RESULT_STORE_ENABLED": False
+    }
+    saved = {name: getattr(Config, name) for name in overrides}
+    saved_env = os.environ.get("OPENAI_API_KEY")
+
+    with tempfile.TemporaryDirectory(prefix="brand-benchmark-") as data_dir:
+        saved["DATA_DIR"] = Config.DATA_DIR
+        overrides["DATA_DIR"] = data_dir
+        for name, value in overrides.items():
+            setattr(Config, name, value)
+        os.environ["OPENAI_API_KEY"] = "benchmark-key"
+        _reset_shared_clients()
+        try:
+            yield
+        finally:
+            for name, value in saved.items():
+                setattr(Config, name, value)
+            if saved_env is None:
+                os.environ.pop("OPENAI_API_KEY", None)
+            else:
+                os.environ["OPENAI_API_KEY"] = saved_env
+            _reset_shared_clients()
+
+
+def run_level(mode: str, concurrency: int, runs: int, serp: FakeSerpAPIServer, llm: FakeLLMServer,
+              caches: bool = False) -> Dict[str, Any]:
+    """Run `runs` analyses of one mode, `concurrency` at a time, and summarize them"""
+    workflow = _workflow(mode)
+    latencies, errors = [], []
+    serp_before, llm_before = serp.requests, llm.requests
+
+    def analyze(i: int):
+        brand_info = {"brand": f"Benchmark Brand {i}", "product": f"project software {i}", "target": "agencies"}
+        started = time.perf_counter()
+        result = workflow(brand_info, llm_cache=caches)
+        elapsed = time.perf_counter() - started
+        if result.get("success"):
+            latencies.append(elapsed)
+        else:
+            errors.append(result.get("error", "Unknown error"))
+
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"bench-{mode}") as executor:
+        list(executor.map(analyze, range(runs)))
+    wall = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "runs": runs,
+        "failures": len(errors),
+        "first_error": errors[0] if errors else None,
+        "p50_seconds": _round(percentile(latencies, 50)),
+        "p95_seconds": _round(percentile(latencies, 95)),
+        "wall_seconds": round(wall, 3),
+        "throughput_per_minute": round(len(latencies) / wall * 60, 2) if wall else 0.0,
+        "peak_traced_mb": round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1),
+        "serp_requests": serp.requests - serp_before,
+        "llm_requests": llm.requests - llm_before
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+def run_benchmark(modes: Sequence[str] = BENCHMARK_MODES, concurrency_levels: Sequence[int] = (1, 4),
+                  runs_per_level: Optional[int] = None, serp_latency: str = "lognormal:0.8:2.0",
+                  llm_latency: str = "lognormal:1.5:4.0", serp_recordings: Optional[Dict[str, Any]] = None,
+                  llm_responses: Optional[List[str]] = None, caches: bool = False, quiet: bool = True,
+                  seed: int = 0) -> Dict[str, Any]:
+    """Benchmark each mode at each concurrency level (runs_per_level defaults to twice the concurrency)"""
+    for mode in modes:
+        if mode not in BENCHMARK_MODES:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+
+    serp = FakeSerpAPIServer(LatencyDistribution.parse(serp_latency), serp_recordings, seed=seed)
+    llm = FakeLLMServer(LatencyDistribution.parse(llm_latency), llm_responses, seed=seed + 1)
+    rows = []
+
+    tracemalloc.start()
+    try:
+        with serp, llm, stand_in_environment(serp, llm, caches):
+            for mode in modes:
+                for concurrency in concurrency_levels:
+                    runs = runs_per_level or concurrency * 2
+                    logger.info(f"Benchmarking {mode} x{concurrency} ({runs} runs)")
+                    # CrewAI's verbose agents print every step; keep the report readable
+                    output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+                    with output:
+                        rows.append(run_level(mode, concurrency, runs, serp, llm, caches))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "settings": {
+            "serp_latency": serp_latency,
+            "llm_latency": llm_latency,
+            "caches": caches,
+            "seed": seed
+        },
+        "rows": rows,
+        # Linux reports kilobytes, macOS bytes
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1
+        )
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Plain-text table of a benchmark report"""
+    columns = [
+        ("mode", "mode"), ("conc", "concurrency"), ("runs", "runs"), ("fail", "failures"),
+        ("p50 s", "p50_seconds"), ("p95 s", "p95_seconds"), ("runs/min", "throughput_per_minute"),
+        ("peak MB", "peak_traced_mb"), ("serp", "serp_requests"), ("llm", "llm_requests")
+    ]
+    table = [[title for title, _ in columns]]
+    for row in report["rows"]:
+        table.append(["-" if row[key] is None else str(row[key]) for _, key in columns])
+    widths = [max(len(line[i]) for line in table) for i in range(len(columns))]
+
+    settings = report["settings"]
+    lines = [
+        f"SerpAPI latency {settings['serp_latency']}, LLM latency {settings['llm_latency']}, "
+        f"caches {'on' if settings['caches'] else 'off'}"
+    ]
+    lines.extend("  ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in table)
+    lines.append(f"Peak RSS: {report['peak_rss_mb']} MB")
+    for row in report["rows"]:
+        if row["first_error"]:
+            lines.append(f"{row['mode']} x{row['concurrency']} first error: {row['first_error']}")
+    return "\n".join(lines)
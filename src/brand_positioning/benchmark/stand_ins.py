@@ -0,0 +1,284 @@
+"""
+Local stand-ins for SerpAPI and an OpenAI-compatible LLM endpoint.
+Both replay recorded responses (or synthesize plausible ones) after a delay drawn
+from a configurable latency distribution, so workflows can run end to end
+without network access or API quota.
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse, parse_qs
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyDistribution:
+    """Response delay model: fixed:<s>, uniform:<low>:<high> or lognormal:<median>:<p95> (seconds)"""
+
+    KINDS = ("fixed", "uniform", "lognormal")
+
+    def __init__(self, kind: str = "fixed", *params: float):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}', expected one of {', '.join(self.KINDS)}")
+        expected = 1 if kind == "fixed" else 2
+        if len(params) != expected:
+            raise ValueError(f"{kind} latency takes {expected} parameter(s), got {len(params)}")
+        if kind == "lognormal" and not 0 < params[0] <= params[1]:
+            raise ValueError("lognormal latency needs 0 < median <= p95")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, *params = spec.split(":")
+        return cls(kind, *(float(p) for p in params))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        median, p95 = self.params
+        # 1.645 standard deviations separate the median from the 95th percentile
+        sigma = (math.log(p95) - math.log(median)) / 1.645
+        return rng.lognormvariate(math.log(median), sigma)
+
+    def __str__(self) -> str:
+        return ":".join([self.kind, *(f"{p:g}" for p in self.params)])
+
+
+class StandInServer:
+    """Threaded local HTTP server in the background; use as a context manager"""
+
+    handler_class = BaseHTTPRequestHandler
+
+    def __init__(self, latency: Optional[LatencyDistribution] = None, seed: int = 0):
+        self.latency = latency or LatencyDistribution("fixed", 0.0)
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def delay(self) -> float:
+        """Count a request and draw its latency"""
+        with self._lock:
+            self.requests += 1
+            return self.latency.sample(self._rng)
+
+    def start(self) -> "StandInServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self.handler_class)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self
+        threading.Thread(target=self._httpd.serve_forever, daemon=True, name=type(self).__name__).start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real APIs
+
+    def send_json(self, payload: Dict[str, Any], status: int = 200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SerpHandler(_JSONHandler):
+    def do_GET(self):
+        stand_in = self.server.stand_in
+        url = urlparse(self.path)
+        if url.path != "/search":
+            self.send_json({"error": f"Unknown path {url.path}"}, status=404)
+            return
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        time.sleep(stand_in.delay())
+        self.send_json(stand_in.response_for(params.get("q", ""), int(params.get("num", 10))))
+
+
+class FakeSerpAPIServer(StandInServer):
+    """SerpAPI stand-in: recorded responses by query, otherwise deterministic synthetic results"""
+
+    handler_class = _SerpHandler
+
+    def __init__(self, latency: Optional[LatencyDistribution] = None, recordings: Optional[Dict[str, Any]] = None,
+                 seed: int = 0):
+        super().__init__(latency, seed)
+        self.recordings = recordings or {}
+
+    def response_for(self, query: str, num: int) -> Dict[str, Any]:
+        if query in self.recordings:
+            return self.recordings[query]
+
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        words = [word for word in re.findall(r"[a-z0-9]+", query.lower()) if len(word) > 2] or ["market"]
+        results = []
+        for i in range(num):
+            topic = words[i % len(words)]
+            share = int(digest[i * 2:i * 2 + 2], 16) % 60 + 5
+            results.append({
+                "position": i + 1,
+                "title": f"{topic.title()} report {digest[:6]}-{i}: what buyers want in {query}",
+                "link": f"https://example-{digest[:8]}.com/{topic}/{i}",
+                "snippet": f"{share}% of {topic} buyers cite pricing and onboarding; "
+                           f"survey of {share * 40} customers published {2020 + i % 5}."
+            })
+        return {"search_metadata": {"status": "Success"}, "organic_results": results}
+
+
+def _tool_specs(prompt: str) -> List[Dict[str, Any]]:
+    """Tool names and argument names from a CrewAI ReAct prompt"""
+    specs = []
+    for name, arguments in re.findall(r"Tool Name: (.+)\nTool Arguments: (\{.*\})", prompt):
+        specs.append({"name": name.strip(), "arguments": re.findall(r"'(\w+)': \{", arguments)})
+    return specs
+
+
+def _brand_field(prompt: str, field: str, default: str) -> str:
+    match = re.search(rf"- {field}: (.+)", prompt)
+    return match.group(1).strip() if match else default
+
+
+class _LLMHandler(_JSONHandler):
+    def do_POST(self):
+        stand_in = self.server.stand_in
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        content = stand_in.completion_for(request.get("messages", []))
+        delay = stand_in.delay()
+        model = request.get("model", "stand-in")
+        usage = {
+            "prompt_tokens": sum(len(str(m.get("content", ""))) for m in request.get("messages", [])) // 4,
+            "completion_tokens": len(content) // 4
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if request.get("stream"):
+            self._stream(model, content, usage, delay)
+        else:
+            time.sleep(delay)
+            self.send_json({
+                "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage
+            })
+
+    def _stream(self, model: str, content: str, usage: Dict[str, int], delay: float):
+        """Server-sent chunks, with the sampled latency spread across them"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        pieces = [content[i:i + 40] for i in range(0, len(content), 40)] or [""]
+        for piece in pieces:
+            time.sleep(delay / len(pieces))
+            self._event({"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                         "choices": [{"index": 0, "delta": {"role": "assistant", "content": piece}, "finish_reason": None}]})
+        self._event({"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                     "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}], "usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _event(self, payload: Dict[str, Any]):
+        self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+
+class FakeLLMServer(StandInServer):
+    """OpenAI-compatible chat completions stand-in that plays a CrewAI agent's ReAct loop.
+
+    Each tool listed in the prompt is called once, then a final answer is given: a recorded
+    response (cycled) when any were supplied, otherwise a synthetic evidence-style report.
+    """
+
+    handler_class = _LLMHandler
+    MAX_ACTIONS = 6
+
+    def __init__(self, latency: Optional[LatencyDistribution] = None, responses: Optional[List[str]] = None,
+                 seed: int = 0):
+        super().__init__(latency, seed)
+        self.responses = list(responses or [])
+        self._answers = 0
+
+    def completion_for(self, messages: List[Dict[str, Any]]) -> str:
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        tools = _tool_specs(prompt)
+        # Only the agent's own turns carry actions; the prompt's format template does not count
+        taken = set()
+        for message in messages:
+            if message.get("role") == "assistant":
+                taken.update(name.strip() for name in re.findall(r"Action: (.+)", str(message.get("content", ""))))
+        pending = [tool for tool in tools if tool["name"] not in taken]
+
+        if pending and len(taken) < self.MAX_ACTIONS:
+            tool = pending[0]
+            brand = _brand_field(prompt, "Brand", "the brand")
+            product = _brand_field(prompt, "Product", "the market")
+            arguments = {name: brand if name == "brand" else product for name in tool["arguments"]}
+            return (
+                f"Thought: I should research this with {tool['name']}.\n"
+                f"Action: {tool['name']}\n"
+                f"Action Input: {json.dumps(arguments)}"
+            )
+
+        return f"Thought: I now know the final answer\nFinal Answer: {self.final_answer(prompt)}"
+
+    def final_answer(self, prompt: str) -> str:
+        with self._lock:
+            self._answers += 1
+            index = self._answers
+        if self.responses:
+            return self.responses[(index - 1) % len(self.responses)]
+
+        brand = _brand_field(prompt, "Brand", "The brand")
+        product = _brand_field(prompt, "Product", "the market")
+        lines = [f"## Findings for {brand}"]
+        for i in range(12):
+            lines.append(
+                f"- Finding {i + 1}: {10 + i * 3}% of {product} buyers report gap #{i + 1} "
+                f"(source: https://example.com/{brand.lower().replace(' ', '-')}/{i})"
+            )
+        lines.append("## Recommendation")
+        lines.append(f"- {brand} should own the underserved segment with the highest unmet need.")
+        return "\n".join(lines)
@@ -0,0 +1,173 @@
+"""
+Record/replay cassette for outbound SerpAPI and LLM traffic.
+In record mode every search response and completion is captured under the same
+content keys the caches use; in replay mode they are served back from the file
+with no network, rate limiting or caching, so a full analysis replays in
+milliseconds and only our own orchestration time is left to measure.
+"""
+
+import atexit
+import contextlib
+import gzip
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from brand_positioning.agents.llm_cache import LLMCache
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+CASSETTE_MODES = (RECORD, REPLAY)
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """A replayed run made a request that was never recorded"""
+
+
+class Cassette:
+    """Recorded responses by request key, replayed in recording order for repeated keys"""
+
+    def __init__(self, path: str, mode: str):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {', '.join(CASSETTE_MODES)}")
+        self.path = path
+        self.mode = mode
+        self.searches: Dict[str, List[Dict[str, Any]]] = {}
+        self.completions: Dict[str, List[str]] = {}
+        self.turns: Dict[str, List[str]] = {}
+        self._played: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def load(self):
+        """Read the cassette file; a missing file is an error in replay mode"""
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {data.get('version')} in {self.path}")
+        self.searches = data.get("searches", {})
+        self.completions = data.get("completions", {})
+        self.turns = data.get("turns", {})
+        logger.info(f"Loaded cassette {self.path}: {self.stats()}")
+
+    def save(self):
+        """Write everything recorded so far (gzip-compressed when the path ends in .gz)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "searches": self.searches,
+                "completions": self.completions,
+                "turns": self.turns
+            }
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        logger.info(f"Saved cassette {self.path}: {self.stats()}")
+
+    def record_search(self, key: str, response: Dict[str, Any]):
+        with self._lock:
+            self.searches.setdefault(key, []).append(response)
+
+    @staticmethod
+    def completion_keys(model: str, temperature: Optional[float], messages) -> Tuple[str, str]:
+        """Exact prompt key, and a fallback key for the same turn of the same task.
+
+        Agents shared by concurrent crews see timing-dependent observations (CrewAI's
+        repeated-input guard), so a replayed conversation can drift from the recorded one.
+        """
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        task = LLMCache.make_key(model, temperature, messages[:2])
+        return LLMCache.make_key(model, temperature, messages), f"{task}:{len(messages)}"
+
+    def record_completion(self, model: str, temperature: Optional[float], messages, response: str):
+        exact, turn = self.completion_keys(model, temperature, messages)
+        with self._lock:
+            self.completions.setdefault(exact, []).append(response)
+            self.turns.setdefault(turn, []).append(response)
+
+    def replay_search(self, key: str, query: str = "") -> Dict[str, Any]:
+        """Recorded SerpAPI response, or an error result like any failed search"""
+        response = self._next("search", key, self.searches)
+        if response is None:
+            logger.warning(f"No recorded search for '{query}'")
+            return {"error": f"No recorded SerpAPI response for '{query}' in {self.path}"}
+        return response
+
+    def replay_completion(self, model: str, temperature: Optional[float], messages) -> str:
+        exact, turn = self.completion_keys(model, temperature, messages)
+        response = self._next("completion", exact, self.completions)
+        if response is None:
+            response = self._next("turn", turn, self.turns)
+        if response is None:
+            raise CassetteMiss(f"No recorded completion for prompt {exact[:12]} in {self.path}")
+        return response
+
+    def _next(self, kind: str, key: str, recorded: Dict[str, list]):
+        """Responses for a repeated key come back in recording order; the last one repeats"""
+        with self._lock:
+            responses = recorded.get(key)
+            if not responses:
+                return None
+            index = self._played.get(f"{kind}:{key}", 0)
+            self._played[f"{kind}:{key}"] = index + 1
+            return responses[min(index, len(responses) - 1)]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "searches": sum(len(responses) for responses in self.searches.values()),
+            "completions": sum(len(responses) for responses in self.completions.values())
+        }
+
+
+_active: Optional[Cassette] = None
+_active_lock = threading.Lock()
+_configured = False
+
+
+def get_cassette() -> Optional[Cassette]:
+    """The cassette in use, opened from CASSETTE_MODE/CASSETTE_PATH on first call (None when off)"""
+    global _active, _configured
+    with _active_lock:
+        if not _configured:
+            _configured = True
+            if _active is None and Config.CASSETTE_MODE in CASSETTE_MODES:
+                path = Config.CASSETTE_PATH or os.path.join(Config.DATA_DIR, "cassette.json.gz")
+                _active = Cassette(path, Config.CASSETTE_MODE)
+                if _active.mode == RECORD:
+                    atexit.register(_active.save)
+        return _active
+
+
+@contextlib.contextmanager
+def use_cassette(path: str, mode: str):
+    """Record or replay every search and completion in the process while the block runs"""
+    global _active, _configured
+    cassette = Cassette(path, mode)
+    with _active_lock:
+        previous, was_configured = _active, _configured
+        _active, _configured = cassette, True
+    try:
+        yield cassette
+    finally:
+        with _active_lock:
+            _active, _configured = previous, was_configured
+        if mode == RECORD:
+            cassette.save()
@@ -21,6 +21,7 @@ class Config:
     
     # LLM Configuration
     OPENAI_MODEL = "gpt-4o"
+    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")  # Any OpenAI-compatible endpoint; None means OpenAI itself
     CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
     
     # Search Configuration for Full Analysis
@@ -48,8 +49,100 @@ class Config:
                 "total_serp_calls": 9          # Total: 3+3+3 = 9 calls for full analysis
             }
     
-    # Rate Limiting
-    REQUESTS_PER_MINUTE = 60
+    # Rate Limiting (process-wide budgets shared by all crews; 0 = unlimited)
+    REQUESTS_PER_MINUTE = int(os.getenv("REQUESTS_PER_MINUTE", "60"))
+    LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "300"))
+    
+    # Concurrent searches issued per tool call (bounded worker pool)
+    SEARCH_MAX_WORKERS = int(os.getenv("SEARCH_MAX_WORKERS", "4"))
+    
+    # SerpAPI HTTP client (point SERPAPI_BASE_URL at a local stand-in for testing)
+    SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL", "https://serpapi.com")
+    SEARCH_POOL_SIZE = int(os.getenv("SEARCH_POOL_SIZE", "10"))
+    SEARCH_TIMEOUT_SECONDS = float(os.getenv("SEARCH_TIMEOUT_SECONDS", "30"))
+    SEARCH_MAX_RETRIES = int(os.getenv("SEARCH_MAX_RETRIES", "2"))
+    
+    # Use asyncio tool variants (every crew's searches run on one shared event loop and keep-alive
+    # client instead of worker threads)
+    ASYNC_SEARCH_TOOLS = os.getenv("ASYNC_SEARCH_TOOLS", "false").lower() == "true"
+    
+    # Fire every templated query as soon as an analysis starts (tools read the warm results)
+    PREFETCH_SEARCHES = os.getenv("PREFETCH_SEARCHES", "false").lower() == "true"
+    
+    # Local storage for caches and persisted state
+    DATA_DIR = os.getenv("DATA_DIR", ".data")
+    
+    # SerpAPI response cache (repeat analyses skip the network entirely)
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL_HOURS = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "24"))
+    SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000"))
+    
+    # LLM completion cache (exact match on model, temperature and prompt)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+    
+    # Token budget for the intelligence embedded in the positioning strategy prompt
+    INTELLIGENCE_TOKEN_BUDGET = int(os.getenv("INTELLIGENCE_TOKEN_BUDGET", "6000"))
+    
+    # Background analysis jobs running concurrently per server process
+    JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "4"))
+    # Finished jobs are deleted from the job table after this many hours (0 keeps every job)
+    JOB_RETENTION_HOURS = float(os.getenv("JOB_RETENTION_HOURS", "168"))
+    
+    # Where jobs and batch brands run: "thread" (in this process) or "process" (pre-started worker
+    # processes, so analyses use every core); workers split the SerpAPI and LLM rate limits
+    ANALYSIS_EXECUTOR = os.getenv("ANALYSIS_EXECUTOR", "thread").lower()
+    PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", "0"))  # 0 = one per CPU core
+    
+    # Headless HTTP API (run_api.py)
+    API_HOST = os.getenv("API_HOST", "127.0.0.1")
+    API_PORT = int(os.getenv("API_PORT", "8000"))
+    API_MAX_ACTIVE_JOBS = int(os.getenv("API_MAX_ACTIVE_JOBS", "20"))
+    
+    # Brands analyzed concurrently by the batch runner (run_batch.py)
+    BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
+    
+    # Completed analyses are stored and served again while younger than RESULT_MAX_AGE_HOURS
+    RESULT_STORE_ENABLED = os.getenv("RESULT_STORE_ENABLED", "true").lower() == "true"
+    RESULT_MAX_AGE_HOURS = float(os.getenv("RESULT_MAX_AGE_HOURS", "24"))
+    
+    # Price of one SerpAPI search, used for the measured cost in each result's metrics
+    SERPAPI_COST_PER_SEARCH = float(os.getenv("SERPAPI_COST_PER_SEARCH", "0.015"))
+    
+    # Incremental full analyses reuse stored domain results while their searches are unchanged and within TTL
+    INCREMENTAL_ANALYSIS = os.getenv("INCREMENTAL_ANALYSIS", "false").lower() == "true"
+    DOMAIN_TTL_HOURS = {
+        "competitor_analysis": float(os.getenv("COMPETITOR_TTL_HOURS", "168")),
+        "customer_insights": float(os.getenv("CUSTOMER_TTL_HOURS", "168")),
+        "market_trends": float(os.getenv("TRENDS_TTL_HOURS", "24"))
+    }
+    
+    # Deadlines for the parallel intelligence crews (0 disables a deadline)
+    # STRAGGLER_POLICY decides what happens to a crew still running at CREW_DEADLINE_SECONDS:
+    # wait for it, proceed with partial intelligence, or hedge by relaunching it
+    STRAGGLER_POLICY = os.getenv("STRAGGLER_POLICY", "wait").lower()  # wait, partial or hedge
+    CREW_DEADLINE_SECONDS = float(os.getenv("CREW_DEADLINE_SECONDS", "240"))
+    INTELLIGENCE_DEADLINE_SECONDS = float(os.getenv("INTELLIGENCE_DEADLINE_SECONDS", "600"))
+    
+    # Run the intelligence tools directly (queries are templated) and summarize each domain in one
+    # LLM call, instead of letting a ReAct crew decide when to call them
+    DIRECT_INTELLIGENCE = os.getenv("DIRECT_INTELLIGENCE", "false").lower() == "true"
+    # With ASYNC_SEARCH_TOOLS, direct runs are coroutines on the shared search loop; only their
+    # summary calls take a thread, from a pool of this size shared by every analysis
+    DIRECT_SUMMARY_THREADS = int(os.getenv("DIRECT_SUMMARY_THREADS", "8"))
+    
+    # Focused analyses gather their research once and attach it to both tasks, which then run
+    # without tools instead of each searching again
+    SHARED_FOCUSED_RESEARCH = os.getenv("SHARED_FOCUSED_RESEARCH", "false").lower() == "true"
+    
+    # Full analyses digest each intelligence domain for positioning as soon as its crew finishes,
+    # then merge the digests into the strategy instead of waiting for all three crews
+    PROGRESSIVE_POSITIONING = os.getenv("PROGRESSIVE_POSITIONING", "false").lower() == "true"
+    
+    # Record every SerpAPI response and LLM completion to a cassette file, or replay one offline
+    CASSETTE_MODE = os.getenv("CASSETTE_MODE", "off").lower()  # off, record or replay
+    CASSETTE_PATH = os.getenv("CASSETTE_PATH")  # Defaults to DATA_DIR/cassette.json.gz
     
     @classmethod
     def get_mode_info(cls):
@@ -0,0 +1,162 @@
+"""
+Batch analysis of many brands from a CSV or JSONL file.
+Brands are scheduled across a worker pool that shares the process-wide search
+and LLM caches and rate limits. Each result is appended to a JSONL file as soon
+as it finishes, so an interrupted batch resumes where it left off.
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Set
+from brand_positioning.config import Config
+from brand_positioning.core.result_store import fingerprint
+from brand_positioning.core.process_pool import PROCESS, executor_backend, get_process_pool
+import logging
+
+logger = logging.getLogger(__name__)
+
+BATCH_MODES = ("focused", "quick", "full")
+
+
+def load_brands(path: str) -> List[Dict[str, str]]:
+    """Read brand_info dicts from a CSV (brand, product, target columns) or JSONL file"""
+    brands = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+
+        for row in rows:
+            brand_info = {
+                "brand": (row.get("brand") or "").strip(),
+                "product": (row.get("product") or "").strip(),
+                "target": (row.get("target") or "").strip() or "general market"
+            }
+            if brand_info["brand"] and brand_info["product"]:
+                brands.append(brand_info)
+            else:
+                logger.warning(f"Skipping row without brand and product: {row}")
+    return brands
+
+
+def completed_keys(output_path: str) -> Set[str]:
+    """Keys of brands that already have a successful result in the output file"""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # A line cut short by a crash
+            if record.get("success"):
+                done.add(record["key"])
+    return done
+
+
+def _workflow(mode: str):
+    from brand_positioning.core.focused_workflow import run_focused_positioning_analysis
+    from brand_positioning.core.parallel_crews import run_parallel_analysis_sync, run_parallel_intelligence_sync
+
+    if mode == "focused":
+        return run_focused_positioning_analysis
+    if mode == "quick":
+        return run_parallel_intelligence_sync
+    return run_parallel_analysis_sync
+
+
+def _run_engine(brand_info: dict, mode: str, llm_cache: Optional[bool]) -> Dict[str, Any]:
+    return _workflow(mode)(brand_info, llm_cache=llm_cache)
+
+
+def run_batch(brands: List[Dict[str, str]], output_path: str, mode: str = "focused",
+              max_workers: int = None, llm_cache: Optional[bool] = None,
+              executor: Optional[str] = None) -> Dict[str, Any]:
+    """Analyze every brand not already completed in output_path, appending results as they finish
+    
+    executor ("thread" or "process", default ANALYSIS_EXECUTOR) decides where each brand's analysis runs.
+    """
+    if mode not in BATCH_MODES:
+        raise ValueError(f"Unknown analysis mode: {mode}")
+    max_workers = max_workers or Config.BATCH_MAX_WORKERS
+    process_pool = get_process_pool() if (executor or executor_backend()) == PROCESS else None
+
+    done = completed_keys(output_path)
+    pending, seen = [], set(done)
+    for brand_info in brands:
+        key = fingerprint(brand_info, mode)
+        if key not in seen:
+            seen.add(key)
+            pending.append((key, brand_info))
+
+    summary = {
+        "total": len(brands),
+        "skipped": len(brands) - len(pending),
+        "completed": 0,
+        "failed": 0
+    }
+    logger.info(f"Batch: {len(pending)} brands to analyze, {summary['skipped']} already done or duplicated")
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # A crash mid-write leaves an unterminated line; start new records on a line of their own
+    if os.path.exists(output_path) and os.path.getsize(output_path):
+        with open(output_path, "rb+") as out:
+            out.seek(-1, os.SEEK_END)
+            if out.read(1) != b"\n":
+                out.write(b"\n")
+
+    started = time.time()
+    write_lock = threading.Lock()
+
+    def analyze(key: str, brand_info: dict) -> bool:
+        analysis_start = time.time()
+        try:
+            if process_pool:
+                result = process_pool.run(_workflow(mode), brand_info, llm_cache=llm_cache)
+            else:
+                result = _run_engine(brand_info, mode, llm_cache)
+        except Exception as e:
+            logger.error(f"Batch analysis of {brand_info['brand']} failed: {e}")
+            result = {"success": False, "error": str(e), "brand_info": brand_info}
+
+        record = {
+            "key": key,
+            "mode": mode,
+            "brand_info": brand_info,
+            "success": bool(result.get("success")),
+            "elapsed_seconds": round(time.time() - analysis_start, 2),
+            "finished_at": time.time(),
+            "result": result
+        }
+        # One complete line per brand, flushed to disk before the next is written
+        with write_lock:
+            with open(output_path, "a", encoding="utf-8") as out:
+                out.write(json.dumps(record, default=str) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+        return record["success"]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch") as pool:
+        futures = {pool.submit(analyze, key, brand_info): brand_info for key, brand_info in pending}
+        for future in as_completed(futures):
+            if future.result():
+                summary["completed"] += 1
+            else:
+                summary["failed"] += 1
+            logger.info(
+                f"Batch progress: {summary['completed'] + summary['failed']}/{len(pending)} "
+                f"({futures[future]['brand']})"
+            )
+
+    summary["elapsed_seconds"] = round(time.time() - started, 2)
+    return summary
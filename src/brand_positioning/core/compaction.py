@@ -0,0 +1,122 @@
+"""
+Token-budgeted compaction of market intelligence.
+The positioning strategy prompt embeds all three intelligence results; when they
+exceed the budget, duplicate passages are dropped and the most evidence-dense
+passages of each domain are kept, in their original order.
+"""
+
+import math
+import re
+from typing import Dict, List, Any, Tuple
+from brand_positioning.agents.llm_cache import count_tokens
+from brand_positioning.config import Config
+from brand_positioning.tools.evidence_index import EvidenceIndex
+import logging
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = re.compile(r"\$?\d[\d,.]*\s*(%|percent|[kmb]n?\b|million|billion)?", re.IGNORECASE)
+_QUOTE = re.compile(r"[\"“][^\"”]{8,}[\"”]")
+_URL = re.compile(r"https?://\S+")
+_ENTITY = re.compile(r"\b[A-Z][a-zA-Z0-9]+(?:\s[A-Z][a-zA-Z0-9]+)*")
+
+
+def _is_heading(line: str) -> bool:
+    stripped = line.strip().strip("*")
+    return line.lstrip().startswith("#") or (stripped.endswith(":") and len(stripped.split()) <= 8)
+
+
+def evidence_score(passage: str, tokens: int) -> float:
+    """Evidence per token: figures, quotes, sources and named entities score; filler doesn't"""
+    evidence = (
+        len(_NUMBER.findall(passage))
+        + 2 * len(_QUOTE.findall(passage))
+        + 2 * len(_URL.findall(passage))
+        + 0.5 * len(_ENTITY.findall(passage))
+    )
+    return evidence / math.sqrt(max(tokens, 1))
+
+
+def _passages(text: str) -> List[Dict[str, Any]]:
+    """Split a domain result into lines, attaching each to the heading above it"""
+    passages = []
+    heading = None
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if _is_heading(line):
+            heading = {"text": line, "heading": True, "used": False}
+            passages.append(heading)
+        else:
+            passages.append({"text": line, "heading": False, "parent": heading})
+    return passages
+
+
+def compact_intelligence(intelligence_data: Dict[str, str], budget_tokens: int = None,
+                         model: str = None) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """Fit intelligence results into a token budget; returns (compacted results, stats)"""
+    budget_tokens = Config.INTELLIGENCE_TOKEN_BUDGET if budget_tokens is None else budget_tokens
+    model = model or Config.OPENAI_MODEL
+
+    domains = {name: str(text or "") for name, text in intelligence_data.items()}
+    original_tokens = {name: count_tokens(model, text=text) for name, text in domains.items()}
+    total = sum(original_tokens.values())
+    stats = {
+        "compacted": False,
+        "budget_tokens": budget_tokens,
+        "original_tokens": total,
+        "compacted_tokens": total,
+        "duplicates_removed": 0,
+        "passages_dropped": 0
+    }
+
+    if total <= budget_tokens:
+        return dict(domains), stats
+
+    # Passages repeated across domains are kept once, where they first appear
+    index = EvidenceIndex(similarity_threshold=0.8)
+    candidates = {}
+    for name, text in domains.items():
+        candidates[name] = []
+        for passage in _passages(text):
+            passage["tokens"] = count_tokens(model, text=passage["text"]) + 1  # plus the joining newline
+            if not passage["heading"]:
+                _, is_new = index.add({"snippet": passage["text"]}, name)
+                if not is_new:
+                    stats["duplicates_removed"] += 1
+                    continue
+                passage["score"] = evidence_score(passage["text"], passage["tokens"])
+            candidates[name].append(passage)
+
+    # Smallest domains first so their unused share flows to the larger ones
+    compacted = {}
+    remaining_budget = budget_tokens
+    ordered = sorted(domains, key=lambda name: original_tokens[name])
+    for position, name in enumerate(ordered):
+        share = remaining_budget // (len(ordered) - position)
+        body = [p for p in candidates[name] if not p["heading"]]
+        kept, used = set(), 0
+        for passage in sorted(body, key=lambda p: p["score"], reverse=True):
+            parent = passage["parent"]
+            cost = passage["tokens"] + (parent["tokens"] if parent and not parent["used"] else 0)
+            if used + cost <= share:
+                kept.add(id(passage))
+                used += cost
+                if parent is not None:
+                    parent["used"] = True
+        stats["passages_dropped"] += len(body) - len(kept)
+        remaining_budget -= used
+
+        lines = [
+            p["text"] for p in candidates[name]
+            if (p["heading"] and p["used"]) or id(p) in kept
+        ]
+        compacted[name] = "\n".join(lines)
+
+    stats["compacted"] = True
+    stats["compacted_tokens"] = sum(count_tokens(model, text=text) for text in compacted.values())
+    logger.info(
+        f"Compacted intelligence from {total} to {stats['compacted_tokens']} tokens "
+        f"(budget {budget_tokens})"
+    )
+    return {name: compacted[name] for name in domains}, stats
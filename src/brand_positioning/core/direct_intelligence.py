@@ -0,0 +1,113 @@
+"""
+Direct-tools intelligence: every query is templated from brand_info, so there is
+no need for the ReAct loop to decide when and how to call the research tools.
+Each domain runs its tool programmatically and then makes a single summarization
+call, instead of one LLM round trip per reasoning and tool step.
+With async tools a run is a coroutine on the shared search loop rather than a thread
+of its own: only its summarization call borrows a thread from a process-wide pool.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from brand_positioning.config import Config
+from brand_positioning.core.incremental import DOMAIN_TOOLS
+from brand_positioning.core.parallel_tasks import (
+    create_competitor_analysis_task,
+    create_customer_insights_task,
+    create_market_trends_task
+)
+from brand_positioning.tools.async_tools import (
+    AsyncCompetitorResearchTool,
+    AsyncCustomerInsightTool,
+    AsyncMarketTrendTool
+)
+from brand_positioning.tools.evidence_index import EvidenceIndex
+import logging
+
+logger = logging.getLogger(__name__)
+
+DOMAIN_TASKS = {
+    "competitor_analysis": create_competitor_analysis_task,
+    "customer_insights": create_customer_insights_task,
+    "market_trends": create_market_trends_task
+}
+
+ASYNC_DOMAIN_TOOLS = {
+    "competitor_analysis": AsyncCompetitorResearchTool,
+    "customer_insights": AsyncCustomerInsightTool,
+    "market_trends": AsyncMarketTrendTool
+}
+
+_summary_executor: Optional[ThreadPoolExecutor] = None
+_summary_executor_lock = threading.Lock()
+
+
+def get_summary_executor() -> ThreadPoolExecutor:
+    """Process-wide threads (DIRECT_SUMMARY_THREADS) for the blocking summary calls of async runs"""
+    global _summary_executor
+    with _summary_executor_lock:
+        if _summary_executor is None:
+            _summary_executor = ThreadPoolExecutor(
+                max_workers=Config.DIRECT_SUMMARY_THREADS, thread_name_prefix="direct-summary"
+            )
+        return _summary_executor
+
+
+def summary_messages(agent, task, tool_name: str, evidence: str) -> List[Dict[str, str]]:
+    """The domain task as one chat prompt, with the tool's results already attached"""
+    system = f"You are {agent.role}. {agent.backstory}\nYour personal goal is: {agent.goal}"
+    user = (
+        f"{task.description.strip()}\n\n"
+        f"The {tool_name} tool has already been run for you. Its results:\n{evidence}\n\n"
+        f"This is the expected criteria for your answer:\n{task.expected_output.strip()}\n\n"
+        "Base every finding on these results and return only the complete report."
+    )
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+class DirectDomainRun:
+    """Stands in for one domain's crew: runs its research tool directly, then summarizes in one LLM call"""
+
+    def __init__(self, domain: str, brand_info: dict, agent, evidence_index: EvidenceIndex = None,
+                 async_tools: bool = False):
+        self.domain = domain
+        self.brand_info = brand_info
+        self.agent = agent
+        # Run through kickoff_async() on the shared search loop instead of kickoff() on a thread
+        self.async_tools = async_tools
+        # The summary call only sees this run's evidence, so its IDs must not be shared with other domains
+        self.evidence_index = evidence_index or EvidenceIndex()
+
+    def kickoff(self) -> str:
+        tool = DOMAIN_TOOLS[self.domain](evidence_index=self.evidence_index)
+        evidence = tool._run(self.brand_info.get("product", ""))
+        return self._error(evidence) or self.agent.llm.call(self._summary_messages(tool, evidence))
+
+    async def kickoff_async(self) -> str:
+        """kickoff() without blocking its event loop: the searches are awaited and the summary call
+        runs on the summary thread pool"""
+        tool = ASYNC_DOMAIN_TOOLS[self.domain](evidence_index=self.evidence_index)
+        evidence = await tool._run(self.brand_info.get("product", ""))
+        error = self._error(evidence)
+        if error:
+            return error
+
+        messages = self._summary_messages(tool, evidence)
+        return await asyncio.get_running_loop().run_in_executor(get_summary_executor(), self.agent.llm.call, messages)
+
+    @staticmethod
+    def _error(evidence: str) -> Optional[str]:
+        """The run's output when the searches failed (nothing to summarize), else None"""
+        try:
+            error = json.loads(evidence).get("error")
+        except (ValueError, AttributeError):
+            error = None
+        return f"Error: {error}" if error else None
+
+    def _summary_messages(self, tool, evidence: str) -> List[Dict[str, str]]:
+        task = DOMAIN_TASKS[self.domain](self.brand_info)
+        logger.info(f"Summarizing {self.domain} in one call")
+        return summary_messages(self.agent, task, tool.name, evidence)
@@ -6,7 +6,14 @@ Focused tasks that deliver exactly what founders need:
 
 from crewai import Task
 
-def create_niche_positioning_task(brand_info: dict, agent):
+def research_section(research: str) -> str:
+    """Research gathered before the task runs, attached in place of tool calls"""
+    return f"""
+        RESEARCH (already gathered for you - do NOT search again, base every finding on it):
+        {research}
+        """
+
+def create_niche_positioning_task(brand_info: dict, agent, research=None):
     """
     Task to find the specific niche the brand should dominate.
     Output: Clear positioning angle for category leadership.
@@ -15,6 +22,13 @@ def create_niche_positioning_task(brand_info: dict, agent):
     product = brand_info.get("product", "")
     target = brand_info.get("target", "")
     
+    steps = f"""
+        STEP 1: Use the Competitor Gap Research tool with parameters: {{"brand": "{brand_name}", "product": "{product}"}}
+        STEP 2: Use the Positioning Opportunity Finder tool with parameters: {{"brand": "{brand_name}", "product": "{product}"}}
+        """
+    if research:
+        steps = research_section(research)
+    
     return Task(
         description=f"""
         Find the EXACT niche that {brand_name} should dominate for category leadership.
@@ -23,9 +37,7 @@ def create_niche_positioning_task(brand_info: dict, agent):
         - Brand: {brand_name}
         - Product: {product}  
         - Target: {target}
-        
-        STEP 1: Use the Competitor Gap Research tool with parameters: {{"brand": "{brand_name}", "product": "{product}"}}
-        STEP 2: Use the Positioning Opportunity Finder tool with parameters: {{"brand": "{brand_name}", "product": "{product}"}}
+        {steps}
         
         CRITICAL: Research the ACTUAL brand first. What do they currently claim? Who are their real competitors?
         Your job: Find a MORE SPECIFIC sub-category than what they currently claim.
@@ -66,7 +78,7 @@ def create_niche_positioning_task(brand_info: dict, agent):
         async_execution=False
     )
 
-def create_strategic_move_task(brand_info: dict, agent, positioning_context=None):
+def create_strategic_move_task(brand_info: dict, agent, positioning_context=None, research=None):
     """
     Task to identify ONE smart strategic move for positioning advantage.
     Output: Concrete next action the brand should take.
@@ -76,6 +88,8 @@ def create_strategic_move_task(brand_info: dict, agent, positioning_context=None
     context = ""
     if positioning_context:
         context = f"\n\nPOSITIONING CONTEXT:\n{positioning_context}\n"
+    if research:
+        context += research_section(research)
     
     return Task(
         description=f"""
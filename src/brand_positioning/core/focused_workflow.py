@@ -7,27 +7,66 @@ from crewai import Crew
 from brand_positioning.agents.focused_agents import create_positioning_specialist_agent
 from brand_positioning.core.focused_tasks import create_niche_positioning_task, create_strategic_move_task
 from brand_positioning.config import Config
+from brand_positioning.agents.llm_cache import LLMCacheSession, bind_llm_cache_session
+from brand_positioning.agents.pool import get_agent_pool
+from brand_positioning.metrics import KICKOFF, STAGE, MetricsRecorder, activate, bind_metrics
+from brand_positioning.core.prefetch import start_focused_prefetch
+from brand_positioning.tools.focused_tools import gather_focused_research
 import logging
 
 logger = logging.getLogger(__name__)
 
-def run_focused_positioning_analysis(brand_info: dict, status_callback=None):
+def run_focused_positioning_analysis(brand_info: dict, status_callback=None, prefetch=None, llm_cache=None,
+                                     shared_research=None):
     """
     Run focused brand positioning analysis with minimal API usage.
+    shared_research=True gathers the research once up front and attaches it to both tasks,
+    which then run on a tool-less agent (no repeated searches or tool iterations).
     Returns: {niche_positioning, strategic_move, success}
     """
+    recorder = MetricsRecorder()
+    if shared_research is None:
+        shared_research = Config.SHARED_FOCUSED_RESEARCH
+    
+    # Fire the templated searches now so they overlap agent setup and the first LLM turn
+    # (shared research issues the same searches itself straight away)
+    if prefetch is None:
+        prefetch = Config.PREFETCH_SEARCHES and not shared_research
+    with activate(recorder):
+        prefetcher = start_focused_prefetch(brand_info) if prefetch else None
+    
+    # llm_cache=False bypasses cached completions for this run only
+    if llm_cache is None:
+        llm_cache = Config.LLM_CACHE_ENABLED
+    cache_session = LLMCacheSession(llm_cache)
+    
     try:
         if status_callback:
             status_callback("Creating positioning specialist agent...", 10)
         
-        # Single focused agent
-        positioning_agent = create_positioning_specialist_agent()
+        # Single focused agent, checked out of the process-wide pool
+        # (without tools when the research is attached to the tasks instead)
+        pool = get_agent_pool()
+        agent_args = (Config.ASYNC_SEARCH_TOOLS, not shared_research)
+        positioning_agent = pool.acquire(create_positioning_specialist_agent, *agent_args)
+        bind_llm_cache_session([positioning_agent], cache_session)
+        bind_metrics([positioning_agent], recorder)
+        
+        research = None
+        if shared_research:
+            if status_callback:
+                status_callback("Researching the brand and its competitors...", 20)
+            
+            with recorder.span(STAGE, "research"):
+                research = gather_focused_research(
+                    brand_info.get("brand", ""), brand_info.get("product", ""), metrics=recorder
+                )
         
         if status_callback:
             status_callback("Finding your specific niche to dominate...", 30)
         
         # Task 1: Find specific niche positioning  
-        positioning_task = create_niche_positioning_task(brand_info, positioning_agent)
+        positioning_task = create_niche_positioning_task(brand_info, positioning_agent, research)
         
         # Run positioning analysis
         positioning_crew = Crew(
@@ -36,13 +75,14 @@ def run_focused_positioning_analysis(brand_info: dict, status_callback=None):
             verbose=True
         )
         
-        positioning_result = positioning_crew.kickoff()
+        with recorder.span(STAGE, "niche_positioning"), recorder.span(KICKOFF, "niche_positioning"):
+            positioning_result = positioning_crew.kickoff()
         
         if status_callback:
             status_callback("Identifying your smart strategic move...", 70)
         
         # Task 2: Find strategic move based on positioning
-        strategic_task = create_strategic_move_task(brand_info, positioning_agent, positioning_result.raw)
+        strategic_task = create_strategic_move_task(brand_info, positioning_agent, positioning_result.raw, research)
         
         # Run strategic move analysis
         strategic_crew = Crew(
@@ -51,18 +91,25 @@ def run_focused_positioning_analysis(brand_info: dict, status_callback=None):
             verbose=True
         )
         
-        strategic_result = strategic_crew.kickoff()
+        with recorder.span(STAGE, "strategic_move"), recorder.span(KICKOFF, "strategic_move"):
+            strategic_result = strategic_crew.kickoff()
+        pool.release(positioning_agent, create_positioning_specialist_agent, *agent_args)
         
         if status_callback:
             status_callback("Analysis complete!", 100)
         
+        metrics = recorder.summary()
         return {
             "success": True,
             "brand_info": brand_info,
             "niche_positioning": positioning_result.raw,
             "strategic_move": strategic_result.raw,
-            "api_calls_used": 4,  # Only 4 SerpAPI calls total
-            "cost_estimate": "$0.20"  # Much lower cost
+            "shared_research": shared_research,
+            "api_calls_used": metrics["serp"]["calls"],  # Measured SerpAPI requests (cache hits are free)
+            "cost_estimate": f"${metrics['cost_usd']['total']:.2f}",
+            "llm_cache": cache_session.stats(),
+            "metrics": metrics,
+            "trace": recorder.export_spans()
         }
         
     except Exception as e:
@@ -73,5 +120,10 @@ def run_focused_positioning_analysis(brand_info: dict, status_callback=None):
         return {
             "success": False,
             "error": str(e),
-            "brand_info": brand_info
-        }
\ No newline at end of file
+            "brand_info": brand_info,
+            "metrics": recorder.summary()
+        }
+    
+    finally:
+        if prefetcher:
+            prefetcher.close()
\ No newline at end of file
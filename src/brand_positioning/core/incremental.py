@@ -0,0 +1,75 @@
+"""
+Incremental re-analysis for the full workflow.
+Each intelligence domain is fingerprinted by the search results it is built from.
+A stored domain result is reused while that evidence hash is unchanged and the
+result is younger than the domain's TTL; positioning and actions are reused while
+their inputs hash the same as last time.
+"""
+
+import hashlib
+import json
+from typing import Dict, Any, List, Optional
+from brand_positioning.tools import tools
+from brand_positioning.tools.evidence_index import canonical_url
+from brand_positioning.tools.search_client import search_many_async
+import logging
+
+logger = logging.getLogger(__name__)
+
+REUSED = "reused"
+REFRESHED = "refreshed"
+
+DOMAIN_TOOLS = {
+    "competitor_analysis": tools.CompetitorResearchTool,
+    "customer_insights": tools.CustomerInsightTool,
+    "market_trends": tools.MarketTrendTool
+}
+
+
+def content_hash(value: Any) -> str:
+    """Stable hash of any JSON-serializable stage input"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def domain_search_params(brand_info: dict) -> Dict[str, List[Dict[str, Any]]]:
+    """The searches behind each intelligence domain, keyed by domain"""
+    query = brand_info.get("product", "")
+    return {domain: tools.search_params(tool().build_queries(query)) for domain, tool in DOMAIN_TOOLS.items()}
+
+
+def evidence_hash(batch_results: List[Dict[str, Any]]) -> Optional[str]:
+    """Hash of the organic results a domain is built from, or None if any of its searches failed"""
+    evidence = []
+    for results in batch_results:
+        if "error" in results:
+            return None
+        for result in results.get("organic_results", []):
+            evidence.append([canonical_url(result.get("link", "")), result.get("title", ""), result.get("snippet", "")])
+    # Result order shuffles between fetches without the evidence changing
+    return content_hash(sorted(evidence))
+
+
+async def domain_evidence_hashes(brand_info: dict) -> Dict[str, Optional[str]]:
+    """Fetch every domain's searches (cache first) and hash each domain's evidence"""
+    params = domain_search_params(brand_info)
+    results = await search_many_async([p for domain_params in params.values() for p in domain_params])
+
+    hashes, offset = {}, 0
+    for domain, domain_params in params.items():
+        hashes[domain] = evidence_hash(results[offset:offset + len(domain_params)])
+        offset += len(domain_params)
+    return hashes
+
+
+def plan_stage(stored: Optional[Dict[str, Any]], input_hash: Optional[str],
+               ttl_hours: Optional[float] = None) -> Dict[str, Any]:
+    """Decide whether a stored stage output can be reused for these inputs"""
+    if input_hash is None:
+        return {"status": REFRESHED, "reason": "inputs unavailable"}
+    if stored is None:
+        return {"status": REFRESHED, "reason": "no stored result"}
+    if stored["input_hash"] != input_hash:
+        return {"status": REFRESHED, "reason": "inputs changed", "previous_age_hours": stored["age_hours"]}
+    if ttl_hours is not None and stored["age_hours"] > ttl_hours:
+        return {"status": REFRESHED, "reason": "expired", "previous_age_hours": stored["age_hours"]}
+    return {"status": REUSED, "reason": "unchanged", "age_hours": stored["age_hours"]}
@@ -0,0 +1,313 @@
+"""
+Background job runner for analyses.
+Analyses run on a bounded worker pool instead of the caller's thread; callers
+submit a job, poll its progress and collect the result. Jobs are persisted in
+SQLite so their status and results survive UI reruns and browser reconnects.
+"""
+
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from brand_positioning.config import Config
+from brand_positioning.core.result_store import ResultStore, get_result_store
+from brand_positioning.core.process_pool import PROCESS, AnalysisProcessPool, executor_backend, get_process_pool
+import logging
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = {COMPLETED, FAILED, CANCELLED}
+
+
+class JobCancelled(Exception):
+    """Raised inside a running analysis at its next progress update after cancel()"""
+
+
+def _analysis_modes():
+    # Imported lazily: the workflows pull in CrewAI, which job bookkeeping doesn't need
+    from brand_positioning.core.focused_workflow import run_focused_positioning_analysis
+    from brand_positioning.core.parallel_crews import run_parallel_analysis_sync, run_parallel_intelligence_sync
+    return {
+        "focused": run_focused_positioning_analysis,
+        "quick": run_parallel_intelligence_sync,
+        "full": run_parallel_analysis_sync
+    }
+
+
+class JobRunner:
+    """Bounded worker pool with a persisted job table
+    
+    With a process_pool, the worker threads only supervise: each analysis runs in a worker process.
+    """
+
+    def __init__(self, path: str, max_workers: int, result_store: Optional[ResultStore] = None,
+                 process_pool: Optional[AnalysisProcessPool] = None, retention_hours: Optional[float] = None):
+        self.path = path
+        self.retention_hours = Config.JOB_RETENTION_HOURS if retention_hours is None else retention_hours
+        self.result_store = result_store
+        self.process_pool = process_pool
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="analysis-job")
+        self._futures: Dict[str, Any] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
+        self._partials: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                mode TEXT NOT NULL,
+                brand_info TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress INTEGER NOT NULL DEFAULT 0,
+                message TEXT,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )"""
+        )
+        # Jobs left unfinished by a previous process will never complete
+        self._conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+            (FAILED, "Interrupted by restart", time.time(), PENDING, RUNNING)
+        )
+        self._conn.commit()
+        self.prune()
+
+    def _update(self, job_id: str, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    def _finish(self, job_id: str, **fields):
+        """Record a job's final state; from then on it lives only in the job table"""
+        self._update(job_id, finished_at=time.time(), **fields)
+        with self._lock:
+            self._futures.pop(job_id, None)
+            self._cancel_events.pop(job_id, None)
+
+    def prune(self) -> int:
+        """Delete jobs that finished more than retention_hours ago (0 keeps every job)"""
+        if not self.retention_hours:
+            return 0
+        cutoff = time.time() - self.retention_hours * 3600
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,)
+            ).rowcount
+            self._conn.commit()
+        return deleted
+
+    def submit(self, mode: str, brand_info: dict, max_age_hours: Optional[float] = None,
+               refresh: bool = False, **options) -> str:
+        """Queue an analysis ("focused", "quick" or "full") and return its job ID
+        
+        A stored result for the same brand and mode younger than max_age_hours (default
+        RESULT_MAX_AGE_HOURS) completes the job immediately unless refresh is set.
+        """
+        workflow = _analysis_modes().get(mode)
+        if workflow is None:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+        cancel_event = threading.Event()
+        if "cancel_event" in inspect.signature(workflow).parameters:
+            # Checked while crews run too, not only at the next progress update
+            options.setdefault("cancel_event", cancel_event)
+        if self.process_pool:
+            workflow = functools.partial(self.process_pool.run, workflow)
+
+        self.prune()
+        job_id = uuid.uuid4().hex
+        if self.result_store and not refresh:
+            max_age = Config.RESULT_MAX_AGE_HOURS if max_age_hours is None else max_age_hours
+            stored = self.result_store.latest(brand_info, mode, max_age)
+            if stored:
+                result = dict(stored["result"])
+                result["stored_result"] = {
+                    "id": stored["id"],
+                    "created_at": stored["created_at"],
+                    "age_hours": stored["age_hours"]
+                }
+                now = time.time()
+                with self._lock:
+                    self._conn.execute(
+                        """INSERT INTO jobs (id, mode, brand_info, status, progress, message, result,
+                                             created_at, started_at, finished_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (job_id, mode, json.dumps(brand_info), COMPLETED, 100,
+                         f"Served stored result ({stored['age_hours']}h old)",
+                         json.dumps(result, default=str), now, now, now)
+                    )
+                    self._conn.commit()
+                return job_id
+
+        queued_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, mode, brand_info, status, message, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, mode, json.dumps(brand_info), PENDING, "Queued", queued_at)
+            )
+            self._conn.commit()
+            self._cancel_events[job_id] = cancel_event
+            self._futures[job_id] = self._executor.submit(
+                self._run, job_id, mode, workflow, brand_info, options, queued_at
+            )
+        return job_id
+
+    def _run(self, job_id: str, mode: str, workflow, brand_info: dict, options: dict, queued_at: float):
+        cancel_event = self._cancel_events[job_id]
+        if cancel_event.is_set():
+            self._finish(job_id, status=CANCELLED, message="Cancelled")
+            return
+
+        started_at = time.time()
+        self._update(job_id, status=RUNNING, started_at=started_at, message="Starting analysis...")
+
+        def status_callback(message, progress=None):
+            if cancel_event.is_set():
+                raise JobCancelled()
+            if progress is None:
+                self._update(job_id, message=message)
+            else:
+                self._update(job_id, message=message, progress=int(progress))
+
+        def stream_callback(partial_result):
+            # Raising here would only be swallowed by CrewAI's event bus; cancellation is seen by status_callback
+            with self._lock:
+                self._partials[job_id] = partial_result
+
+        if mode == "full":
+            options.setdefault("stream_callback", stream_callback)
+
+        try:
+            result = workflow(brand_info, status_callback=status_callback, **options)
+        except JobCancelled:
+            result = None
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            result = {"success": False, "error": str(e)}
+        finally:
+            with self._lock:
+                self._partials.pop(job_id, None)
+
+        if cancel_event.is_set():
+            self._finish(job_id, status=CANCELLED, message="Cancelled")
+        elif result and result.get("success"):
+            if isinstance(result.get("metrics"), dict):
+                # Time spent waiting for a free worker, on top of the analysis's own spans
+                result["metrics"]["job_queue_wait_seconds"] = round(started_at - queued_at, 3)
+            if self.result_store:
+                try:
+                    self.result_store.save(brand_info, mode, result)
+                except sqlite3.Error as e:
+                    logger.error(f"Could not store result of job {job_id}: {e}")
+            self._finish(
+                job_id, status=COMPLETED, progress=100, message="Analysis complete",
+                result=json.dumps(result, default=str)
+            )
+        else:
+            error = (result or {}).get("error", "Unknown error")
+            self._finish(job_id, status=FAILED, message="Analysis failed", error=error)
+
+    def poll(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current status, progress and (once completed) result of a job"""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT id, mode, brand_info, status, progress, message, result, error,
+                          created_at, started_at, finished_at FROM jobs WHERE id = ?""",
+                (job_id,)
+            ).fetchone()
+            partial = self._partials.get(job_id)
+
+        if row is None:
+            return None
+
+        job = dict(zip(
+            ["id", "mode", "brand_info", "status", "progress", "message", "result", "error",
+             "created_at", "started_at", "finished_at"],
+            row
+        ))
+        job["brand_info"] = json.loads(job["brand_info"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["partial"] = partial
+        return job
+
+    def result(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for a job to finish and return its result dict (None unless it completed)"""
+        future = self._futures.get(job_id)
+        if future is not None and not future.cancelled():
+            future.result(timeout=timeout)
+        job = self.poll(job_id)
+        return job["result"] if job else None
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or stop a running one at its next progress update or crew check"""
+        job = self.poll(job_id)
+        if job is None or job["status"] in FINISHED_STATUSES:
+            return False
+
+        cancel_event = self._cancel_events.get(job_id)
+        if cancel_event is None:
+            return False
+        cancel_event.set()
+
+        future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            self._finish(job_id, status=CANCELLED, message="Cancelled")
+        return True
+
+    def active_count(self) -> int:
+        """Jobs queued or running right now"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (PENDING, RUNNING)
+            ).fetchone()[0]
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Most recent jobs, newest first, without their result payloads"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, mode, status, progress, message, created_at, finished_at FROM jobs "
+                "ORDER BY created_at DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        keys = ["id", "mode", "status", "progress", "message", "created_at", "finished_at"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting jobs and optionally wait for running ones"""
+        self._executor.shutdown(wait=wait)
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Get the process-wide job runner (one per server, shared by every session)"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            path = os.path.join(Config.DATA_DIR, "jobs.sqlite3")
+            process_pool = get_process_pool() if executor_backend() == PROCESS else None
+            _runner = JobRunner(path, max_workers=Config.JOB_MAX_WORKERS, result_store=get_result_store(),
+                                process_pool=process_pool)
+            logger.info(f"Job runner started with {Config.JOB_MAX_WORKERS} workers ({executor_backend()} backend)")
+        return _runner
@@ -1,173 +1,615 @@
 import asyncio
-import concurrent.futures
+import contextlib
+import functools
 import logging
+import threading
+from typing import Optional
 from crewai import Crew, Process
 from brand_positioning.agents.agents import create_market_intelligence_agent
+from brand_positioning.agents.llm_cache import LLMCacheSession, bind_llm_cache_session
+from brand_positioning.agents.llm import bind_token_callback
+from brand_positioning.agents.pool import get_agent_pool
+from brand_positioning.config import Config
+from brand_positioning.metrics import KICKOFF, STAGE, MetricsRecorder, activate, bind_metrics as bind_agent_metrics
+from brand_positioning.tools.evidence_index import EvidenceIndex
+from brand_positioning.tools.search_client import get_search_loop
 from brand_positioning.core.parallel_tasks import (
     create_competitor_analysis_task,
     create_customer_insights_task, 
     create_market_trends_task
 )
-from brand_positioning.core.tasks import create_positioning_strategy_task, create_strategic_action_task
+from brand_positioning.core.tasks import (
+    create_domain_digest_task,
+    create_positioning_strategy_task,
+    create_strategic_action_task
+)
+from brand_positioning.core.prefetch import start_intelligence_prefetch
+from brand_positioning.core.compaction import compact_intelligence
+from brand_positioning.core.direct_intelligence import DirectDomainRun
+from brand_positioning.core.jobs import JobCancelled
+from brand_positioning.core.incremental import (
+    DOMAIN_TOOLS,
+    REUSED,
+    content_hash,
+    domain_evidence_hashes,
+    plan_stage
+)
+from brand_positioning.core.result_store import get_result_store
+from brand_positioning.core.streaming import PartialResultStream
 
 logger = logging.getLogger(__name__)
 
+# What to do with an intelligence crew still running at its deadline
+WAIT = "wait"        # Keep waiting, up to the stage deadline
+PARTIAL = "partial"  # Proceed with the domains that finished
+HEDGE = "hedge"      # Relaunch the straggler and take whichever copy finishes first
+STRAGGLER_POLICIES = (WAIT, PARTIAL, HEDGE)
+
+# Longest positioning waits for the digests when CREW_DEADLINE_SECONDS is 0 (no crew deadline)
+DIGEST_TIMEOUT_SECONDS = 240.0
+
+# How often a wait on crews or digests checks whether its job was cancelled
+CANCEL_POLL_SECONDS = 0.5
+
+
+def straggler_policy() -> str:
+    """Configured STRAGGLER_POLICY, falling back to waiting when it is not recognized"""
+    if Config.STRAGGLER_POLICY in STRAGGLER_POLICIES:
+        return Config.STRAGGLER_POLICY
+    logger.warning(f"Unknown STRAGGLER_POLICY '{Config.STRAGGLER_POLICY}', waiting for stragglers")
+    return WAIT
+
 class ParallelCrewsOrchestrator:
     """Orchestrate multiple crews running in parallel for maximum performance"""
     
-    def __init__(self):
+    # Set by the sync wrappers for each run; waits on crews and digests raise JobCancelled once it is set
+    cancel_event: Optional[threading.Event] = None
+    
+    def __init__(self, async_tools=None):
+        # Asyncio tools keep searches off worker threads (defaults to ASYNC_SEARCH_TOOLS)
+        self.async_tools = Config.ASYNC_SEARCH_TOOLS if async_tools is None else async_tools
+        
         # Create agents (can be reused across crews)
-        self.market_intelligence_agent = create_market_intelligence_agent()
+        self.market_intelligence_agent = create_market_intelligence_agent(self.async_tools)
+        self.evidence_index = EvidenceIndex()
+        self.domain_indexes = {}
+        self.bind_llm_cache(LLMCacheSession(Config.LLM_CACHE_ENABLED))
+        self.bind_metrics(MetricsRecorder())
         logger.info("ParallelCrewsOrchestrator initialized")
     
-    def create_competitor_crew(self, brand_info: dict):
-        """Create crew focused on competitor analysis"""
-        task = create_competitor_analysis_task(brand_info)
-        task.agent = self.market_intelligence_agent
+    def domain_index(self, domain: str, hedge: bool = False) -> EvidenceIndex:
+        """A fresh evidence index for one domain's run, kept for merge_evidence()
+        
+        Each crew has its own LLM context, so it only dedupes against evidence it was shown
+        itself; a shared index would hand it bare IDs for pages another crew fetched first.
+        A hedge's index is kept under "<domain>_hedge" until it wins its race.
+        """
+        key = f"{domain}_hedge" if hedge else domain
+        index = self.domain_indexes[key] = EvidenceIndex()
+        return index
+    
+    def domain_tool(self, domain: str, hedge: bool = False):
+        """The agent's research tool for one domain, with an evidence index of its own"""
+        index = self.domain_index(domain, hedge)
+        tool = next(tool for tool in self.market_intelligence_agent.tools if isinstance(tool, DOMAIN_TOOLS[domain]))
+        return type(tool)(evidence_index=index, metrics=self.metrics)
+    
+    def merge_evidence(self) -> EvidenceIndex:
+        """Combine the domains' indexes into the analysis-wide evidence list"""
+        merged = EvidenceIndex()
+        for domain in DOMAIN_TOOLS:
+            if domain in self.domain_indexes:
+                merged.merge(self.domain_indexes[domain])
+        self.evidence_index = merged
+        return merged
+    
+    def bind_llm_cache(self, session: LLMCacheSession, *agents):
+        """Route this run's LLM calls through one cache session (switch plus hit counters)"""
+        self.llm_cache_session = session
+        bind_llm_cache_session([self.market_intelligence_agent, *agents], session)
+    
+    def bind_metrics(self, recorder: MetricsRecorder, *agents):
+        """Record this run's searches, LLM calls and kickoffs on one recorder"""
+        self.metrics = recorder
+        bind_agent_metrics([self.market_intelligence_agent, *agents], recorder)
+    
+    def _create_domain_crew(self, domain: str, task, hedge_agent=None):
+        """One crew for one domain's task, with that crew's own research tool and evidence index"""
+        agent = hedge_agent or self.market_intelligence_agent
+        task.agent = agent
+        task.tools = [self.domain_tool(domain, hedge=hedge_agent is not None)]
         
         return Crew(
-            agents=[self.market_intelligence_agent],
+            agents=[agent],
             tasks=[task],
             process=Process.sequential,
             verbose=False  # Reduce noise with multiple crews
         )
     
-    def create_customer_crew(self, brand_info: dict):
+    def create_competitor_crew(self, brand_info: dict, hedge_agent=None):
+        """Create crew focused on competitor analysis"""
+        return self._create_domain_crew("competitor_analysis", create_competitor_analysis_task(brand_info), hedge_agent)
+    
+    def create_customer_crew(self, brand_info: dict, hedge_agent=None):
         """Create crew focused on customer insights"""
-        task = create_customer_insights_task(brand_info)
-        task.agent = self.market_intelligence_agent
-        
-        return Crew(
-            agents=[self.market_intelligence_agent],
-            tasks=[task], 
-            process=Process.sequential,
-            verbose=False
-        )
+        return self._create_domain_crew("customer_insights", create_customer_insights_task(brand_info), hedge_agent)
     
-    def create_trends_crew(self, brand_info: dict):
+    def create_trends_crew(self, brand_info: dict, hedge_agent=None):
         """Create crew focused on market trends"""
-        task = create_market_trends_task(brand_info)
-        task.agent = self.market_intelligence_agent
-        
-        return Crew(
-            agents=[self.market_intelligence_agent],
-            tasks=[task],
-            process=Process.sequential,
-            verbose=False
+        return self._create_domain_crew("market_trends", create_market_trends_task(brand_info), hedge_agent)
+    
+    def create_direct_run(self, domain: str, brand_info: dict, hedge_agent=None):
+        """Create a tool-first run for one domain: no ReAct loop, one summarization call"""
+        return DirectDomainRun(
+            domain, brand_info, hedge_agent or self.market_intelligence_agent,
+            self.domain_index(domain, hedge=hedge_agent is not None), async_tools=self.async_tools
         )
     
-    def run_crew_sync(self, crew):
+    def acquire_hedge_agent(self):
+        """A second intelligence agent for a hedge, so it never shares an agent with the straggler it races"""
+        agent = get_agent_pool().acquire(create_market_intelligence_agent, self.async_tools)
+        bind_llm_cache_session([agent], self.llm_cache_session)
+        bind_agent_metrics([agent], self.metrics)
+        return agent
+    
+    def release_hedge_agent(self, agent):
+        get_agent_pool().release(agent, create_market_intelligence_agent, self.async_tools)
+    
+    def run_crew_sync(self, crew, name: str = "crew"):
         """Run a single crew synchronously (for use in thread pool)"""
+        with activate(self.metrics), self.metrics.span(KICKOFF, name) as record:
+            try:
+                result = crew.kickoff()
+                return str(result)
+            except Exception as e:
+                logger.error(f"Crew execution failed: {e}")
+                record["status"] = "error"
+                record["attributes"]["error"] = str(e)
+                return f"Error: {str(e)}"
+    
+    async def run_parallel_intelligence(self, brand_info: dict, status_callback=None, prefetch=None, llm_cache=None,
+                                        domains=None, metrics=None, on_result=None, direct=None):
+        """Run market intelligence crews in parallel using thread pool
+        
+        domains limits the run to a subset of competitor_analysis, customer_insights and market_trends.
+        metrics is the recorder of an enclosing analysis; a fresh one is started otherwise.
+        on_result(domain, output) is called on the event loop as soon as each domain settles.
+        direct (defaults to DIRECT_INTELLIGENCE) runs each domain's tool programmatically and
+        summarizes it in one LLM call instead of running a crew.
+        """
+        self.bind_metrics(metrics or MetricsRecorder())
+        
+        # Fresh evidence indexes per analysis: each crew dedupes only against what it has seen
+        self.evidence_index = EvidenceIndex()
+        self.domain_indexes = {}
+        self.market_intelligence_agent.tools_results = []
+        
+        # llm_cache=False bypasses cached completions for this run only
+        if llm_cache is None:
+            llm_cache = Config.LLM_CACHE_ENABLED
+        self.bind_llm_cache(LLMCacheSession(llm_cache))
+        
+        crew_factories = {
+            "competitor_analysis": self.create_competitor_crew,
+            "customer_insights": self.create_customer_crew,
+            "market_trends": self.create_trends_crew
+        }
+        if direct is None:
+            direct = Config.DIRECT_INTELLIGENCE
+        if direct:
+            crew_factories = {domain: functools.partial(self.create_direct_run, domain) for domain in crew_factories}
+        if domains is not None:
+            crew_factories = {domain: factory for domain, factory in crew_factories.items() if domain in domains}
+        if not crew_factories:
+            self.crew_status = {"policy": straggler_policy(), "completed": [], "timed_out": [], "hedged": [], "running": []}
+            return {}
+        
+        with activate(self.metrics), \
+                self.metrics.span(STAGE, "intelligence", domains=len(crew_factories), direct=direct):
+            # Warm the search store before crews exist so SerpAPI overlaps crew setup and the first LLM turn
+            if prefetch is None:
+                prefetch = Config.PREFETCH_SEARCHES
+            prefetcher = start_intelligence_prefetch(brand_info) if prefetch else None
+        
+            try:
+                if status_callback:
+                    status_callback("Creating parallel analysis crews...", 10)
+        
+                # One separate crew per domain
+                crews = {domain: factory(brand_info) for domain, factory in crew_factories.items()}
+        
+                if status_callback:
+                    status_callback(f"Starting parallel execution ({len(crews)} crews running simultaneously)...", 20)
+        
+                if status_callback:
+                    status_callback("Executing parallel market intelligence (this may take 2-4 minutes)...", 30)
+        
+                # Run crews in parallel using thread pool, within the crew and stage deadlines
+                results = await self.run_crews_with_deadlines(brand_info, crews, crew_factories, on_result)
+        
+                if status_callback:
+                    status_callback("Parallel market intelligence completed!", 80)
+        
+                if self.domain_indexes:
+                    self.merge_evidence()
+                logger.info(f"Intelligence evidence: {self.evidence_index.stats()}")
+        
+                return results
+            finally:
+                if prefetcher:
+                    prefetcher.close()
+    
+    async def run_crews_with_deadlines(self, brand_info: dict, crews: dict, crew_factories: dict, on_result=None):
+        """Run one crew per domain on worker threads and collect their outputs by domain
+        
+        A crew still running at CREW_DEADLINE_SECONDS is waited for, dropped or relaunched
+        according to STRAGGLER_POLICY; nothing runs past INTELLIGENCE_DEADLINE_SECONDS.
+        Domains without an output get an "Error:" result, and self.crew_status records
+        which domains completed, timed out or were hedged. Each output is handed to
+        on_result as soon as its domain settles, without waiting for the others.
+        
+        A hedge runs on its own agent and evidence index. The first successful attempt
+        settles the domain; the other attempt keeps running in the background and its
+        output is discarded. Domains whose first crew is still running on this orchestrator's
+        agent when the stage ends are listed under "running".
+        """
+        policy = straggler_policy()
+        crew_deadline = Config.CREW_DEADLINE_SECONDS if policy != WAIT else 0
+        stage_deadline = Config.INTELLIGENCE_DEADLINE_SECONDS
+        status = self.crew_status = {"policy": policy, "completed": [], "timed_out": [], "hedged": [], "running": []}
+        
+        loop = asyncio.get_running_loop()
+        attempts = {domain: [self._start_crew(loop, crew, domain)] for domain, crew in crews.items()}
+        outputs = {}
+        started = loop.time()
+        
+        announced = set()
+        
+        def hand_downstream():
+            """Pass newly settled domains to on_result"""
+            for domain, output in outputs.items():
+                if domain not in announced:
+                    announced.add(domain)
+                    on_result(domain, output)
+        
         try:
-            result = crew.kickoff()
-            return str(result)
-        except Exception as e:
-            logger.error(f"Crew execution failed: {e}")
-            return f"Error: {str(e)}"
+            while len(outputs) < len(crews):
+                elapsed = loop.time() - started
+                deadlines = [d for d in (crew_deadline, stage_deadline) if d and d > elapsed]
+                running = [future for domain in attempts if domain not in outputs
+                           for future in attempts[domain] if not future.done()]
+                if running:
+                    await self._wait(running, timeout=min(deadlines) - elapsed if deadlines else None,
+                                     return_when=asyncio.FIRST_COMPLETED)
+                
+                for domain, futures in attempts.items():
+                    if domain in outputs:
+                        continue
+                    finished = [(attempt, future.result()) for attempt, future in enumerate(futures) if future.done()]
+                    succeeded = [(attempt, result) for attempt, result in finished if not result.startswith("Error:")]
+                    # A failed attempt only settles the domain once no hedge is still running
+                    if succeeded or len(finished) == len(futures):
+                        attempt, outputs[domain] = succeeded[0] if succeeded else finished[0]
+                        status["completed"].append(domain)
+                        if attempt and f"{domain}_hedge" in self.domain_indexes:
+                            # The hedge won: its evidence backs the output, the straggler's does not
+                            self.domain_indexes[domain] = self.domain_indexes.pop(f"{domain}_hedge")
+                if on_result:
+                    hand_downstream()
+                
+                elapsed = loop.time() - started
+                stragglers = [domain for domain in crews if domain not in outputs]
+                if not stragglers:
+                    break
+                
+                if stage_deadline and elapsed >= stage_deadline:
+                    self._time_out(stragglers, outputs, stage_deadline)
+                elif crew_deadline and elapsed >= crew_deadline:
+                    crew_deadline = 0  # Applied once
+                    if policy == PARTIAL:
+                        self._time_out(stragglers, outputs, Config.CREW_DEADLINE_SECONDS)
+                    else:
+                        for domain in stragglers:
+                            logger.warning(f"{domain} crew is straggling; hedging with a second crew")
+                            agent = self.acquire_hedge_agent()
+                            attempts[domain].append(self._start_crew(
+                                loop, crew_factories[domain](brand_info, hedge_agent=agent), f"{domain}_hedge",
+                                on_exit=functools.partial(self.release_hedge_agent, agent)
+                            ))
+                            status["hedged"].append(domain)
+            if on_result:
+                hand_downstream()
+        finally:
+            status["running"] = [domain for domain, futures in attempts.items() if not futures[0].done()]
+            for futures in attempts.values():
+                for future in futures:
+                    future.cancel()
+        
+        # Keep the domain order of the crews
+        return {domain: outputs[domain] for domain in crews}
     
-    async def run_parallel_intelligence(self, brand_info: dict, status_callback=None):
-        """Run market intelligence crews in parallel using thread pool"""
+    async def _wait(self, futures, timeout: Optional[float] = None, return_when=asyncio.ALL_COMPLETED):
+        """asyncio.wait that raises JobCancelled within CANCEL_POLL_SECONDS of cancel_event being set"""
+        loop = asyncio.get_running_loop()
+        end = None if timeout is None else loop.time() + timeout
+        while True:
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise JobCancelled()
+            step = CANCEL_POLL_SECONDS if end is None else max(0.0, min(CANCEL_POLL_SECONDS, end - loop.time()))
+            done, pending = await asyncio.wait(futures, timeout=step, return_when=return_when)
+            if not pending or (done and return_when == asyncio.FIRST_COMPLETED) or \
+                    (end is not None and loop.time() >= end):
+                return done, pending
+    
+    async def run_direct_async(self, run: DirectDomainRun, name: str) -> str:
+        """run_crew_sync for a direct run driven by the event loop"""
+        with activate(self.metrics), self.metrics.span(KICKOFF, name) as record:
+            try:
+                return str(await run.kickoff_async())
+            except Exception as e:
+                logger.error(f"Crew execution failed: {e}")
+                record["status"] = "error"
+                record["attributes"]["error"] = str(e)
+                return f"Error: {str(e)}"
+    
+    def _start_crew(self, loop, crew, name: str, on_exit=None) -> asyncio.Future:
+        """Run a crew on a daemon thread so a straggler abandoned at its deadline never blocks shutdown
         
-        if status_callback:
-            status_callback("Creating parallel analysis crews...", 10)
+        (A CrewAI async task whose thread dies on an exception never resolves, leaving kickoff() hung.)
+        on_exit runs on that thread once the crew is done, even if nobody is waiting for it any more.
+        A direct run with async tools runs on the shared search loop instead of a thread of its own.
+        """
+        future = loop.create_future()
+        
+        def settle(result):
+            if not future.done():
+                future.set_result(result)
+        
+        if isinstance(crew, DirectDomainRun) and crew.async_tools:
+            async def run_on_search_loop():
+                # On the long-lived search loop an abandoned run still finishes and runs on_exit
+                try:
+                    result = await self.run_direct_async(crew, name)
+                finally:
+                    if on_exit:
+                        on_exit()
+                try:
+                    loop.call_soon_threadsafe(settle, result)
+                except RuntimeError:
+                    pass  # The analysis finished without this run and its loop is closed
+            
+            asyncio.run_coroutine_threadsafe(run_on_search_loop(), get_search_loop())
+            return future
         
-        # Create three separate crews
-        competitor_crew = self.create_competitor_crew(brand_info)
-        customer_crew = self.create_customer_crew(brand_info)
-        trends_crew = self.create_trends_crew(brand_info)
+        def run():
+            try:
+                result = self.run_crew_sync(crew, name)
+            finally:
+                if on_exit:
+                    on_exit()
+            try:
+                loop.call_soon_threadsafe(settle, result)
+            except RuntimeError:
+                pass  # The analysis finished without this crew and its loop is closed
         
+        threading.Thread(target=run, daemon=True, name=f"crew-{name}").start()
+        return future
+    
+    def _time_out(self, domains, outputs: dict, deadline: float):
+        """Give up on these domains' crews (their threads finish, or hang, in the background)"""
+        for domain in domains:
+            logger.warning(f"{domain} crew missed its {deadline:g}s deadline; proceeding without it")
+            outputs[domain] = f"Error: {domain} timed out after {deadline:g}s"
+            self.crew_status["timed_out"].append(domain)
+    
+    async def run_incremental_intelligence(self, brand_info: dict, store, stages: dict, status_callback=None,
+                                           prefetch=None, llm_cache=None):
+        """Reuse stored domain results whose evidence is unchanged and within TTL; re-run only the rest
+        
+        Each domain's decision (reused or refreshed, and why) is recorded in stages.
+        """
         if status_callback:
-            status_callback("Starting parallel execution (3 crews running simultaneously)...", 20)
+            status_callback("Checking which intelligence domains are stale...", 8)
         
-        # Run crews in parallel using thread pool
-        loop = asyncio.get_event_loop()
+        # Hash through the warm store and hold it while stale domains re-run, so their crews are
+        # served these results instead of searching again (the search cache may be off)
+        with activate(self.metrics):
+            evidence_searches = start_intelligence_prefetch(brand_info)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            # Submit all crews to thread pool
-            futures = [
-                loop.run_in_executor(executor, self.run_crew_sync, competitor_crew),
-                loop.run_in_executor(executor, self.run_crew_sync, customer_crew),
-                loop.run_in_executor(executor, self.run_crew_sync, trends_crew)
-            ]
-            
-            if status_callback:
-                status_callback("Executing parallel market intelligence (this may take 2-4 minutes)...", 30)
+        try:
+            try:
+                with activate(self.metrics), self.metrics.span(STAGE, "evidence_hashing"):
+                    hashes = await domain_evidence_hashes(brand_info)
+            except Exception as e:
+                logger.warning(f"Could not hash domain evidence, refreshing all domains: {e}")
+                hashes = dict.fromkeys(DOMAIN_TOOLS)
             
-            # Wait for all crews to complete
-            results = await asyncio.gather(*futures)
+            reused = {}
+            for domain, domain_hash in hashes.items():
+                stored = store.latest_stage(brand_info, domain)
+                stages[domain] = plan_stage(stored, domain_hash, Config.DOMAIN_TTL_HOURS.get(domain))
+                if stages[domain]["status"] == REUSED:
+                    reused[domain] = stored["output"]
             
-            if status_callback:
-                status_callback("Parallel market intelligence completed!", 80)
+            stale = [domain for domain in hashes if domain not in reused]
+            logger.info(f"Incremental intelligence: reusing {sorted(reused)}, refreshing {stale}")
+            refreshed = await self.run_parallel_intelligence(
+                brand_info, status_callback, prefetch, llm_cache, domains=stale, metrics=self.metrics
+            )
+        finally:
+            evidence_searches.close()
         
-        # Structure results
-        return {
-            "competitor_analysis": results[0],
-            "customer_insights": results[1], 
-            "market_trends": results[2]
-        }
+        for domain, output in refreshed.items():
+            if hashes[domain] and not output.startswith("Error:"):
+                store.save_stage(brand_info, domain, hashes[domain], output)
+        
+        return {domain: reused[domain] if domain in reused else refreshed[domain] for domain in hashes}
     
-    async def run_complete_analysis(self, brand_info: dict, status_callback=None):
-        """Run complete brand positioning analysis with parallel market intelligence"""
+    async def run_complete_analysis(self, brand_info: dict, status_callback=None, prefetch=None, llm_cache=None,
+                                    stream_callback=None, incremental=None, progressive=None):
+        """Run complete brand positioning analysis with parallel market intelligence
+        
+        With stream_callback, partial result dicts are pushed while the strategy and actions are generated.
+        With incremental (defaults to INCREMENTAL_ANALYSIS), only stale domains and changed stages are re-run.
+        With progressive (defaults to PROGRESSIVE_POSITIONING), the strategist digests each domain as soon as
+        its crew finishes and the positioning strategy is merged from the digests.
+        """
+        
+        # One recorder across intelligence, positioning and actions
+        recorder = MetricsRecorder()
+        self.bind_metrics(recorder)
         
         try:
             if status_callback:
                 status_callback("Starting comprehensive brand analysis...", 5)
             
+            if incremental is None:
+                incremental = Config.INCREMENTAL_ANALYSIS
+            store = get_result_store() if incremental else None
+            if incremental and store is None:
+                logger.warning("Incremental analysis needs the result store; re-running every stage")
+            stages = {}
+            
+            if progressive is None:
+                progressive = Config.PROGRESSIVE_POSITIONING
+            if progressive and store:
+                # Digests are fresh LLM output, so a merged strategy would never match a stored one
+                logger.info("Incremental analysis reuses stored stages; positioning is not pipelined")
+                progressive = False
+            
+            digests, on_result = {}, None
+            if progressive:
+                def on_result(domain, output):
+                    # The last domain to finish goes straight into the merge: digesting it would only
+                    # add an LLM call to the critical path
+                    last = len(digests) == len(DOMAIN_TOOLS) - 1
+                    digests[domain] = None if last else self._start_digest(brand_info, domain, output)
+            
             # Step 1: Run parallel market intelligence
-            intelligence_results = await self.run_parallel_intelligence(brand_info, status_callback)
+            if store:
+                intelligence_results = await self.run_incremental_intelligence(
+                    brand_info, store, stages, status_callback, prefetch, llm_cache
+                )
+            else:
+                intelligence_results = await self.run_parallel_intelligence(
+                    brand_info, status_callback, prefetch, llm_cache, metrics=recorder, on_result=on_result
+                )
             
             if status_callback:
                 status_callback("Generating positioning strategy...", 85)
             
+            stream = None
+            if stream_callback:
+                stream = PartialResultStream(stream_callback, {
+                    "brand_info": brand_info,
+                    "market_intelligence": intelligence_results,
+                    "positioning_strategy": "",
+                    "strategic_actions": ""
+                })
+            
+            # Intelligence is compacted to the token budget before being embedded in the strategy prompt
+            with recorder.span(STAGE, "compaction"):
+                compacted_intelligence, compaction_stats = compact_intelligence(intelligence_results)
+            
+            # Progressive: the strategy is merged from the digests, falling back to a domain's own findings
+            positioning_input = compacted_intelligence
+            if progressive:
+                with recorder.span(STAGE, "digests"):
+                    positioning_input, digest_status = await self._collect_digests(digests, compacted_intelligence)
+            
             # Step 2: Generate positioning strategy (sequential, depends on intelligence)
-            from brand_positioning.agents.agents import create_positioning_strategist_agent
-            positioning_agent = create_positioning_strategist_agent()
-            
-            # Create positioning task with intelligence data embedded in description
-            positioning_task = create_positioning_strategy_task(brand_info, intelligence_results)
-            positioning_task.agent = positioning_agent
-            
-            positioning_crew = Crew(
-                agents=[positioning_agent],
-                tasks=[positioning_task],
-                process=Process.sequential,
-                verbose=False
-            )
+            positioning_hash = content_hash(compacted_intelligence)
+            stored_positioning = self._reusable_stage(store, stages, brand_info, "positioning", positioning_hash)
+            if stored_positioning is not None:
+                positioning_result = stored_positioning
+            else:
+                from brand_positioning.agents.agents import create_positioning_strategist_agent
+                pool = get_agent_pool()
+                with recorder.span(STAGE, "positioning"), \
+                        pool.checkout(create_positioning_strategist_agent) as positioning_agent:
+                    self.bind_llm_cache(self.llm_cache_session, positioning_agent)
+                    self.bind_metrics(recorder, positioning_agent)
+                    bind_token_callback([positioning_agent], stream.token_callback("positioning_strategy") if stream else None)
+                    
+                    # Create positioning task with intelligence data embedded in description
+                    positioning_task = create_positioning_strategy_task(brand_info, positioning_input)
+                    positioning_task.agent = positioning_agent
+                    
+                    positioning_crew = Crew(
+                        agents=[positioning_agent],
+                        tasks=[positioning_task],
+                        process=Process.sequential,
+                        verbose=False
+                    )
+                    
+                    with recorder.span(KICKOFF, "positioning"):
+                        positioning_result = positioning_crew.kickoff()
+                if store:
+                    store.save_stage(brand_info, "positioning", positioning_hash, str(positioning_result))
             
-            positioning_result = positioning_crew.kickoff()
+            if stream:
+                stream.update(positioning_strategy=str(positioning_result))
             
             if status_callback:
                 status_callback("Generating strategic actions...", 90)
             
             # Step 3: Generate strategic actions (sequential, depends on positioning)
-            from brand_positioning.agents.agents import create_strategic_advisor_agent
-            advisor_agent = create_strategic_advisor_agent()
-            
-            # Create action task with positioning results embedded in description
-            action_task = create_strategic_action_task(brand_info, str(positioning_result))
-            action_task.agent = advisor_agent
-            
-            action_crew = Crew(
-                agents=[advisor_agent],
-                tasks=[action_task],
-                process=Process.sequential,
-                verbose=False
-            )
+            actions_hash = content_hash(str(positioning_result))
+            stored_actions = self._reusable_stage(store, stages, brand_info, "strategic_actions", actions_hash)
+            if stored_actions is not None:
+                action_result = stored_actions
+            else:
+                from brand_positioning.agents.agents import create_strategic_advisor_agent
+                with recorder.span(STAGE, "strategic_actions"), \
+                        get_agent_pool().checkout(create_strategic_advisor_agent) as advisor_agent:
+                    self.bind_llm_cache(self.llm_cache_session, advisor_agent)
+                    self.bind_metrics(recorder, advisor_agent)
+                    bind_token_callback([advisor_agent], stream.token_callback("strategic_actions") if stream else None)
+                    
+                    # Create action task with positioning results embedded in description
+                    action_task = create_strategic_action_task(brand_info, str(positioning_result))
+                    action_task.agent = advisor_agent
+                    
+                    action_crew = Crew(
+                        agents=[advisor_agent],
+                        tasks=[action_task],
+                        process=Process.sequential,
+                        verbose=False
+                    )
+                    
+                    with recorder.span(KICKOFF, "strategic_actions"):
+                        action_result = action_crew.kickoff()
+                if store:
+                    store.save_stage(brand_info, "strategic_actions", actions_hash, str(action_result))
             
-            action_result = action_crew.kickoff()
+            if stream:
+                stream.update(strategic_actions=str(action_result), streaming=None)
             
             if status_callback:
                 status_callback("Analysis completed successfully!", 100)
             
             # Return structured results
-            return {
+            result = {
                 "brand_info": brand_info,
                 "market_intelligence": intelligence_results,
                 "positioning_strategy": str(positioning_result),
                 "strategic_actions": str(action_result),
+                "llm_cache": self.llm_cache_session.stats(),
+                "compaction": compaction_stats,
+                "intelligence_status": self.crew_status,
+                "evidence": self.evidence_index.export(),
+                "metrics": recorder.summary(),
+                "trace": recorder.export_spans(),
                 "success": True
             }
+            if store:
+                result["incremental"] = stages
+            if progressive:
+                result["progressive"] = digest_status
+            return result
             
+        except JobCancelled:
+            raise
         except Exception as e:
             logger.error(f"Complete analysis failed: {e}")
             if status_callback:
@@ -176,24 +618,96 @@ class ParallelCrewsOrchestrator:
             return {
                 "brand_info": brand_info,
                 "error": str(e),
+                "metrics": recorder.summary(),
                 "success": False
             }
+    
+    def _start_digest(self, brand_info: dict, domain: str, output: str):
+        """Start a strategist digesting one domain's findings (None for a failed domain)
+        
+        Each digest runs on its own pooled agent, returned by the digest's thread when it is done:
+        a digest still running when positioning starts must not share the agent streaming the strategy.
+        """
+        if output.startswith("Error:"):
+            return None
+        
+        from brand_positioning.agents.agents import create_positioning_strategist_agent
+        pool = get_agent_pool()
+        agent = pool.acquire(create_positioning_strategist_agent)
+        self.bind_llm_cache(self.llm_cache_session, agent)
+        self.bind_metrics(self.metrics, agent)
+        bind_token_callback([agent], None)
+        task = create_domain_digest_task(brand_info, domain, output)
+        task.agent = agent
+        crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=False)
+        logger.info(f"{domain} finished; digesting it for positioning")
+        return self._start_crew(
+            asyncio.get_running_loop(), crew, f"{domain}_digest",
+            on_exit=functools.partial(pool.release, agent, create_positioning_strategist_agent)
+        )
+    
+    async def _collect_digests(self, digests: dict, intelligence: dict):
+        """Positioning input by domain: the digest where one finished, else the domain's own findings"""
+        pending = [future for future in digests.values() if future is not None]
+        if pending:
+            await self._wait(pending, timeout=Config.CREW_DEADLINE_SECONDS or DIGEST_TIMEOUT_SECONDS)
+        
+        merged, status = {}, {}
+        for domain, findings in intelligence.items():
+            future = digests.get(domain)
+            digest = future.result() if future is not None and future.done() else None
+            if digest and not digest.startswith("Error:"):
+                merged[domain], status[domain] = digest, "digested"
+            else:
+                merged[domain], status[domain] = findings, "raw"
+                if future is not None:
+                    future.cancel()
+        return merged, status
+    
+    def _reusable_stage(self, store, stages: dict, brand_info: dict, stage: str, input_hash: str):
+        """Stored output of a downstream stage when its inputs are unchanged, else None (decision kept in stages)"""
+        if store is None:
+            return None
+        stored = store.latest_stage(brand_info, stage)
+        stages[stage] = plan_stage(stored, input_hash)
+        return stored["output"] if stages[stage]["status"] == REUSED else None
+
+@contextlib.contextmanager
+def pooled_orchestrator():
+    """Check out an orchestrator; one with crews still running on its agent is dropped, not pooled"""
+    pool = get_agent_pool()
+    orchestrator = pool.acquire(ParallelCrewsOrchestrator, Config.ASYNC_SEARCH_TOOLS)
+    yield orchestrator
+    # Only reached on success, like AgentPool.checkout
+    running = getattr(orchestrator, "crew_status", {}).get("running")
+    if running:
+        logger.info(f"Not reusing the orchestrator: {', '.join(running)} crew still running on its agent")
+    else:
+        pool.release(orchestrator, ParallelCrewsOrchestrator, Config.ASYNC_SEARCH_TOOLS)
 
 # Synchronous wrapper for Streamlit
-def run_parallel_analysis_sync(brand_info: dict, status_callback=None):
-    """Synchronous wrapper to run parallel analysis in Streamlit"""
+def run_parallel_analysis_sync(brand_info: dict, status_callback=None, prefetch=None, llm_cache=None,
+                               stream_callback=None, incremental=None, progressive=None, cancel_event=None):
+    """Synchronous wrapper to run parallel analysis in Streamlit
     
-    orchestrator = ParallelCrewsOrchestrator()
+    Setting cancel_event stops the analysis (JobCancelled) while it waits on crews or digests.
+    """
     
-    # Run async function in new event loop
+    # Run async function in new event loop on a pooled orchestrator (agents are built once per process)
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            orchestrator.run_complete_analysis(brand_info, status_callback)
-        )
-        loop.close()
+        with pooled_orchestrator() as orchestrator:
+            orchestrator.cancel_event = cancel_event
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            result = loop.run_until_complete(
+                orchestrator.run_complete_analysis(
+                    brand_info, status_callback, prefetch, llm_cache, stream_callback, incremental, progressive
+                )
+            )
+            loop.close()
         return result
+    except JobCancelled:
+        raise
     except Exception as e:
         logger.error(f"Parallel analysis wrapper failed: {e}")
         return {
@@ -203,23 +717,35 @@ def run_parallel_analysis_sync(brand_info: dict, status_callback=None):
         }
 
 # Quick parallel intelligence only
-def run_parallel_intelligence_sync(brand_info: dict, status_callback=None):
+def run_parallel_intelligence_sync(brand_info: dict, status_callback=None, prefetch=None, llm_cache=None,
+                                   cancel_event=None):
     """Synchronous wrapper for parallel market intelligence only"""
     
-    orchestrator = ParallelCrewsOrchestrator()
-    
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            orchestrator.run_parallel_intelligence(brand_info, status_callback)
-        )
-        loop.close()
+        with pooled_orchestrator() as orchestrator:
+            orchestrator.cancel_event = cancel_event
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            result = loop.run_until_complete(
+                orchestrator.run_parallel_intelligence(brand_info, status_callback, prefetch, llm_cache)
+            )
+            loop.close()
+            llm_cache_stats = orchestrator.llm_cache_session.stats()
+            evidence = orchestrator.evidence_index.export()
+            crew_status = orchestrator.crew_status
+            recorder = orchestrator.metrics
         return {
             "brand_info": brand_info,
             "intelligence": result,
+            "intelligence_status": crew_status,
+            "llm_cache": llm_cache_stats,
+            "evidence": evidence,
+            "metrics": recorder.summary(),
+            "trace": recorder.export_spans(),
             "success": True
         }
+    except JobCancelled:
+        raise
     except Exception as e:
         logger.error(f"Parallel intelligence wrapper failed: {e}")
         return {
@@ -0,0 +1,37 @@
+"""
+Pre-fetch stage: every templated query is determined by brand_info,
+so searches can start the moment the user submits instead of waiting
+for an agent to decide to call a tool.
+"""
+
+from typing import Dict, List, Any
+from brand_positioning.tools import tools, focused_tools
+from brand_positioning.tools.search_client import prefetch_searches, SearchPrefetch
+import logging
+
+logger = logging.getLogger(__name__)
+
+def intelligence_search_params(brand_info: dict) -> List[Dict[str, Any]]:
+    """All searches the three intelligence crews will run for this brand"""
+    query = brand_info.get("product", "")
+    queries = []
+    for tool in (tools.CompetitorResearchTool(), tools.CustomerInsightTool(), tools.MarketTrendTool()):
+        queries.extend(tool.build_queries(query))
+    return tools.search_params(queries)
+
+def focused_search_params(brand_info: dict) -> List[Dict[str, Any]]:
+    """All searches the focused positioning specialist will run for this brand"""
+    brand = brand_info.get("brand", "")
+    product = brand_info.get("product", "")
+    queries = []
+    for tool in (focused_tools.CompetitorGapTool(), focused_tools.PositioningOpportunityTool()):
+        queries.extend(tool.build_queries(brand, product))
+    return focused_tools.search_params(queries)
+
+def start_intelligence_prefetch(brand_info: dict) -> SearchPrefetch:
+    """Warm the search store for the full / quick intelligence workflows"""
+    return prefetch_searches(intelligence_search_params(brand_info))
+
+def start_focused_prefetch(brand_info: dict) -> SearchPrefetch:
+    """Warm the search store for the focused positioning workflow"""
+    return prefetch_searches(focused_search_params(brand_info))
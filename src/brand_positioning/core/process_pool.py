@@ -0,0 +1,191 @@
+"""
+Process-pool backend for analyses.
+CrewAI's output parsing, prompt templating and pydantic validation hold the GIL, so
+analyses running on threads of one server process contend for a single core. With
+ANALYSIS_EXECUTOR=process each analysis runs in a pre-started worker process whose
+imports are already warm, and its result comes back as a plain JSON-serializable dict.
+Progress updates, streamed partial results and cancellation cross the process
+boundary through a manager queue and event per analysis. Workers copy the environment
+when they start, so the API credentials are sent along with every analysis.
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+THREAD = "thread"
+PROCESS = "process"
+EXECUTOR_BACKENDS = (THREAD, PROCESS)
+
+# Loaded once by the fork server (or by each spawned worker) instead of by every analysis
+WARM_MODULES = [
+    "brand_positioning.core.focused_workflow",
+    "brand_positioning.core.parallel_crews"
+]
+
+
+def executor_backend() -> str:
+    """Configured backend for running analyses, falling back to threads"""
+    backend = Config.ANALYSIS_EXECUTOR
+    if backend not in EXECUTOR_BACKENDS:
+        logger.warning(f"Unknown ANALYSIS_EXECUTOR {backend!r}; running analyses on threads")
+        return THREAD
+    return backend
+
+
+def to_serializable(result: Any) -> Any:
+    """Only plain JSON types, so a result can cross processes and be stored as-is"""
+    return json.loads(json.dumps(result, default=str))
+
+
+def _warm_worker(workers: int, modules: list):
+    """Worker initializer: import the workflows and take a share of the API rate limits"""
+    for module in modules:
+        importlib.import_module(module)
+
+    # Each process has its own limiters; together they stay within the configured rates
+    Config.REQUESTS_PER_MINUTE = Config.REQUESTS_PER_MINUTE / workers
+    Config.LLM_REQUESTS_PER_MINUTE = Config.LLM_REQUESTS_PER_MINUTE / workers
+
+
+def current_credentials() -> Dict[str, Optional[str]]:
+    """This process's API keys, model and endpoint; keys entered in the UI are only in the environment"""
+    return {
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY") or Config.OPENAI_API_KEY,
+        "SERP_API_KEY": os.getenv("SERP_API_KEY") or Config.SERP_API_KEY,
+        "OPENAI_MODEL": Config.OPENAI_MODEL,
+        "OPENAI_BASE_URL": Config.OPENAI_BASE_URL
+    }
+
+
+def _apply_credentials(credentials: Dict[str, Optional[str]]):
+    """Worker side: switch to the parent's credentials, dropping agents built for the old ones"""
+    if all(getattr(Config, name) == value for name, value in credentials.items()):
+        return
+
+    from brand_positioning.agents.pool import get_agent_pool
+    for name, value in credentials.items():
+        setattr(Config, name, value)
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    get_agent_pool().clear()
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def _run_analysis(workflow: Callable, brand_info: dict, options: dict, events, cancelled,
+                  credentials: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Runs in a worker: the workflow with callbacks that report back to the parent"""
+    from brand_positioning.core.jobs import JobCancelled
+    _apply_credentials(credentials)
+
+    def status_callback(message, progress=None):
+        if cancelled.is_set():
+            raise JobCancelled()
+        events.put(("status", message, progress))
+
+    if options.pop("stream", False):
+        options["stream_callback"] = lambda partial: events.put(("partial", to_serializable(partial)))
+    if options.pop("cancellable", False):
+        options["cancel_event"] = cancelled
+
+    return to_serializable(workflow(brand_info, status_callback=status_callback, **options))
+
+
+class AnalysisProcessPool:
+    """Pre-started worker processes that run whole analyses and return their result dicts"""
+
+    def __init__(self, max_workers: int, warm_modules: Optional[list] = None):
+        self.max_workers = max_workers
+        warm_modules = WARM_MODULES if warm_modules is None else warm_modules
+
+        # A fork server imports the workflows once and forks warm, single-threaded workers from it;
+        # forking the server process itself would copy its locks and HTTP clients mid-use
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(warm_modules)
+        else:
+            context = multiprocessing.get_context("spawn")
+
+        self._manager = context.Manager()
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context,
+            initializer=_warm_worker, initargs=(max_workers, warm_modules)
+        )
+        # Start every worker now so the first analyses don't pay for process start-up
+        for _ in range(max_workers):
+            self._executor.submit(_ready)
+
+    def run(self, workflow: Callable, brand_info: dict, status_callback=None, **options) -> Dict[str, Any]:
+        """Run workflow (a module-level function) in a worker and wait for its result
+
+        Takes the same arguments as the workflows. status_callback and stream_callback are
+        called on this thread; an exception from status_callback (e.g. JobCancelled) stops
+        the worker's analysis at its next progress update and is re-raised here. A cancel_event
+        set here is passed on to the worker's cancel_event.
+        """
+        stream_callback = options.pop("stream_callback", None)
+        options["stream"] = stream_callback is not None
+        cancel_event = options.pop("cancel_event", None)
+        options["cancellable"] = cancel_event is not None
+        events = self._manager.Queue()
+        cancelled = self._manager.Event()
+        future = self._executor.submit(
+            _run_analysis, workflow, brand_info, options, events, cancelled, current_credentials()
+        )
+
+        try:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled.set()
+                try:
+                    event = events.get(timeout=0.1)
+                except queue.Empty:
+                    # Events are queued before the worker returns, so an empty queue here means all are seen
+                    if future.done():
+                        break
+                    continue
+
+                if event[0] == "partial":
+                    if stream_callback:
+                        stream_callback(event[1])
+                elif status_callback:
+                    status_callback(event[1], event[2])
+        except BaseException:
+            cancelled.set()
+            raise
+
+        return future.result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers and the manager process"""
+        self._executor.shutdown(wait=wait)
+        self._manager.shutdown()
+
+
+_pool: Optional[AnalysisProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> AnalysisProcessPool:
+    """Get the process-wide analysis pool (PROCESS_POOL_WORKERS workers, default one per core)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = Config.PROCESS_POOL_WORKERS or os.cpu_count() or 1
+            _pool = AnalysisProcessPool(workers)
+            logger.info(f"Analysis process pool started with {workers} workers")
+        return _pool
@@ -0,0 +1,165 @@
+"""
+Persistent store of completed analyses.
+Results are indexed by a normalized fingerprint of brand_info and the analysis
+mode, so a brand analyzed recently can be served instantly instead of re-run.
+Intermediate stages (intelligence domains, positioning, actions) are stored with
+a hash of their inputs so incremental analyses can skip the ones that are unchanged.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(brand_info: dict, mode: str) -> str:
+    """Stable identity of an analysis: the normalized brand fields plus the mode"""
+    fields = [" ".join(str(brand_info.get(name, "")).lower().split()) for name in ("brand", "product", "target")]
+    return hashlib.sha256(json.dumps([mode, *fields]).encode("utf-8")).hexdigest()
+
+
+class ResultStore:
+    """SQLite-backed history of analysis results, newest first per fingerprint"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fingerprint TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                brand_info TEXT NOT NULL,
+                result TEXT NOT NULL,
+                evidence TEXT,
+                created_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_results_fingerprint ON results(fingerprint, created_at)"
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS stages (
+                fingerprint TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                input_hash TEXT NOT NULL,
+                output TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (fingerprint, stage)
+            )"""
+        )
+        self._conn.commit()
+
+    def save(self, brand_info: dict, mode: str, result: Dict[str, Any]) -> int:
+        """Store a completed result together with the evidence it was built from"""
+        evidence = result.get("evidence")
+        with self._lock:
+            cursor = self._conn.execute(
+                """INSERT INTO results (fingerprint, mode, brand_info, result, evidence, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (
+                    fingerprint(brand_info, mode),
+                    mode,
+                    json.dumps(brand_info),
+                    json.dumps(result, default=str),
+                    json.dumps(evidence) if evidence is not None else None,
+                    time.time()
+                )
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def _records(self, brand_info: dict, mode: str, limit: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT id, fingerprint, mode, brand_info, result, evidence, created_at FROM results
+                   WHERE fingerprint = ? ORDER BY created_at DESC LIMIT ?""",
+                (fingerprint(brand_info, mode), limit)
+            ).fetchall()
+
+        now = time.time()
+        records = []
+        for row in rows:
+            record = dict(zip(["id", "fingerprint", "mode", "brand_info", "result", "evidence", "created_at"], row))
+            record["brand_info"] = json.loads(record["brand_info"])
+            record["result"] = json.loads(record["result"])
+            record["evidence"] = json.loads(record["evidence"]) if record["evidence"] else None
+            record["age_hours"] = round((now - record["created_at"]) / 3600, 2)
+            records.append(record)
+        return records
+
+    def latest(self, brand_info: dict, mode: str, max_age_hours: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Most recent result for this brand and mode, or None if there is none younger than max_age_hours"""
+        records = self._records(brand_info, mode, limit=1)
+        if not records:
+            return None
+        if max_age_hours is not None and records[0]["age_hours"] > max_age_hours:
+            return None
+        return records[0]
+
+    def history(self, brand_info: dict, mode: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Past results for this brand and mode, newest first"""
+        return self._records(brand_info, mode, limit)
+
+    def save_stage(self, brand_info: dict, stage: str, input_hash: str, output: str, mode: str = "full"):
+        """Store the latest output of one analysis stage with the hash of the inputs it was built from"""
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO stages (fingerprint, stage, input_hash, output, created_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (fingerprint(brand_info, mode), stage, input_hash, output, time.time())
+            )
+            self._conn.commit()
+
+    def latest_stage(self, brand_info: dict, stage: str, mode: str = "full") -> Optional[Dict[str, Any]]:
+        """Latest stored output of a stage for this brand, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT input_hash, output, created_at FROM stages WHERE fingerprint = ? AND stage = ?",
+                (fingerprint(brand_info, mode), stage)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return {
+            "stage": stage,
+            "input_hash": row[0],
+            "output": row[1],
+            "created_at": row[2],
+            "age_hours": round((time.time() - row[2]) / 3600, 2)
+        }
+
+
+_store: Optional[ResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_result_store() -> Optional[ResultStore]:
+    """Get the process-wide result store, or None when disabled"""
+    global _store
+    if not Config.RESULT_STORE_ENABLED:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            path = os.path.join(Config.DATA_DIR, "results.sqlite3")
+            try:
+                _store = ResultStore(path)
+                logger.info(f"Result store opened at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"Result store unavailable: {e}")
+                return None
+        return _store
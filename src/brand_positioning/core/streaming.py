@@ -0,0 +1,53 @@
+"""
+Incremental delivery of strategy and action output while the crews run.
+Tokens streamed by the agents' LLMs are accumulated per stage and pushed to the
+caller as a partial result dict, throttled so the UI isn't redrawn per token.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict
+
+# CrewAI agents reason before answering; only the answer is worth showing
+_FINAL_ANSWER = "Final Answer:"
+
+
+class PartialResultStream:
+    """Accumulates streamed text per result key and publishes throttled partial results"""
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], None], base_result: Dict[str, Any],
+                 min_interval: float = 0.25):
+        self.callback = callback
+        self.result = dict(base_result)
+        self.min_interval = min_interval
+        self._buffers: Dict[str, str] = {}
+        self._last_push = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, **fields):
+        """Set completed fields (e.g. the finished positioning strategy) and publish"""
+        with self._lock:
+            self.result.update(fields)
+        self.flush()
+
+    def token_callback(self, key: str) -> Callable[[str], None]:
+        """Callback for AgentLLM.token_callback that streams into result[key]"""
+        def on_token(chunk: str):
+            with self._lock:
+                self._buffers[key] = self._buffers.get(key, "") + chunk
+                text = self._buffers[key]
+                if _FINAL_ANSWER in text:
+                    text = text.rsplit(_FINAL_ANSWER, 1)[1].lstrip()
+                self.result[key] = text
+                self.result["streaming"] = key
+                due = time.monotonic() - self._last_push >= self.min_interval
+            if due:
+                self.flush()
+        return on_token
+
+    def flush(self):
+        """Publish the current partial result"""
+        with self._lock:
+            self._last_push = time.monotonic()
+            snapshot = dict(self.result)
+        self.callback(snapshot)
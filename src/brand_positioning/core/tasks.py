@@ -160,6 +160,47 @@ def create_positioning_strategy_task(brand_info: dict, intelligence_data=None):
         """
     )
 
+DOMAIN_LABELS = {
+    "competitor_analysis": "competitor analysis",
+    "customer_insights": "customer insights",
+    "market_trends": "market trends"
+}
+
+def create_domain_digest_task(brand_info: dict, domain: str, findings: str):
+    """Create task digesting one intelligence domain for positioning while the others are still researched"""
+    brand_name = brand_info.get("brand", "")
+    product = brand_info.get("product", "")
+    target = brand_info.get("target", "")
+    label = DOMAIN_LABELS.get(domain, domain.replace("_", " "))
+    
+    return Task(
+        description=f"""
+        You are preparing the {label} input for {brand_name}'s positioning strategy.
+        The other research is still in progress; digest only these findings.
+        
+        Brand Information:
+        - Brand: {brand_name}
+        - Product: {product}
+        - Target Audience: {target}
+        
+        {label.upper()} FINDINGS:
+        {findings}
+        
+        Extract what matters for positioning {brand_name}:
+        1. The specific facts that constrain or open up a position (names, figures, quotes)
+        2. The gaps or opportunities they reveal
+        3. The customer or competitor language worth reusing in messaging
+        
+        Keep every figure, quote, competitor name and source URL exactly as found. Drop everything else.
+        """,
+        expected_output=f"""
+        {label.title()} digest for positioning:
+        
+        - 6-10 bullet points, each a specific finding with its evidence and source
+        - 2-3 bullet points on the positioning opportunities these findings reveal for {brand_name}
+        """
+    )
+
 def create_strategic_action_task(brand_info: dict, positioning_data=None):
     """Create task for strategic action planning"""
     brand_name = brand_info.get("brand", "")
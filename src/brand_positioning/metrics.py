@@ -0,0 +1,227 @@
+"""
+Per-analysis instrumentation.
+A MetricsRecorder collects spans for SerpAPI calls, LLM calls, crew kickoffs and
+orchestrator stages (wall time, queue wait, tokens in and out) plus counters for
+cache hits. It is summarized into the `metrics` block of each result and can be
+exported as trace spans.
+
+Crew tasks run on threads that do not inherit context variables, so a recorder is
+bound onto agents' LLMs and tools for each run; code below them (the search
+client) picks it up from the active context.
+"""
+
+import contextvars
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+SERP = "serp"
+LLM = "llm"
+KICKOFF = "kickoff"
+STAGE = "stage"
+
+_current_recorder: contextvars.ContextVar = contextvars.ContextVar("metrics_recorder", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("metrics_span", default=None)
+
+
+class MetricsRecorder:
+    """Thread-safe collection of spans and counters for one analysis"""
+
+    def __init__(self):
+        self.trace_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self._spans: List[Dict[str, Any]] = []
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, kind: str, name: str, **attributes):
+        """Time a block; the yielded dict's attributes can be filled in (tokens, queue wait) before it ends"""
+        parent = _current_span.get()
+        record = {
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": parent["span_id"] if parent and parent["trace_id"] == self.trace_id else None,
+            "trace_id": self.trace_id,
+            "kind": kind,
+            "name": name,
+            "start": time.time(),
+            "status": "ok",
+            "attributes": dict(attributes)
+        }
+        token = _current_span.set(record)
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["status"] = "error"
+            record["attributes"]["error"] = str(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            record["duration"] = time.perf_counter() - started
+            with self._lock:
+                self._spans.append(record)
+
+    def count(self, name: str, value: int = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate spans into the `metrics` block of a result"""
+        spans = self.spans()
+        with self._lock:
+            counters = dict(self._counters)
+
+        def totals(kind: str) -> Dict[str, Any]:
+            selected = [s for s in spans if s["kind"] == kind]
+            return {
+                "calls": len(selected),
+                "errors": sum(1 for s in selected if s["status"] == "error"),
+                "wall_seconds": round(sum(s["duration"] for s in selected), 3),
+                "max_seconds": round(max((s["duration"] for s in selected), default=0.0), 3),
+                "queue_wait_seconds": round(sum(s["attributes"].get("queue_wait", 0.0) for s in selected), 3)
+            }
+
+        serp = totals(SERP)
+        serp.update({
+            "cache_hits": counters.get("serp_cache_hits", 0),
+            "prefetch_hits": counters.get("serp_prefetch_hits", 0),
+            "coalesced": counters.get("serp_coalesced", 0)
+        })
+
+        llm_spans = [s for s in spans if s["kind"] == LLM]
+        llm = totals(LLM)
+        llm.update({
+            "tokens_in": sum(s["attributes"].get("tokens_in", 0) for s in llm_spans),
+            "tokens_out": sum(s["attributes"].get("tokens_out", 0) for s in llm_spans),
+            "cache_hits": counters.get("llm_cache_hits", 0)
+        })
+
+        stages = {}
+        for s in spans:
+            if s["kind"] == STAGE:
+                stages[s["name"]] = round(stages.get(s["name"], 0.0) + s["duration"], 3)
+
+        serp_cost = serp["calls"] * Config.SERPAPI_COST_PER_SEARCH
+        llm_cost = sum(_llm_cost(s["attributes"]) for s in llm_spans)
+        return {
+            "trace_id": self.trace_id,
+            "wall_seconds": round(time.perf_counter() - self._started, 3),
+            "stages": stages,
+            "serp": serp,
+            "llm": llm,
+            "kickoffs": totals(KICKOFF),
+            "cost_usd": {
+                "serp": round(serp_cost, 4),
+                "llm": round(llm_cost, 4),
+                "total": round(serp_cost + llm_cost, 4)
+            }
+        }
+
+    def export_spans(self) -> List[Dict[str, Any]]:
+        """Spans in OTLP/JSON shape (times in unix nanoseconds), oldest first"""
+        exported = []
+        for s in sorted(self.spans(), key=lambda span: span["start"]):
+            start_ns = int(s["start"] * 1e9)
+            attributes = {"kind": s["kind"], **s["attributes"]}
+            exported.append({
+                "traceId": s["trace_id"],
+                "spanId": s["span_id"],
+                "parentSpanId": s["parent_id"] or "",
+                "name": f"{s['kind']}:{s['name']}",
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(start_ns + int(s["duration"] * 1e9)),
+                "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in sorted(attributes.items())],
+                "status": {"code": "STATUS_CODE_ERROR" if s["status"] == "error" else "STATUS_CODE_OK"}
+            })
+        return exported
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_payload(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap exported spans in an OTLP/HTTP JSON request body for any OpenTelemetry collector"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "brand-positioning"}}]},
+            "scopeSpans": [{"scope": {"name": "brand_positioning"}, "spans": spans}]
+        }]
+    }
+
+
+def _llm_cost(attributes: Dict[str, Any]) -> float:
+    """USD cost of one completion from litellm's price table (0 for unknown models)"""
+    try:
+        import litellm
+        prompt_cost, completion_cost = litellm.cost_per_token(
+            model=attributes.get("model", ""),
+            prompt_tokens=attributes.get("tokens_in", 0),
+            completion_tokens=attributes.get("tokens_out", 0)
+        )
+        return prompt_cost + completion_cost
+    except Exception:
+        return 0.0
+
+
+def current_recorder() -> Optional[MetricsRecorder]:
+    return _current_recorder.get()
+
+
+@contextmanager
+def activate(recorder: Optional[MetricsRecorder]):
+    """Make recorder the active one for this context; None leaves the current one in place"""
+    if recorder is None:
+        yield current_recorder()
+        return
+    token = _current_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current_recorder.reset(token)
+
+
+@contextmanager
+def span(kind: str, name: str, recorder: Optional[MetricsRecorder] = None, **attributes):
+    """Span on recorder (or the active one); a no-op when neither exists"""
+    recorder = recorder or current_recorder()
+    if recorder is None:
+        yield {"attributes": dict(attributes)}
+        return
+    with recorder.span(kind, name, **attributes) as record:
+        yield record
+
+
+def count(name: str, value: int = 1, recorder: Optional[MetricsRecorder] = None):
+    recorder = recorder or current_recorder()
+    if recorder is not None:
+        recorder.count(name, value)
+
+
+def bind_metrics(agents, recorder: Optional[MetricsRecorder]):
+    """Attach recorder to these agents' LLMs and tools, which run on threads outside the caller's context"""
+    for agent in agents:
+        llm = getattr(agent, "llm", None)
+        if hasattr(llm, "metrics"):
+            llm.metrics = recorder
+        for tool in getattr(agent, "tools", None) or []:
+            if hasattr(tool, "metrics"):
+                tool.metrics = recorder
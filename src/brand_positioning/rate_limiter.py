@@ -0,0 +1,86 @@
+"""
+Process-wide rate limiting for outbound API calls.
+One bucket for SerpAPI and one for LLM calls, shared by every crew and thread.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+from brand_positioning.config import Config
+
+
+class TokenBucket:
+    """Thread-safe token bucket: callers block only when the budget is exhausted
+    
+    A rate of 0 means unlimited.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute < 0:
+            raise ValueError(f"Rate must be positive, or 0 for unlimited: {rate_per_minute}")
+        self.unlimited = rate_per_minute == 0
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else max(1.0, rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available; otherwise return the seconds to wait before retrying"""
+        if self.unlimited:
+            return 0.0
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate_per_second
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns the total time spent waiting"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Await until tokens are available without blocking the event loop"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+_serp_limiter: Optional[TokenBucket] = None
+_llm_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_serp_limiter() -> TokenBucket:
+    """Get the shared limiter every SerpAPI request goes through"""
+    global _serp_limiter
+    with _limiter_lock:
+        if _serp_limiter is None:
+            _serp_limiter = TokenBucket(Config.REQUESTS_PER_MINUTE)
+        return _serp_limiter
+
+
+def get_llm_limiter() -> TokenBucket:
+    """Get the shared limiter every LLM completion goes through"""
+    global _llm_limiter
+    with _limiter_lock:
+        if _llm_limiter is None:
+            _llm_limiter = TokenBucket(Config.LLM_REQUESTS_PER_MINUTE)
+        return _llm_limiter
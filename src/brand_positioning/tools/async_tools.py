@@ -0,0 +1,81 @@
+"""
+Asyncio variants of the research tools.
+Same names, queries and output as the blocking tools, but every search runs on
+one shared search loop through its non-blocking, keep-alive search client.
+"""
+
+import json
+from brand_positioning.tools.tools import (
+    CompetitorResearchTool,
+    CustomerInsightTool,
+    MarketTrendTool,
+    format_results,
+    search_params
+)
+from brand_positioning.tools.focused_tools import (
+    CompetitorGapTool,
+    PositioningOpportunityTool,
+    search_params as focused_search_params
+)
+from brand_positioning.tools.search_client import search_many_shared
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncCompetitorResearchTool(CompetitorResearchTool):
+    async def _run(self, query: str) -> str:
+        """Search for competitors without blocking the event loop"""
+        try:
+            batch_results = await search_many_shared(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "competitor", self.evidence_index)
+        except Exception as e:
+            logger.error(f"Competitor research error: {e}")
+            return json.dumps({"error": str(e), "results": []})
+
+class AsyncCustomerInsightTool(CustomerInsightTool):
+    async def _run(self, query: str) -> str:
+        """Search for customer insights without blocking the event loop"""
+        try:
+            batch_results = await search_many_shared(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "customer", self.evidence_index)
+        except Exception as e:
+            logger.error(f"Customer insight error: {e}")
+            return json.dumps({"error": str(e), "results": []})
+
+class AsyncMarketTrendTool(MarketTrendTool):
+    async def _run(self, query: str) -> str:
+        """Search for market trends without blocking the event loop"""
+        try:
+            batch_results = await search_many_shared(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "trend", self.evidence_index)
+        except Exception as e:
+            logger.error(f"Market trend error: {e}")
+            return json.dumps({"error": str(e), "results": []})
+
+class AsyncCompetitorGapTool(CompetitorGapTool):
+    async def _run(self, brand: str, product: str = "") -> str:
+        """Research the brand's competitive landscape without blocking the event loop"""
+        try:
+            queries = self.build_queries(brand, product)
+            batch_results = await search_many_shared(focused_search_params(queries), metrics=self.metrics)
+            return self.format_results(brand, batch_results)
+        except Exception as e:
+            logger.error(f"Competitor gap research failed: {str(e)}")
+            return json.dumps({
+                "error": f"Gap research failed: {str(e)}",
+                "query": f"{brand} {product}"
+            })
+
+class AsyncPositioningOpportunityTool(PositioningOpportunityTool):
+    async def _run(self, brand: str, product: str = "") -> str:
+        """Find positioning opportunities without blocking the event loop"""
+        try:
+            queries = self.build_queries(brand, product)
+            batch_results = await search_many_shared(focused_search_params(queries), metrics=self.metrics)
+            return self.format_results(brand, batch_results)
+        except Exception as e:
+            logger.error(f"Opportunity research failed: {str(e)}")
+            return json.dumps({
+                "error": f"Opportunity research failed: {str(e)}",
+                "query": f"{brand} {product}"
+            })
@@ -0,0 +1,124 @@
+"""
+Per-analysis index of search evidence.
+The market intelligence tools often surface the same pages (G2, Reddit, review
+sites) for competitor, customer and trend queries. The index lets each tool
+return only new evidence and refer to anything already seen by a short ID,
+which keeps duplicate snippets out of the LLM context. An index is scoped to one
+LLM context (one crew); the orchestrator merges them for the analysis's evidence list.
+"""
+
+import re
+import threading
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that identify a click, not a page
+_TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "ref", "ref_src", "source", "srsltid"}
+_HOST_PREFIXES = ("www.", "m.", "amp.")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different links to the same page compare equal"""
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+
+    path = re.sub(r"/+", "/", parts.path).rstrip("/") or "/"
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ]
+    query_string = urlencode(sorted(query))
+
+    # Scheme and fragment are dropped: http/https and #anchors are the same evidence
+    return f"{host}{path}" + (f"?{query_string}" if query_string else "")
+
+
+def _shingles(text: str, size: int = 3) -> Set[Tuple[str, ...]]:
+    words = re.findall(r"[a-z0-9]+", (text or "").lower())
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class EvidenceIndex:
+    """Thread-safe evidence registry keyed by canonical URL with near-duplicate snippet detection"""
+
+    def __init__(self, similarity_threshold: float = 0.8):
+        self.similarity_threshold = similarity_threshold
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.duplicates = 0
+        self._by_url: Dict[str, str] = {}
+        self._snippet_shingles: List[Tuple[str, Set[Tuple[str, ...]]]] = []
+        self._lock = threading.Lock()
+
+    def _find_near_duplicate(self, shingles: Set[Tuple[str, ...]]) -> Optional[str]:
+        if not shingles:
+            return None
+        for evidence_id, seen in self._snippet_shingles:
+            overlap = len(shingles & seen) / len(shingles | seen)
+            if overlap >= self.similarity_threshold:
+                return evidence_id
+        return None
+
+    def add(self, result: Dict[str, Any], source: str) -> Tuple[str, bool]:
+        """Register a search result; returns (evidence_id, is_new)"""
+        url = canonical_url(result.get("link", ""))
+        snippet = result.get("snippet", "")
+        shingles = _shingles(snippet)
+
+        with self._lock:
+            evidence_id = self._by_url.get(url) if url else None
+            if evidence_id is None:
+                evidence_id = self._find_near_duplicate(shingles)
+
+            if evidence_id is not None:
+                self.duplicates += 1
+                self.items[evidence_id]["sources"].add(source)
+                if url:
+                    self._by_url.setdefault(url, evidence_id)
+                return evidence_id, False
+
+            evidence_id = f"E{len(self.items) + 1}"
+            self.items[evidence_id] = {
+                "id": evidence_id,
+                "title": result.get("title", ""),
+                "snippet": snippet,
+                "link": result.get("link", ""),
+                "sources": {source}
+            }
+            if url:
+                self._by_url[url] = evidence_id
+            if shingles:
+                self._snippet_shingles.append((evidence_id, shingles))
+            return evidence_id, True
+
+    def merge(self, other: "EvidenceIndex"):
+        """Fold another index's evidence into this one (IDs are reassigned in this index)"""
+        for item in other.export():
+            evidence_id, _ = self.add(item, item["sources"][0])
+            with self._lock:
+                self.items[evidence_id]["sources"].update(item["sources"])
+        with self._lock:
+            self.duplicates += other.duplicates
+
+    def export(self) -> List[Dict[str, Any]]:
+        """Every unique piece of evidence as JSON-serializable dicts, in ID order"""
+        with self._lock:
+            return [
+                {**item, "sources": sorted(item["sources"])}
+                for item in self.items.values()
+            ]
+
+    def stats(self) -> Dict[str, int]:
+        """Unique evidence count and how many duplicates were suppressed"""
+        with self._lock:
+            return {"unique_evidence": len(self.items), "duplicates_suppressed": self.duplicates}
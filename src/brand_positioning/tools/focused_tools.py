@@ -3,61 +3,68 @@ Focused tools for finding positioning opportunities with minimal API usage.
 """
 
 import json
-import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from crewai.tools import BaseTool
-from serpapi import GoogleSearch
 from brand_positioning.config import Config
+from brand_positioning.metrics import MetricsRecorder
+from brand_positioning.tools.search_client import search_many
 import logging
 
 logger = logging.getLogger(__name__)
 
+def search_params(search_queries: List[str]) -> List[Dict[str, Any]]:
+    """Build SerpAPI parameters for a batch of focused queries"""
+    return [
+        {
+            "q": search_query,
+            "api_key": Config.SERP_API_KEY,
+            "num": 5  # Only 5 results per search
+        }
+        for search_query in search_queries
+    ]
+
+def top_results(batch_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the top 3 organic results from each search"""
+    all_results = []
+    for results in batch_results:
+        if "organic_results" in results:
+            all_results.extend(results["organic_results"][:3])  # Only top 3 from each
+    return all_results
+
 class CompetitorGapTool(BaseTool):
     name: str = "Competitor Gap Research"
     description: str = "Research specific brand's current positioning and direct competitors (2 API calls max)"
+    metrics: Optional[MetricsRecorder] = None  # Recorder of the analysis this tool is running for
+
+    def build_queries(self, brand: str, product: str = "") -> List[str]:
+        """Brand-specific searches to understand CURRENT positioning"""
+        return [
+            f'"{brand}" brand positioning strategy current website',
+            f'"{brand}" competitors direct alternatives similar companies'
+        ]
+
+    def format_results(self, brand: str, batch_results: List[Dict[str, Any]]) -> str:
+        """Format search results for positioning analysis"""
+        competitor_insights = []
+        for result in top_results(batch_results):
+            competitor_insights.append({
+                "title": result.get("title", ""),
+                "positioning_clue": result.get("snippet", "")
+            })
+
+        return json.dumps({
+            "query": f"{brand} competitors",
+            "competitor_count": len(competitor_insights),
+            "positioning_clues": competitor_insights
+        })
 
     def _run(self, brand: str, product: str = "") -> str:
         """Research the actual brand and its specific competitive landscape"""
         try:
-            # Use direct parameters instead of parsing JSON
-            brand_name = brand
-            brand_data = {"brand": brand, "product": product}
-            
-            # Brand-specific searches to understand CURRENT positioning
-            search_queries = [
-                f'"{brand_name}" brand positioning strategy current website',
-                f'"{brand_name}" competitors direct alternatives similar companies'
-            ]
-            
-            all_results = []
-            for search_query in search_queries:
-                logger.info(f"Gap research: {search_query}")
-                search = GoogleSearch({
-                    "q": search_query,
-                    "api_key": Config.SERP_API_KEY,
-                    "num": 5  # Only 5 results per search
-                })
-                results = search.get_dict()
-                
-                if "organic_results" in results:
-                    all_results.extend(results["organic_results"][:3])  # Only top 3 from each
-                
-                time.sleep(1)  # Rate limiting
-            
-            # Format for positioning analysis
-            competitor_insights = []
-            for result in all_results:
-                competitor_insights.append({
-                    "title": result.get("title", ""),
-                    "positioning_clue": result.get("snippet", "")
-                })
-            
-            return json.dumps({
-                "query": f"{brand_name} competitors",
-                "competitor_count": len(competitor_insights),
-                "positioning_clues": competitor_insights
-            })
-            
+            # Issue the batch concurrently; results come back in query order
+            batch_results = search_many(search_params(self.build_queries(brand, product)), metrics=self.metrics)
+            return self.format_results(brand, batch_results)
+
         except Exception as e:
             logger.error(f"Competitor gap research failed: {str(e)}")
             return json.dumps({
@@ -66,54 +73,53 @@ class CompetitorGapTool(BaseTool):
             })
 
 class PositioningOpportunityTool(BaseTool):
-    name: str = "Positioning Opportunity Finder" 
+    name: str = "Positioning Opportunity Finder"
     description: str = "Find brand-specific positioning gaps and strategic opportunities (2 API calls max)"
+    metrics: Optional[MetricsRecorder] = None  # Recorder of the analysis this tool is running for
+
+    def build_queries(self, brand: str, product: str = "") -> List[str]:
+        """Brand-specific opportunity searches"""
+        return [
+            f'"{brand}" customer reviews complaints pain points problems',
+            f'"{brand}" {product} market gaps underserved segments opportunities'
+        ]
+
+    def format_results(self, brand: str, batch_results: List[Dict[str, Any]]) -> str:
+        """Format search results for opportunity analysis"""
+        opportunities = []
+        for result in top_results(batch_results):
+            opportunities.append({
+                "title": result.get("title", ""),
+                "opportunity_insight": result.get("snippet", "")
+            })
+
+        return json.dumps({
+            "query": f"{brand} opportunities",
+            "opportunity_count": len(opportunities),
+            "strategic_insights": opportunities
+        })
 
     def _run(self, brand: str, product: str = "") -> str:
         """Find opportunities based on brand's current market position"""
         try:
-            # Use direct parameters instead of parsing JSON
-            brand_name = brand
-            brand_data = {"brand": brand, "product": product}
-            
-            # Brand-specific opportunity searches
-            search_queries = [
-                f'"{brand_name}" customer reviews complaints pain points problems',
-                f'"{brand_name}" {product} market gaps underserved segments opportunities'
-            ]
-            
-            all_results = []
-            for search_query in search_queries:
-                logger.info(f"Opportunity research: {search_query}")
-                search = GoogleSearch({
-                    "q": search_query,
-                    "api_key": Config.SERP_API_KEY,
-                    "num": 5  # Only 5 results per search
-                })
-                results = search.get_dict()
-                
-                if "organic_results" in results:
-                    all_results.extend(results["organic_results"][:3])  # Only top 3 from each
-                
-                time.sleep(1)  # Rate limiting
-            
-            # Format for opportunity analysis
-            opportunities = []
-            for result in all_results:
-                opportunities.append({
-                    "title": result.get("title", ""),
-                    "opportunity_insight": result.get("snippet", "")
-                })
-            
-            return json.dumps({
-                "query": f"{brand_name} opportunities",
-                "opportunity_count": len(opportunities),
-                "strategic_insights": opportunities
-            })
-            
+            batch_results = search_many(search_params(self.build_queries(brand, product)), metrics=self.metrics)
+            return self.format_results(brand, batch_results)
+
         except Exception as e:
             logger.error(f"Opportunity research failed: {str(e)}")
             return json.dumps({
                 "error": f"Opportunity research failed: {str(e)}",
                 "query": f"{brand} {product}"
-            })
\ No newline at end of file
+            })
+
+def gather_focused_research(brand: str, product: str = "", metrics: Optional[MetricsRecorder] = None) -> str:
+    """Run both focused tools' searches as one batch, for tasks that get the research up front"""
+    research_tools = (CompetitorGapTool(), PositioningOpportunityTool())
+    queries = [tool.build_queries(brand, product) for tool in research_tools]
+    all_queries = [search_query for tool_queries in queries for search_query in tool_queries]
+    batch_results = search_many(search_params(all_queries), metrics=metrics)
+    research = {}
+    for tool, tool_queries in zip(research_tools, queries):
+        research[tool.name] = json.loads(tool.format_results(brand, batch_results[:len(tool_queries)]))
+        batch_results = batch_results[len(tool_queries):]
+    return json.dumps(research, indent=2)
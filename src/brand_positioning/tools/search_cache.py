@@ -0,0 +1,162 @@
+"""
+Persistent SerpAPI response cache shared by all research tools.
+Responses are content-addressed by their search parameters and kept in SQLite.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+from brand_positioning.config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Parameters that never change the search response and must not leak into keys
+_IGNORED_PARAMS = {"api_key"}
+
+
+class SearchCache:
+    """SQLite-backed response cache with TTL expiry and size-bounded LRU eviction"""
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.saved_seconds = 0.0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                fetch_seconds REAL NOT NULL DEFAULT 0
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_access ON search_cache(last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Build a stable content address from the search parameters"""
+        relevant = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS}
+        payload = json.dumps(relevant, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for these parameters, or None on a miss"""
+        key = self.make_key(params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at, fetch_seconds FROM search_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, created_at, fetch_seconds = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            self.saved_seconds += fetch_seconds
+
+        return json.loads(response)
+
+    def set(self, params: Dict[str, Any], response: Dict[str, Any], fetch_seconds: float = 0.0):
+        """Store a response and evict least recently used entries beyond the size bound"""
+        key = self.make_key(params)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO search_cache
+                   (key, response, created_at, last_access, fetch_seconds)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (key, json.dumps(response), now, now, fetch_seconds)
+            )
+
+            count = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """DELETE FROM search_cache WHERE key IN (
+                        SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?
+                    )""",
+                    (overflow,)
+                )
+                self.evictions += overflow
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the latency and quota saved by cache hits"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": entries,
+                "evictions": self.evictions,
+                "serp_calls_saved": self.hits,
+                "seconds_saved": round(self.saved_seconds, 2)
+            }
+
+
+_cache: Optional[SearchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Get the process-wide search cache, or None when caching is disabled"""
+    global _cache
+    if not Config.SEARCH_CACHE_ENABLED:
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            path = os.path.join(Config.DATA_DIR, "serp_cache.sqlite3")
+            try:
+                _cache = SearchCache(
+                    path,
+                    ttl_seconds=Config.SEARCH_CACHE_TTL_HOURS * 3600,
+                    max_entries=Config.SEARCH_CACHE_MAX_ENTRIES
+                )
+                logger.info(f"Search cache opened at {path}")
+            except sqlite3.Error as e:
+                logger.error(f"Search cache unavailable: {e}")
+                return None
+        return _cache
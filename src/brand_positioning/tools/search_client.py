@@ -0,0 +1,428 @@
+"""
+Search client shared by all research tools.
+Every SerpAPI request goes through here so caching, request coalescing
+and rate limiting apply uniformly over one pooled keep-alive HTTP session.
+Async callers get the same pipeline on a non-blocking client per event loop;
+async tools share one long-lived search loop so their client stays warm.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, List, Any, Optional
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from brand_positioning.cassette import get_cassette
+from brand_positioning.config import Config
+from brand_positioning.metrics import SERP, activate, count, current_recorder, span
+from brand_positioning.rate_limiter import get_serp_limiter
+from brand_positioning.tools.search_cache import SearchCache, get_search_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SearchClient:
+    """SerpAPI client that reuses pooled keep-alive connections across all queries"""
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 30.0, max_retries: int = 2):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False  # Hand the final error body back to the caller
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a Google search and return the parsed JSON response"""
+        # Copy so callers' params (and cache keys derived from them) stay untouched
+        query = {"engine": "google", "output": "json", "source": "python", **params}
+        response = self.session.get(f"{self.base_url}/search", params=query, timeout=self.timeout)
+        try:
+            return response.json()
+        except ValueError:
+            return {"error": f"Invalid SerpAPI response (HTTP {response.status_code})"}
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
+
+_client: Optional[SearchClient] = None
+_client_lock = threading.Lock()
+
+
+def get_search_client() -> SearchClient:
+    """Get the process-wide pooled search client"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SearchClient(
+                Config.SERPAPI_BASE_URL,
+                pool_size=Config.SEARCH_POOL_SIZE,
+                timeout=Config.SEARCH_TIMEOUT_SECONDS,
+                max_retries=Config.SEARCH_MAX_RETRIES
+            )
+        return _client
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one in-flight execution"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn once per key at a time; concurrent callers wait for the same result"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            count("serp_coalesced")
+            return future.result()
+
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+_inflight = SingleFlight()
+
+
+def google_search(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a SerpAPI search, serving repeat queries from the persistent cache"""
+    warm = _warm_future(params)
+    if warm is not None:
+        logger.info(f"Search served from prefetch: {params.get('q')}")
+        count("serp_prefetch_hits")
+        return warm.result()
+
+    return _cached_search(params)
+
+
+def _cached_search(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache lookup, then one coalesced network request on a miss"""
+    cassette = get_cassette()
+    if cassette and cassette.replaying:
+        return cassette.replay_search(SearchCache.make_key(params), params.get("q", ""))
+
+    cache = get_search_cache()
+    if cache:
+        cached = cache.get(params)
+        if cached is not None:
+            logger.info(f"Search cache hit: {params.get('q')}")
+            count("serp_cache_hits")
+            _record(params, cached)
+            return cached
+
+    # Identical searches already in flight (other crews, sessions) share one request
+    return _inflight.do(SearchCache.make_key(params), lambda: _fetch(params, cache))
+
+
+def _fetch(params: Dict[str, Any], cache: Optional[SearchCache]) -> Dict[str, Any]:
+    """Issue the actual SerpAPI request under the shared rate limit"""
+    with span(SERP, params.get("q", "")) as record:
+        record["attributes"]["queue_wait"] = get_serp_limiter().acquire()
+
+        started = time.monotonic()
+        results = get_search_client().search(params)
+        elapsed = time.monotonic() - started
+        if "error" in results:
+            record["status"] = "error"
+
+    _record(params, results)
+
+    # Never cache failures (bad key, quota exhausted) so retries hit the API again
+    if cache and "error" not in results:
+        cache.set(params, results, elapsed)
+
+    return results
+
+
+def _record(params: Dict[str, Any], results: Dict[str, Any]):
+    """Capture a response (failures included) when recording a cassette"""
+    cassette = get_cassette()
+    if cassette and not cassette.replaying:
+        cassette.record_search(SearchCache.make_key(params), results)
+
+
+class SearchPrefetch:
+    """Warm store for an analysis's templated queries, fired before any agent asks for them"""
+
+    def __init__(self, params_list: List[Dict[str, Any]]):
+        self.keys: List[str] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(params_list), Config.SEARCH_POOL_SIZE)),
+            thread_name_prefix="serp-prefetch"
+        )
+
+        with _warm_lock:
+            for params in params_list:
+                key = SearchCache.make_key(params)
+                if key in self.keys:
+                    continue
+                entry = _warm.get(key)
+                if entry is None:
+                    # Another analysis may already be warming the same query
+                    # Run in the caller's context so the fetch is recorded against its analysis
+                    entry = _warm[key] = [
+                        self._executor.submit(contextvars.copy_context().run, _cached_search, params), 0
+                    ]
+                entry[1] += 1
+                self.keys.append(key)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Block until every prefetched search has finished"""
+        with _warm_lock:
+            futures = [_warm[key][0] for key in self.keys if key in _warm]
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Prefetch search failed: {e}")
+
+    def close(self):
+        """Release this analysis's hold on the warm store"""
+        with _warm_lock:
+            for key in self.keys:
+                entry = _warm.get(key)
+                if entry is not None:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        _warm.pop(key, None)
+            self.keys = []
+        self._executor.shutdown(wait=False)
+
+
+_warm: Dict[str, list] = {}
+_warm_lock = threading.Lock()
+
+
+def _warm_future(params: Dict[str, Any]) -> Optional[Future]:
+    """Prefetched (possibly still in-flight) result for these params, if any"""
+    with _warm_lock:
+        entry = _warm.get(SearchCache.make_key(params))
+        return entry[0] if entry else None
+
+
+def prefetch_searches(params_list: List[Dict[str, Any]]) -> SearchPrefetch:
+    """Start every search in the background; tools are served from the warm store"""
+    logger.info(f"Prefetching {len(params_list)} searches")
+    return SearchPrefetch(params_list)
+
+
+def log_batch(params_list: List[Dict[str, Any]]):
+    """Log a batch's queries once, as it is issued"""
+    queries = "; ".join(str(params.get("q")) for params in params_list)
+    logger.info(f"Searching {len(params_list)} queries: {queries}")
+
+
+def search_many(params_list: List[Dict[str, Any]], max_workers: Optional[int] = None,
+                metrics=None) -> List[Dict[str, Any]]:
+    """Run a batch of searches concurrently, returning results in input order
+
+    metrics is the recorder of the analysis these searches belong to (defaults to the active one).
+    """
+    log_batch(params_list)
+    with activate(metrics):
+        if len(params_list) <= 1:
+            return [google_search(params) for params in params_list]
+
+        workers = min(max_workers or Config.SEARCH_MAX_WORKERS, len(params_list))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serp") as executor:
+            # Each worker gets its own copy of the context so spans land on this analysis
+            futures = [executor.submit(contextvars.copy_context().run, google_search, params) for params in params_list]
+            return [future.result() for future in futures]
+
+
+class AsyncSearchClient:
+    """Non-blocking SerpAPI client; one instance serves every search on an event loop"""
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url: str, pool_size: int = 10, timeout: float = 30.0, max_retries: int = 2):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.inflight: Dict[str, asyncio.Task] = {}
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            transport=httpx.AsyncHTTPTransport(retries=max_retries)  # Connection-level retries
+        )
+
+    async def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a Google search and return the parsed JSON response"""
+        query = {"engine": "google", "output": "json", "source": "python", **params}
+        for attempt in range(self.max_retries + 1):
+            response = await self.client.get(f"{self.base_url}/search", params=query)
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                break
+            await asyncio.sleep(0.5 * (2 ** attempt))
+
+        try:
+            return response.json()
+        except ValueError:
+            return {"error": f"Invalid SerpAPI response (HTTP {response.status_code})"}
+
+    async def aclose(self):
+        """Release pooled connections"""
+        await self.client.aclose()
+
+
+_async_clients: Dict[asyncio.AbstractEventLoop, AsyncSearchClient] = {}
+
+
+@asynccontextmanager
+async def async_search_session():
+    """Share one non-blocking client across every search on the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is not None:
+        # An outer session already owns the client for this loop
+        yield client
+        return
+
+    client = AsyncSearchClient(
+        Config.SERPAPI_BASE_URL,
+        pool_size=Config.SEARCH_POOL_SIZE,
+        timeout=Config.SEARCH_TIMEOUT_SECONDS,
+        max_retries=Config.SEARCH_MAX_RETRIES
+    )
+    _async_clients[loop] = client
+    try:
+        yield client
+    finally:
+        _async_clients.pop(loop, None)
+        await client.aclose()
+
+
+async def google_search_async(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Non-blocking google_search: same prefetch store, cache, coalescing and rate limit"""
+    warm = _warm_future(params)
+    if warm is not None:
+        count("serp_prefetch_hits")
+        return await asyncio.wrap_future(warm)
+
+    cassette = get_cassette()
+    if cassette and cassette.replaying:
+        return cassette.replay_search(SearchCache.make_key(params), params.get("q", ""))
+
+    cache = get_search_cache()
+    if cache:
+        cached = cache.get(params)
+        if cached is not None:
+            logger.info(f"Search cache hit: {params.get('q')}")
+            count("serp_cache_hits")
+            _record(params, cached)
+            return cached
+
+    async with async_search_session() as client:
+        key = SearchCache.make_key(params)
+        task = client.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_async(client, params, cache))
+            client.inflight[key] = task
+            task.add_done_callback(lambda _: client.inflight.pop(key, None))
+        else:
+            count("serp_coalesced")
+        # Shield so one cancelled waiter does not cancel the shared request
+        return await asyncio.shield(task)
+
+
+async def _fetch_async(client: AsyncSearchClient, params: Dict[str, Any],
+                       cache: Optional[SearchCache]) -> Dict[str, Any]:
+    """Issue the actual SerpAPI request under the shared rate limit without blocking"""
+    with span(SERP, params.get("q", "")) as record:
+        record["attributes"]["queue_wait"] = await get_serp_limiter().acquire_async()
+
+        started = time.monotonic()
+        results = await client.search(params)
+        elapsed = time.monotonic() - started
+        if "error" in results:
+            record["status"] = "error"
+
+    _record(params, results)
+
+    if cache and "error" not in results:
+        cache.set(params, results, elapsed)
+
+    return results
+
+
+async def search_many_async(params_list: List[Dict[str, Any]], metrics=None) -> List[Dict[str, Any]]:
+    """Run a batch of searches concurrently on the event loop, in input order"""
+    log_batch(params_list)
+    with activate(metrics):
+        async with async_search_session():
+            return list(await asyncio.gather(*(google_search_async(params) for params in params_list)))
+
+
+_search_loop: Optional[asyncio.AbstractEventLoop] = None
+_search_loop_lock = threading.Lock()
+
+
+def get_search_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop on a daemon thread that owns one non-blocking client for its lifetime"""
+    global _search_loop
+    with _search_loop_lock:
+        if _search_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True, name="serp-loop").start()
+            _async_clients[loop] = AsyncSearchClient(
+                Config.SERPAPI_BASE_URL,
+                pool_size=Config.SEARCH_POOL_SIZE,
+                timeout=Config.SEARCH_TIMEOUT_SECONDS,
+                max_retries=Config.SEARCH_MAX_RETRIES
+            )
+            _search_loop = loop
+        return _search_loop
+
+
+def close_search_loop():
+    """Stop the shared search loop and close its client (the next search starts a fresh one)"""
+    global _search_loop
+    with _search_loop_lock:
+        loop, _search_loop = _search_loop, None
+    if loop is None:
+        return
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+async def search_many_shared(params_list: List[Dict[str, Any]], metrics=None) -> List[Dict[str, Any]]:
+    """search_many_async on the shared search loop, awaited from any event loop
+
+    CrewAI runs every async tool call in its own asyncio.run(); searching on that loop
+    would open and close a client per call instead of reusing keep-alive connections.
+    """
+    loop = get_search_loop()
+    # The search loop has its own context, so hand it this analysis's recorder explicitly
+    future = asyncio.run_coroutine_threadsafe(search_many_async(params_list, metrics or current_recorder()), loop)
+    return await asyncio.wrap_future(future)
@@ -1,66 +1,96 @@
 import json
-import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from crewai.tools import BaseTool
-from serpapi import GoogleSearch
 from brand_positioning.config import Config
+from brand_positioning.metrics import MetricsRecorder
+from brand_positioning.tools.evidence_index import EvidenceIndex
+from brand_positioning.tools.search_client import search_many
 import logging
 
 logger = logging.getLogger(__name__)
 
+def search_params(search_queries: List[str]) -> List[Dict[str, Any]]:
+    """Build SerpAPI parameters for a batch of research queries"""
+    search_config = Config.get_search_config()
+    return [
+        {
+            "q": search_query,
+            "api_key": Config.SERP_API_KEY,
+            "num": search_config["results_per_search"]
+        }
+        for search_query in search_queries
+    ]
+
+def format_results(query: str, batch_results: List[Dict[str, Any]], source: str,
+                   evidence_index: Optional[EvidenceIndex] = None) -> str:
+    """Merge organic results from a query batch into the JSON handed to the LLM.
+    
+    With an evidence index only new evidence is returned in full; pages the index has
+    already seen are listed by ID under "already_seen". Give each LLM context its own
+    index, since it can only resolve IDs for evidence it was shown itself.
+    """
+    index = evidence_index if evidence_index is not None else EvidenceIndex()
+    
+    all_results = []
+    for results in batch_results:
+        all_results.extend(results.get("organic_results", []))
+    
+    formatted_results = []
+    returned_ids = set()
+    already_seen = []
+    for result in all_results:
+        if len(formatted_results) >= 30:  # Limit for efficiency
+            break
+        evidence_id, is_new = index.add(result, source)
+        if is_new:
+            returned_ids.add(evidence_id)
+            formatted_results.append({
+                "id": evidence_id,
+                "title": result.get("title", ""),
+                "snippet": result.get("snippet", ""),
+                "link": result.get("link", "")
+            })
+        elif evidence_id not in returned_ids and evidence_id not in already_seen:
+            already_seen.append(evidence_id)
+    
+    output = {
+        "query": query,
+        "total_results": len(formatted_results),
+        "results": formatted_results
+    }
+    if already_seen:
+        output["already_seen"] = already_seen
+    return json.dumps(output)
+
 class CompetitorResearchTool(BaseTool):
     name: str = "Competitor Research"
     description: str = "Search and analyze competitors in a specific market using SerpAPI and LLM analysis"
+    evidence_index: Optional[EvidenceIndex] = None  # Shared per analysis to drop duplicate evidence
+    metrics: Optional[MetricsRecorder] = None  # Recorder of the analysis this tool is running for
+
+    def build_queries(self, query: str) -> List[str]:
+        """Templated competitor queries, limited by dev/prod configuration"""
+        search_config = Config.get_search_config()
+
+        # Base search queries (will be limited by config)
+        base_queries = [
+            f"{query} competitors brands 2025",
+            f"best {query} companies market leaders",
+            f"{query} vs alternatives comparison",
+            f"top {query} startups companies",
+            f"{query} market analysis competitive landscape",
+            f"{query} industry leaders pricing strategy"
+        ]
+
+        return base_queries[:search_config["competitor_searches"]]
 
     def _run(self, query: str) -> str:
         """Search for competitors and return structured analysis"""
         try:
-            # Get search configuration based on dev/prod mode
-            search_config = Config.get_search_config()
-            
-            # Base search queries (will be limited by config)
-            base_queries = [
-                f"{query} competitors brands 2025",
-                f"best {query} companies market leaders", 
-                f"{query} vs alternatives comparison",
-                f"top {query} startups companies",
-                f"{query} market analysis competitive landscape",
-                f"{query} industry leaders pricing strategy"
-            ]
-            
-            # Limit queries based on configuration
-            search_queries = base_queries[:search_config["competitor_searches"]]
-            
-            all_results = []
-            for search_query in search_queries:
-                logger.info(f"Searching competitors: {search_query}")
-                search = GoogleSearch({
-                    "q": search_query,
-                    "api_key": Config.SERP_API_KEY,
-                    "num": search_config["results_per_search"]
-                })
-                results = search.get_dict()
-                
-                if "organic_results" in results:
-                    all_results.extend(results["organic_results"])
-                
-                time.sleep(1)  # Rate limiting
-            
-            # Format results for LLM analysis
-            formatted_results = []
-            for result in all_results[:30]:  # Limit for efficiency
-                formatted_results.append({
-                    "title": result.get("title", ""),
-                    "snippet": result.get("snippet", ""),
-                    "link": result.get("link", "")
-                })
-            
-            return json.dumps({
-                "query": query,
-                "total_results": len(formatted_results),
-                "results": formatted_results
-            })
-            
+            # Issue the batch concurrently; results come back in query order
+            batch_results = search_many(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "competitor", self.evidence_index)
+
         except Exception as e:
             logger.error(f"Competitor research error: {e}")
             return json.dumps({"error": str(e), "results": []})
@@ -68,58 +98,33 @@ class CompetitorResearchTool(BaseTool):
 class CustomerInsightTool(BaseTool):
     name: str = "Customer Insight Research"
     description: str = "Research customer pain points, reviews, and discussions about products/markets"
+    evidence_index: Optional[EvidenceIndex] = None
+    metrics: Optional[MetricsRecorder] = None
+
+    def build_queries(self, query: str) -> List[str]:
+        """Templated customer insight queries, limited by dev/prod configuration"""
+        search_config = Config.get_search_config()
+
+        # Base insight queries (will be limited by config)
+        base_queries = [
+            f"{query} customer reviews problems 2025",
+            f"{query} reddit complaints issues",
+            f"{query} customer testimonials feedback",
+            f"{query} user experience problems",
+            f"{query} customer pain points survey",
+            f"{query} negative reviews analysis",
+            f"{query} customer satisfaction problems",
+            f"{query} user complaints forums discussions"
+        ]
+
+        return base_queries[:search_config["customer_searches"]]
 
     def _run(self, query: str) -> str:
         """Search for customer insights and return structured data"""
         try:
-            # Get search configuration based on dev/prod mode
-            search_config = Config.get_search_config()
-            
-            # Base insight queries (will be limited by config)
-            base_queries = [
-                f"{query} customer reviews problems 2025",
-                f"{query} reddit complaints issues",
-                f"{query} customer testimonials feedback",
-                f"{query} user experience problems",
-                f"{query} customer pain points survey",
-                f"{query} negative reviews analysis",
-                f"{query} customer satisfaction problems",
-                f"{query} user complaints forums discussions"
-            ]
-            
-            # Limit queries based on configuration
-            insight_queries = base_queries[:search_config["customer_searches"]]
-            
-            all_results = []
-            for search_query in insight_queries:
-                logger.info(f"Searching customer insights: {search_query}")
-                search = GoogleSearch({
-                    "q": search_query,
-                    "api_key": Config.SERP_API_KEY,
-                    "num": search_config["results_per_search"]
-                })
-                results = search.get_dict()
-                
-                if "organic_results" in results:
-                    all_results.extend(results["organic_results"])
-                
-                time.sleep(1)
-            
-            # Format results
-            formatted_results = []
-            for result in all_results[:30]:
-                formatted_results.append({
-                    "title": result.get("title", ""),
-                    "snippet": result.get("snippet", ""),
-                    "link": result.get("link", "")
-                })
-            
-            return json.dumps({
-                "query": query,
-                "total_results": len(formatted_results),
-                "results": formatted_results
-            })
-            
+            batch_results = search_many(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "customer", self.evidence_index)
+
         except Exception as e:
             logger.error(f"Customer insight error: {e}")
             return json.dumps({"error": str(e), "results": []})
@@ -127,56 +132,31 @@ class CustomerInsightTool(BaseTool):
 class MarketTrendTool(BaseTool):
     name: str = "Market Trend Research"
     description: str = "Research market trends, opportunities, and industry developments"
+    evidence_index: Optional[EvidenceIndex] = None
+    metrics: Optional[MetricsRecorder] = None
+
+    def build_queries(self, query: str) -> List[str]:
+        """Templated market trend queries, limited by dev/prod configuration"""
+        search_config = Config.get_search_config()
+
+        # Base trend queries (will be limited by config)
+        base_queries = [
+            f"{query} market trends 2025 industry report",
+            f"{query} market size growth forecast",
+            f"{query} industry analysis emerging trends",
+            f"{query} market opportunities 2025",
+            f"{query} consumer behavior trends",
+            f"{query} market research statistics data"
+        ]
+
+        return base_queries[:search_config["trend_searches"]]
 
     def _run(self, query: str) -> str:
         """Search for market trends and return structured data"""
         try:
-            # Get search configuration based on dev/prod mode
-            search_config = Config.get_search_config()
-            
-            # Base trend queries (will be limited by config)
-            base_queries = [
-                f"{query} market trends 2025 industry report",
-                f"{query} market size growth forecast",
-                f"{query} industry analysis emerging trends",
-                f"{query} market opportunities 2025",
-                f"{query} consumer behavior trends",
-                f"{query} market research statistics data"
-            ]
-            
-            # Limit queries based on configuration
-            trend_queries = base_queries[:search_config["trend_searches"]]
-            
-            all_results = []
-            for search_query in trend_queries:
-                logger.info(f"Searching market trends: {search_query}")
-                search = GoogleSearch({
-                    "q": search_query,
-                    "api_key": Config.SERP_API_KEY,
-                    "num": search_config["results_per_search"]
-                })
-                results = search.get_dict()
-                
-                if "organic_results" in results:
-                    all_results.extend(results["organic_results"])
-                
-                time.sleep(1)
-            
-            # Format results
-            formatted_results = []
-            for result in all_results[:30]:
-                formatted_results.append({
-                    "title": result.get("title", ""),
-                    "snippet": result.get("snippet", ""),
-                    "link": result.get("link", "")
-                })
-            
-            return json.dumps({
-                "query": query,
-                "total_results": len(formatted_results),
-                "results": formatted_results
-            })
-            
+            batch_results = search_many(search_params(self.build_queries(query)), metrics=self.metrics)
+            return format_results(query, batch_results, "trend", self.evidence_index)
+
         except Exception as e:
             logger.error(f"Market trend error: {e}")
-            return json.dumps({"error": str(e), "results": []})
\ No newline at end of file
+            return json.dumps({"error": str(e), "results": []})
@@ -3,8 +3,7 @@ import logging
 import time
 import json
 import os
-from brand_positioning.core.parallel_crews import run_parallel_analysis_sync, run_parallel_intelligence_sync
-from brand_positioning.core.focused_workflow import run_focused_positioning_analysis
+from brand_positioning.core.jobs import get_job_runner, COMPLETED, FINISHED_STATUSES
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING)  # Reduce noise in UI
@@ -126,13 +125,38 @@ def init_session_state():
         st.session_state.langfuse_public = ""
     if 'langfuse_secret' not in st.session_state:
         st.session_state.langfuse_secret = ""
+    if 'active_job' not in st.session_state:
+        st.session_state.active_job = None
 
-def run_full_analysis_with_status(brand_info):
-    """Run the complete brand positioning analysis with parallel crews"""
+def wait_for_job(job_id, update_status, show_partial=None):
+    """Poll a background analysis job until it finishes and return its result dict"""
+    runner = get_job_runner()
+    while True:
+        job = runner.poll(job_id)
+        if job is None:
+            st.session_state.active_job = None
+            return {"success": False, "error": "Analysis job not found"}
+        
+        update_status(job["message"] or job["status"], job["progress"])
+        if show_partial and job["partial"]:
+            show_partial(job["partial"])
+        
+        if job["status"] in FINISHED_STATUSES:
+            break
+        time.sleep(0.5)
+    
+    st.session_state.active_job = None
+    if job["status"] == COMPLETED:
+        return job["result"]
+    return {"success": False, "error": job["error"] or "Analysis cancelled"}
+
+def run_full_analysis_with_status(brand_info, job_id=None):
+    """Run the complete brand positioning analysis with parallel crews as a background job"""
     
     # Create status tracking
     status_placeholder = st.empty()
     progress_bar = st.progress(0)
+    stream_placeholder = st.empty()
     
     def update_status(message, progress=None):
         """Update status in real-time"""
@@ -141,11 +165,19 @@ def run_full_analysis_with_status(brand_info):
         if progress is not None:
             progress_bar.progress(progress / 100)
     
+    def show_partial(partial_result):
+        """Render strategy and actions as they are generated"""
+        with stream_placeholder.container():
+            display_results(partial_result)
+    
     try:
         update_status("Initializing parallel crews...", 5)
         
-        # Run parallel analysis
-        result = run_parallel_analysis_sync(brand_info, status_callback=update_status)
+        # Run parallel analysis in the background, streaming the strategy and actions into the page
+        if job_id is None:
+            job_id = get_job_runner().submit("full", brand_info)
+        result = wait_for_job(job_id, update_status, show_partial)
+        stream_placeholder.empty()
         
         if result.get("success"):
             update_status("Analysis completed successfully!", 100)
@@ -161,8 +193,8 @@ def run_full_analysis_with_status(brand_info):
         st.error(f"Analysis failed: {str(e)}")
         return None
 
-def run_focused_positioning_with_status(brand_info):
-    """Run focused positioning analysis with status updates"""
+def run_focused_positioning_with_status(brand_info, job_id=None):
+    """Run focused positioning analysis as a background job with status updates"""
     
     # Create status tracking
     status_placeholder = st.empty()
@@ -178,8 +210,10 @@ def run_focused_positioning_with_status(brand_info):
     try:
         update_status("Starting focused positioning analysis...", 5)
         
-        # Run focused analysis
-        result = run_focused_positioning_analysis(brand_info, status_callback=update_status)
+        # Run focused analysis in the background
+        if job_id is None:
+            job_id = get_job_runner().submit("focused", brand_info)
+        result = wait_for_job(job_id, update_status)
         
         if result.get("success"):
             update_status("Focused positioning analysis completed!", 100)
@@ -195,8 +229,8 @@ def run_focused_positioning_with_status(brand_info):
         st.error(f"Focused analysis failed: {str(e)}")
         return None
 
-def run_quick_analysis_with_status(brand_info):
-    """Run quick parallel market intelligence only"""
+def run_quick_analysis_with_status(brand_info, job_id=None):
+    """Run quick parallel market intelligence only, as a background job"""
     
     # Create status tracking
     status_placeholder = st.empty()
@@ -212,8 +246,10 @@ def run_quick_analysis_with_status(brand_info):
     try:
         update_status("Starting parallel market intelligence...", 5)
         
-        # Run parallel intelligence only
-        result = run_parallel_intelligence_sync(brand_info, status_callback=update_status)
+        # Run parallel intelligence only, in the background
+        if job_id is None:
+            job_id = get_job_runner().submit("quick", brand_info)
+        result = wait_for_job(job_id, update_status)
         
         if result.get("success"):
             update_status("Market intelligence completed!", 100)
@@ -267,13 +303,28 @@ def display_focused_results(result):
     
     # Cost and efficiency info
     st.markdown("---")
-    col1, col2, col3 = st.columns(3)
+    display_run_metrics(result)
+
+def display_run_metrics(result):
+    """Measured calls, tokens, cost and time of an analysis (nothing for results stored before metrics existed)"""
+    metrics = result.get("metrics")
+    if not metrics:
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("API Calls Used", result.get("api_calls_used", "4"))
+        st.metric("API Calls Used", metrics["serp"]["calls"],
+                  help=f"{metrics['serp']['cache_hits'] + metrics['serp']['prefetch_hits']} served from cache")
     with col2:
-        st.metric("Estimated Cost", result.get("cost_estimate", "$0.20"))
+        st.metric("LLM Tokens", f"{metrics['llm']['tokens_in']:,} in / {metrics['llm']['tokens_out']:,} out",
+                  help=f"{metrics['llm']['calls']} calls, {metrics['llm']['cache_hits']} cached")
     with col3:
-        st.metric("Analysis Time", "1-2 minutes")
+        st.metric("Cost", f"${metrics['cost_usd']['total']:.2f}")
+    with col4:
+        st.metric("Analysis Time", f"{metrics['wall_seconds']:.0f}s")
+    
+    if metrics.get("stages"):
+        st.caption(" · ".join(f"{name}: {seconds:.1f}s" for name, seconds in metrics["stages"].items()))
 
 def display_results(result):
     """Display the analysis results in a structured format"""
@@ -293,7 +344,11 @@ def display_results(result):
         <div class="brand-item"><strong>Target Audience:</strong> {brand_info.get('target', 'N/A')}</div>
     </div>
     ''', unsafe_allow_html=True)
-    
+
+    timed_out = result.get("intelligence_status", {}).get("timed_out")
+    if timed_out:
+        st.warning(f"Proceeded without {', '.join(d.replace('_', ' ') for d in timed_out)}: research did not finish in time.")
+
     # Check if this is full analysis or quick analysis
     is_full_analysis = "positioning_strategy" in result and "strategic_actions" in result
     
@@ -376,10 +431,64 @@ def display_results(result):
             st.markdown(str(intelligence))
             st.markdown('</div>', unsafe_allow_html=True)
     
+    st.markdown("---")
+    display_run_metrics(result)
+    
     # Raw result for debugging (expandable)
     with st.expander("Full Analysis Result (Technical)"):
         st.json(result)
 
+def show_active_job(active_job):
+    """Show progress of the session's background analysis, then its results"""
+    job_id = active_job["id"]
+    mode = active_job["mode"]
+    runner = get_job_runner()
+    
+    st.markdown('<div class="section-header">Analysis in Progress</div>', unsafe_allow_html=True)
+    if st.button("Cancel Analysis", type="secondary"):
+        runner.cancel(job_id)
+        st.session_state.active_job = None
+        st.rerun()
+    
+    job = runner.poll(job_id)
+    brand_info = job["brand_info"] if job else {}
+    
+    if mode == "focused":
+        # New focused analysis
+        st.markdown("**Expected Time:** 1-2 minutes with focused research")
+        st.markdown("**API Usage:** Only 4 SerpAPI calls ($0.20 cost)")
+        
+        result = run_focused_positioning_with_status(brand_info, job_id)
+        
+        if result and result.get("success"):
+            st.markdown("---")
+            display_focused_results(result)
+        else:
+            st.error(f"Focused analysis failed: {result.get('error', 'Unknown error') if result else 'Unknown error'}")
+    
+    elif mode == "quick":
+        # Quick parallel analysis
+        st.markdown("**Expected Time:** 2-4 minutes with 3 parallel crews")
+        
+        result = run_quick_analysis_with_status(brand_info, job_id)
+        
+        if result and result.get("success"):
+            st.markdown("---")
+            display_results(result)
+        else:
+            st.error(f"Quick analysis failed: {result.get('error', 'Unknown error') if result else 'Unknown error'}")
+    
+    else:
+        # Full parallel analysis  
+        st.markdown("**Expected Time:** 6-10 minutes with parallel crews")
+        
+        result = run_full_analysis_with_status(brand_info, job_id)
+        
+        if result and result.get("success"):
+            st.session_state.analysis_result = result
+            st.session_state.analysis_complete = True
+            st.rerun()
+
 def main():
     """Main application function"""
     
@@ -434,6 +543,16 @@ def main():
         st.markdown(f"- Results per search: {search_config['results_per_search']}")
         st.markdown(f"- **Total SerpAPI calls: {search_config['total_serp_calls']}** (80% reduction!)")
         
+        # Search cache effectiveness
+        from brand_positioning.tools.search_cache import get_search_cache
+        search_cache = get_search_cache()
+        if search_cache:
+            cache_stats = search_cache.stats()
+            st.markdown("### Search Cache")
+            st.markdown(f"- Hits: {cache_stats['hits']} / Misses: {cache_stats['misses']}")
+            st.markdown(f"- SerpAPI calls saved: {cache_stats['serp_calls_saved']}")
+            st.markdown(f"- Latency saved: {cache_stats['seconds_saved']}s")
+        
         # API Keys Status
         st.markdown("### API Keys Status")
         openai_configured = bool(os.getenv("OPENAI_API_KEY") or st.session_state.get("openai_key"))
@@ -579,6 +698,12 @@ def main():
                 ],
                 help="Focused takes 1-2 minutes (4 API calls), Full takes 8-12 minutes (20 API calls)"
             )
+            
+            reuse_recent = st.checkbox(
+                "Reuse a recent result for this brand",
+                value=True,
+                help=f"Results younger than {Config.RESULT_MAX_AGE_HOURS:g} hours are shown instantly instead of re-running"
+            )
         
         # Submit button
         submitted = st.form_submit_button(
@@ -611,44 +736,21 @@ def main():
                     "target": target_audience.strip() if target_audience.strip() else "general market"
                 }
                 
-                # Run analysis based on type
-                st.markdown('<div class=\"section-header\">Analysis in Progress</div>', unsafe_allow_html=True)
-                
+                # Run analysis based on type as a background job; the page polls it across reruns
                 if analysis_type == "Focused Positioning (Recommended) - Niche + Strategic Move":
-                    # New focused analysis
-                    st.markdown("**Expected Time:** 1-2 minutes with focused research")
-                    st.markdown("**API Usage:** Only 4 SerpAPI calls ($0.20 cost)")
-                    
-                    result = run_focused_positioning_with_status(brand_info)
-                    
-                    if result and result.get("success"):
-                        st.markdown("---")
-                        display_focused_results(result)
-                    else:
-                        st.error(f"Focused analysis failed: {result.get('error', 'Unknown error') if result else 'Unknown error'}")
-                
+                    mode = "focused"
                 elif analysis_type == "Quick Market Intelligence Only":
-                    # Quick parallel analysis
-                    st.markdown("**Expected Time:** 2-4 minutes with 3 parallel crews")
-                    
-                    result = run_quick_analysis_with_status(brand_info)
-                    
-                    if result and result.get("success"):
-                        st.markdown("---")
-                        display_results(result)
-                    else:
-                        st.error(f"Quick analysis failed: {result.get('error', 'Unknown error') if result else 'Unknown error'}")
-                
+                    mode = "quick"
                 else:
-                    # Full parallel analysis  
-                    st.markdown("**Expected Time:** 6-10 minutes with parallel crews")
-                    
-                    result = run_full_analysis_with_status(brand_info)
-                    
-                    if result and result.get("success"):
-                        st.session_state.analysis_result = result
-                        st.session_state.analysis_complete = True
-                        st.rerun()
+                    mode = "full"
+                
+                job_id = get_job_runner().submit(mode, brand_info, refresh=not reuse_recent)
+                st.session_state.active_job = {"id": job_id, "mode": mode}
+                st.rerun()
+    
+    # Progress of a running analysis (reattaches after reruns and reconnects)
+    if st.session_state.active_job:
+        show_active_job(st.session_state.active_job)
     
     # Display results if analysis is complete
     if st.session_state.analysis_complete and st.session_state.analysis_result:
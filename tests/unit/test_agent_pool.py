@@ -0,0 +1,71 @@
+"""
+Unit tests for the process-level agent pool.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.agents.pool import AgentPool
+
+
+class _Built:
+    def __init__(self, label=""):
+        self.label = label
+        self.tools_results = []
+
+
+class TestAgentPool(unittest.TestCase):
+    """Test checkout, reuse and isolation of pooled instances."""
+
+    def test_checkout_reuses_built_instance(self):
+        """Test that a second run gets the instance the first run returned."""
+        pool = AgentPool()
+
+        with pool.checkout(_Built, "strategist") as first:
+            first.tools_results.append({"result": "stale"})
+        with pool.checkout(_Built, "strategist") as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(second.tools_results, [])
+        self.assertEqual(pool.stats(), {"created": 1, "reused": 1, "idle": 1})
+
+    def test_concurrent_checkouts_are_exclusive(self):
+        """Test that an instance in use is never handed to another run."""
+        pool = AgentPool()
+
+        with pool.checkout(_Built) as first, pool.checkout(_Built) as second:
+            self.assertIsNot(first, second)
+
+    def test_keys_separate_arguments_and_credentials(self):
+        """Test that different factory arguments or API keys never share instances."""
+        from brand_positioning.config import Config
+
+        pool = AgentPool()
+        with patch.object(Config, 'OPENAI_API_KEY', 'key-a'):
+            with pool.checkout(_Built, True) as built:
+                pass
+            with pool.checkout(_Built, False) as other_args:
+                self.assertIsNot(other_args, built)
+        with patch.object(Config, 'OPENAI_API_KEY', 'key-b'):
+            with pool.checkout(_Built, True) as other_key:
+                self.assertIsNot(other_key, built)
+
+    def test_failed_run_is_not_recycled(self):
+        """Test that an instance whose run raised is dropped from the pool."""
+        pool = AgentPool()
+
+        with self.assertRaises(RuntimeError):
+            with pool.checkout(_Built) as failed:
+                raise RuntimeError("crew failed")
+        with pool.checkout(_Built) as fresh:
+            self.assertIsNot(fresh, failed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the headless HTTP API.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from starlette.testclient import TestClient
+from brand_positioning.core import jobs
+from brand_positioning.core.jobs import JobRunner
+from brand_positioning.api.app import create_app
+
+
+class TestAnalysisAPI(unittest.TestCase):
+    """Test job submission, polling, events and limits over HTTP."""
+
+    def setUp(self):
+        """Serve the API over a runner with stand-in workflows."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.release = threading.Event()
+
+        def focused(brand_info, status_callback=None):
+            status_callback("Finding your specific niche to dominate...", 30)
+            return {"success": True, "brand_info": brand_info, "niche_positioning": "Own agencies"}
+
+        def full(brand_info, status_callback=None, stream_callback=None):
+            self.release.wait(5)
+            return {"success": True, "brand_info": brand_info}
+
+        patcher = patch.object(jobs, '_analysis_modes', return_value={"focused": focused, "quick": focused, "full": full})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.runner = JobRunner(os.path.join(self.temp_dir.name, "jobs.sqlite3"), max_workers=2)
+        self.client = TestClient(create_app(self.runner, max_active_jobs=1))
+        self.brand_info = {"brand": "Acme", "product": "Project management for agencies"}
+
+    def tearDown(self):
+        """Stop workers and remove the job table."""
+        self.release.set()
+        self.runner.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_submit_then_fetch_result(self):
+        """Test that a submitted analysis returns a job ID and later its result."""
+        response = self.client.post("/analyses", json={"mode": "focused", "brand_info": self.brand_info})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+
+        self.runner.result(job_id, timeout=5)
+        status = self.client.get(f"/analyses/{job_id}").json()
+        result = self.client.get(f"/analyses/{job_id}/result").json()
+
+        self.assertEqual(status["status"], "completed")
+        self.assertEqual(result["niche_positioning"], "Own agencies")
+        self.assertEqual(result["brand_info"]["target"], "general market")
+
+    def test_events_stream_progress_and_result(self):
+        """Test that the event stream ends with the analysis result."""
+        job_id = self.client.post("/analyses", json={"mode": "focused", "brand_info": self.brand_info}).json()["job_id"]
+
+        with self.client.stream("GET", f"/analyses/{job_id}/events") as response:
+            body = "".join(response.iter_text())
+
+        self.assertIn("event: progress", body)
+        self.assertIn("event: result", body)
+        self.assertIn("Own agencies", body)
+
+    def test_validation_and_concurrency_limit(self):
+        """Test that bad requests are rejected and active analyses are capped."""
+        bad_mode = self.client.post("/analyses", json={"mode": "deep", "brand_info": self.brand_info})
+        missing_product = self.client.post("/analyses", json={"brand_info": {"brand": "Acme"}})
+        self.assertEqual(bad_mode.status_code, 400)
+        self.assertEqual(missing_product.status_code, 400)
+        self.assertEqual(self.client.post("/analyses", json=[]).status_code, 400)
+        self.assertEqual(self.client.post("/analyses", json="x").status_code, 400)
+        self.assertEqual(self.client.post("/analyses", json={"brand_info": ["Acme"]}).status_code, 400)
+        for options in ({"max_age_hours": "abc"}, {"max_age_hours": -1}, {"max_age_hours": True}, {"refresh": "false"}):
+            response = self.client.post("/analyses", json={"brand_info": self.brand_info, **options})
+            self.assertEqual(response.status_code, 400, options)
+
+        first = self.client.post("/analyses", json={"mode": "full", "brand_info": self.brand_info})
+        second = self.client.post("/analyses", json={"mode": "full", "brand_info": self.brand_info})
+        self.assertEqual(first.status_code, 202)
+        self.assertEqual(second.status_code, 429)
+
+        running = first.json()["job_id"]
+        self.assertEqual(self.client.get(f"/analyses/{running}/result").status_code, 409)
+        self.assertEqual(self.client.delete(f"/analyses/{running}").status_code, 200)
+        self.assertEqual(self.client.get("/analyses/unknown").status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
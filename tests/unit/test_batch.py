@@ -0,0 +1,83 @@
+"""
+Unit tests for the batch analysis runner.
+"""
+
+import unittest
+import os
+import sys
+import json
+import tempfile
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core import batch
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test loading, scheduling and resuming batch analyses."""
+
+    def setUp(self):
+        """Create a temporary directory for batch files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.temp_dir.name, "results.jsonl")
+
+    def tearDown(self):
+        """Remove batch files."""
+        self.temp_dir.cleanup()
+
+    def test_load_brands_from_csv_and_jsonl(self):
+        """Test that both input formats produce brand_info dicts."""
+        csv_path = os.path.join(self.temp_dir.name, "brands.csv")
+        with open(csv_path, "w") as f:
+            f.write("brand,product,target\nAcme,Project tool,\nNoProduct,,\n")
+        jsonl_path = os.path.join(self.temp_dir.name, "brands.jsonl")
+        with open(jsonl_path, "w") as f:
+            f.write(json.dumps({"brand": "Beta", "product": "CRM", "target": "Dentists"}) + "\n")
+
+        self.assertEqual(batch.load_brands(csv_path), [
+            {"brand": "Acme", "product": "Project tool", "target": "general market"}
+        ])
+        self.assertEqual(batch.load_brands(jsonl_path)[0]["target"], "Dentists")
+
+    def test_results_written_and_completed_brands_skipped(self):
+        """Test that a rerun only analyzes brands without a successful result."""
+        brands = [
+            {"brand": "Acme", "product": "Project tool", "target": "Agencies"},
+            {"brand": "Beta", "product": "CRM", "target": "Dentists"},
+            {"brand": "Gamma", "product": "Payroll", "target": "Restaurants"}
+        ]
+        calls = []
+
+        def engine(brand_info, mode, llm_cache):
+            calls.append(brand_info["brand"])
+            if brand_info["brand"] == "Beta" and calls.count("Beta") == 1:
+                return {"success": False, "error": "rate limited"}
+            return {"success": True, "brand_info": brand_info}
+
+        with patch.object(batch, '_run_engine', side_effect=engine):
+            first = batch.run_batch(brands, self.output, max_workers=2)
+            # A crash mid-write leaves a partial line behind
+            with open(self.output, "a") as f:
+                f.write('{"key": "trunc')
+            second = batch.run_batch(brands, self.output, max_workers=2)
+
+        self.assertEqual((first["completed"], first["failed"]), (2, 1))
+        self.assertEqual((second["skipped"], second["completed"]), (2, 1))
+        self.assertEqual(sorted(calls), ["Acme", "Beta", "Beta", "Gamma"])
+        self.assertEqual(len(batch.completed_keys(self.output)), 3)
+
+    def test_same_brand_in_other_mode_is_not_skipped(self):
+        """Test that completion is tracked per analysis mode."""
+        brand_info = {"brand": "Acme", "product": "Project tool", "target": "Agencies"}
+
+        self.assertNotEqual(batch.fingerprint(brand_info, "focused"), batch.fingerprint(brand_info, "full"))
+        self.assertEqual(
+            batch.fingerprint(brand_info, "focused"),
+            batch.fingerprint({"brand": " acme ", "product": "Project  Tool", "target": "agencies"}, "focused")
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
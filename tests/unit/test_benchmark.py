@@ -0,0 +1,120 @@
+"""
+Unit tests for the offline benchmark harness and API stand-ins.
+"""
+
+import unittest
+import os
+import sys
+import json
+import random
+import time
+import requests
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.benchmark import harness
+from brand_positioning.benchmark.stand_ins import FakeLLMServer, FakeSerpAPIServer, LatencyDistribution
+
+
+class TestLatencyDistribution(unittest.TestCase):
+    """Test latency specs and sampling."""
+
+    def test_parse_and_sample(self):
+        """Test each distribution stays within its expected range."""
+        rng = random.Random(0)
+        self.assertEqual(LatencyDistribution.parse("fixed:0.2").sample(rng), 0.2)
+        self.assertTrue(all(0.1 <= LatencyDistribution.parse("uniform:0.1:0.3").sample(rng) <= 0.3 for _ in range(50)))
+
+        samples = sorted(LatencyDistribution.parse("lognormal:1:3").sample(rng) for _ in range(2000))
+        self.assertAlmostEqual(samples[1000], 1.0, delta=0.15)
+        self.assertAlmostEqual(samples[1900], 3.0, delta=0.6)
+
+    def test_invalid_specs_rejected(self):
+        """Test unknown kinds and wrong parameter counts raise."""
+        for spec in ("gamma:1", "fixed:1:2", "lognormal:3:1"):
+            with self.assertRaises(ValueError):
+                LatencyDistribution.parse(spec)
+
+
+class TestStandIns(unittest.TestCase):
+    """Test the SerpAPI and OpenAI-compatible stand-ins over HTTP."""
+
+    def test_serp_stand_in_replays_recordings(self):
+        """Test recorded queries are replayed and others synthesized."""
+        recorded = {"organic_results": [{"title": "Recorded", "link": "https://g2.com/acme"}]}
+        with FakeSerpAPIServer(recordings={"acme reviews": recorded}) as serp:
+            replayed = requests.get(f"{serp.url}/search", params={"q": "acme reviews"}, timeout=5).json()
+            synthetic = requests.get(f"{serp.url}/search", params={"q": "crm pricing", "num": 3}, timeout=5).json()
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(len(synthetic["organic_results"]), 3)
+        self.assertEqual(serp.requests, 2)
+
+    def test_llm_stand_in_plays_react_loop(self):
+        """Test each listed tool is called once before the final answer."""
+        llm = FakeLLMServer(responses=["Own the agency niche"])
+        system = ("Tool Name: Competitor Research\nTool Arguments: {'query': {'description': None, 'type': 'str'}}\n"
+                  "Observation: the result of the action\n- Product: Project tool")
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": "Begin!"}]
+
+        first = llm.completion_for(messages)
+        self.assertIn("Action: Competitor Research", first)
+        self.assertEqual(json.loads(first.split("Action Input: ")[1]), {"query": "Project tool"})
+
+        messages.append({"role": "assistant", "content": first + "\nObservation: {\"results\": []}"})
+        self.assertEqual(llm.completion_for(messages).split("Final Answer: ")[1], "Own the agency niche")
+
+    def test_llm_stand_in_speaks_chat_completions(self):
+        """Test plain and streamed completions in the OpenAI wire format."""
+        body = {"model": "gpt-4o", "messages": [{"role": "user", "content": "Hello"}]}
+        with FakeLLMServer(latency=LatencyDistribution("fixed", 0.01)) as llm:
+            plain = requests.post(f"{llm.url}/v1/chat/completions", json=body, timeout=5).json()
+            streamed = requests.post(f"{llm.url}/v1/chat/completions", json={**body, "stream": True}, timeout=5).text
+
+        self.assertTrue(plain["choices"][0]["message"]["content"].startswith("Thought:"))
+        self.assertIn('"chat.completion.chunk"', streamed)
+        self.assertTrue(streamed.rstrip().endswith("data: [DONE]"))
+
+
+class TestHarness(unittest.TestCase):
+    """Test percentile math and level summaries."""
+
+    def test_percentile_interpolates(self):
+        """Test interpolated percentiles on a small sample."""
+        self.assertEqual(harness.percentile([3, 1, 2], 50), 2)
+        self.assertAlmostEqual(harness.percentile([1, 2, 3, 4], 95), 3.85)
+        self.assertIsNone(harness.percentile([], 50))
+
+    def test_run_level_summarizes_runs(self):
+        """Test latencies, failures and request counts for one concurrency level."""
+        serp, llm = FakeSerpAPIServer(), FakeLLMServer()
+
+        def workflow(brand_info, llm_cache=None):
+            time.sleep(0.02)
+            serp.requests += 1
+            if brand_info["brand"].endswith("3"):
+                return {"success": False, "error": "stand-in failure"}
+            return {"success": True}
+
+        harness.tracemalloc.start()
+        try:
+            with patch.object(harness, '_workflow', return_value=workflow):
+                row = harness.run_level("focused", concurrency=2, runs=4, serp=serp, llm=llm)
+        finally:
+            harness.tracemalloc.stop()
+
+        self.assertEqual((row["runs"], row["failures"], row["serp_requests"]), (4, 1, 4))
+        self.assertEqual(row["first_error"], "stand-in failure")
+        self.assertGreaterEqual(row["p50_seconds"], 0.02)
+        self.assertGreater(row["throughput_per_minute"], 0)
+        self.assertIn("focused", harness.format_report({
+            "settings": {"serp_latency": "fixed:0", "llm_latency": "fixed:0", "caches": False},
+            "rows": [row],
+            "peak_rss_mb": 100.0
+        }))
+
+
+if __name__ == '__main__':
+    unittest.main()
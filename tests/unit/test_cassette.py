@@ -0,0 +1,110 @@
+"""
+Unit tests for recording and replaying SerpAPI and LLM traffic.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.cassette import Cassette, CassetteMiss, use_cassette, RECORD, REPLAY
+from brand_positioning.rate_limiter import TokenBucket
+
+
+class TestCassetteFile(unittest.TestCase):
+    """Test cassette persistence and replay order."""
+
+    def setUp(self):
+        """Create a temporary directory for cassette files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "run.json.gz")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip_replays_in_recording_order(self):
+        """Test a saved cassette replays repeated requests in order, then repeats the last."""
+        with use_cassette(self.path, RECORD) as cassette:
+            cassette.record_search("k", {"organic_results": [1]})
+            cassette.record_search("k", {"organic_results": [2]})
+            cassette.record_completion("gpt-4o", 0.1, "Position Acme", "First")
+
+        replay = Cassette(self.path, REPLAY)
+        self.assertEqual(replay.stats(), {"searches": 2, "completions": 1})
+        self.assertEqual([replay.replay_search("k")["organic_results"] for _ in range(3)], [[1], [2], [2]])
+        self.assertEqual(replay.replay_completion("gpt-4o", 0.1, "Position Acme"), "First")
+        self.assertIn("error", replay.replay_search("unknown", "crm pricing"))
+        with self.assertRaises(CassetteMiss):
+            replay.replay_completion("gpt-4o", 0.1, "Something else")
+
+    def test_drifted_conversation_falls_back_to_task_turn(self):
+        """Test a changed observation still replays the recorded answer for that turn."""
+        task = [{"role": "system", "content": "You research"}, {"role": "user", "content": "Research Acme"}]
+        recorded = task + [{"role": "assistant", "content": "Observation: ten results"}]
+        drifted = task + [{"role": "assistant", "content": "Observation: I tried reusing the same input"}]
+
+        cassette = Cassette(self.path, RECORD)
+        cassette.record_completion("gpt-4o", 0.1, recorded, "Final Answer: Acme wins")
+        cassette.save()
+
+        self.assertEqual(Cassette(self.path, REPLAY).replay_completion("gpt-4o", 0.1, drifted), "Final Answer: Acme wins")
+
+
+class TestCassetteHooks(unittest.TestCase):
+    """Test that searches and completions are captured and replayed without the network."""
+
+    def setUp(self):
+        """Create a temporary cassette path and bypass caches and rate limits."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "run.json")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_searches_replay_without_network(self):
+        """Test search_many results are recorded and served back offline."""
+        from brand_positioning.tools import search_client
+
+        params = [{"q": "acme competitors"}, {"q": "acme reviews"}]
+        with patch.object(search_client, 'get_search_cache', return_value=None), \
+             patch.object(search_client, 'get_serp_limiter', return_value=TokenBucket(rate_per_minute=600, capacity=10)):
+            with patch.object(search_client.SearchClient, 'search', side_effect=lambda p: {"organic_results": [p["q"]]}):
+                with use_cassette(self.path, RECORD):
+                    recorded = search_client.search_many(params)
+
+            with patch.object(search_client.SearchClient, 'search', side_effect=AssertionError("network used")):
+                with use_cassette(self.path, REPLAY):
+                    replayed = search_client.search_many(params)
+
+        self.assertEqual(replayed, recorded)
+
+    @patch.dict(os.environ, {
+        'OPENAI_API_KEY': 'test_openai_key',
+        'SERP_API_KEY': 'test_serp_key'
+    })
+    def test_completions_replay_without_network(self):
+        """Test agent LLM completions are recorded and served back offline."""
+        from crewai import LLM
+        from brand_positioning.agents import llm as llm_module
+
+        messages = [{"role": "user", "content": "Position Acme for agencies"}]
+        with patch.object(llm_module, 'get_llm_limiter', return_value=TokenBucket(rate_per_minute=60, capacity=5)), \
+             patch.object(llm_module, 'get_llm_cache', return_value=None):
+            agent_llm = llm_module.AgentLLM(model="gpt-4o", api_key="test", temperature=0.1)
+            with patch.object(LLM, 'call', return_value="Own the agency niche"):
+                with use_cassette(self.path, RECORD):
+                    agent_llm.call(messages)
+
+            with patch.object(LLM, 'call', side_effect=AssertionError("network used")):
+                with use_cassette(self.path, REPLAY):
+                    self.assertEqual(agent_llm.call(messages), "Own the agency niche")
+
+
+if __name__ == '__main__':
+    unittest.main()
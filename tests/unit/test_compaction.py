@@ -0,0 +1,65 @@
+"""
+Unit tests for token-budgeted intelligence compaction.
+"""
+
+import unittest
+import os
+import sys
+import random
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core.compaction import compact_intelligence
+
+
+class TestCompaction(unittest.TestCase):
+    """Test compaction of intelligence results before the strategy prompt."""
+
+    def setUp(self):
+        """Build intelligence with filler, evidence and a cross-domain duplicate."""
+        vocabulary = ("teams often feel that their tools could be simpler nicer calmer faster and more "
+                      "pleasant overall when planning weekly work across busy schedules").split()
+
+        def filler(seed):
+            rng = random.Random(seed)
+            return "\n".join("- " + " ".join(rng.sample(vocabulary, 12)) for _ in range(40))
+
+        self.shared = "- Acme raised $12 million and serves 4,000 agencies per Crunchbase https://crunchbase.com/acme"
+        self.intelligence = {
+            "competitor_analysis": "## Competitors:\n" + self.shared + "\n" + filler(1),
+            "customer_insights": "## Pain points:\n- Users say \"onboarding takes three weeks\" on G2 (38% of reviews)\n"
+                                 + self.shared + "\n" + filler(2),
+            "market_trends": "## Trends:\n- Market grows 14% CAGR to $9.1 billion by 2030 per Gartner\n" + filler(3)
+        }
+
+    def test_under_budget_is_unchanged(self):
+        """Test that intelligence within budget is embedded as-is."""
+        compacted, stats = compact_intelligence(self.intelligence, budget_tokens=100000)
+
+        self.assertEqual(compacted, self.intelligence)
+        self.assertFalse(stats["compacted"])
+
+    def test_over_budget_keeps_evidence_dense_passages(self):
+        """Test that compaction fits the budget and keeps the figures and quotes."""
+        compacted, stats = compact_intelligence(self.intelligence, budget_tokens=300)
+
+        self.assertTrue(stats["compacted"])
+        self.assertLessEqual(stats["compacted_tokens"], 300)
+        self.assertLess(stats["compacted_tokens"], stats["original_tokens"])
+        self.assertIn("$12 million", compacted["competitor_analysis"])
+        self.assertIn("onboarding takes three weeks", compacted["customer_insights"])
+        self.assertIn("14% CAGR", compacted["market_trends"])
+        self.assertTrue(compacted["market_trends"].startswith("## Trends:"))
+
+    def test_cross_domain_duplicates_kept_once(self):
+        """Test that a passage repeated in two domains is embedded once."""
+        compacted, stats = compact_intelligence(self.intelligence, budget_tokens=300)
+
+        self.assertGreaterEqual(stats["duplicates_removed"], 1)
+        self.assertIn(self.shared, compacted["competitor_analysis"])
+        self.assertNotIn(self.shared, compacted["customer_insights"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for direct-tools intelligence (no ReAct tool loop).
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core.direct_intelligence import DirectDomainRun
+from brand_positioning.core.parallel_crews import ParallelCrewsOrchestrator
+from brand_positioning.metrics import MetricsRecorder
+from brand_positioning.tools import async_tools, search_client, tools
+
+
+def fake_run(result: str, queries: list = None):
+    """Tool _run replacement (tools inspect its signature, so it must be a real function)."""
+    def _run(self, query: str) -> str:
+        if queries is not None:
+            queries.append(query)
+        return result
+    return _run
+
+
+def fake_agent():
+    """Agent stand-in whose LLM echoes which domain it summarized."""
+    llm = MagicMock()
+    llm.call.side_effect = lambda messages: "Report on " + messages[1]["content"].split("\n")[0].strip()
+    return SimpleNamespace(role="Market Intelligence Specialist", goal="Find gaps", backstory="Researcher",
+                           llm=llm, tools=[])
+
+
+class TestDirectDomainRun(unittest.TestCase):
+    """Test one domain's tool call plus single summarization."""
+
+    def setUp(self):
+        """Set up brand info and an agent stand-in."""
+        self.brand_info = {"brand": "Acme", "product": "project software", "target": "Agencies"}
+        self.agent = fake_agent()
+
+    def test_tool_results_summarized_in_one_call(self):
+        """Test the tool runs with the product query and its results reach a single LLM call."""
+        evidence = json.dumps({"query": "project software", "competitor_count": 1})
+        queries = []
+        with patch.object(tools.CompetitorResearchTool, '_run', fake_run(evidence, queries)):
+            DirectDomainRun("competitor_analysis", self.brand_info, self.agent).kickoff()
+
+        self.assertEqual(queries, ["project software"])
+        self.assertEqual(self.agent.llm.call.call_count, 1)
+        prompt = self.agent.llm.call.call_args.args[0][1]["content"]
+        self.assertIn("Conduct comprehensive competitor analysis for Acme", prompt)
+        self.assertIn(evidence, prompt)
+
+    def test_failed_search_skips_llm(self):
+        """Test a tool error becomes the domain's error without an LLM call."""
+        with patch.object(tools.MarketTrendTool, '_run', fake_run(json.dumps({"error": "quota", "results": []}))):
+            output = DirectDomainRun("market_trends", self.brand_info, self.agent).kickoff()
+
+        self.assertEqual(output, "Error: quota")
+        self.agent.llm.call.assert_not_called()
+
+
+class TestDirectIntelligence(unittest.TestCase):
+    """Test the orchestrator's direct mode end to end with stubbed tools."""
+
+    def test_three_domains_three_llm_calls(self):
+        """Test direct mode yields the same three result fields from one call per domain."""
+        orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+        orchestrator.market_intelligence_agent = fake_agent()
+        orchestrator.async_tools = False
+
+        with patch.object(tools.CompetitorResearchTool, '_run', fake_run("{}")), \
+             patch.object(tools.CustomerInsightTool, '_run', fake_run("{}")), \
+             patch.object(tools.MarketTrendTool, '_run', fake_run("{}")):
+            results = asyncio.run(orchestrator.run_parallel_intelligence(
+                {"brand": "Acme", "product": "project software"}, prefetch=False, llm_cache=False,
+                metrics=MetricsRecorder(), direct=True
+            ))
+
+        self.assertEqual(list(results), ["competitor_analysis", "customer_insights", "market_trends"])
+        self.assertIn("competitor analysis for Acme", results["competitor_analysis"])
+        self.assertEqual(orchestrator.market_intelligence_agent.llm.call.call_count, 3)
+        self.assertEqual(len(orchestrator.crew_status["completed"]), 3)
+
+    def test_each_domain_dedupes_against_its_own_evidence(self):
+        """Test a page every domain fetched is new evidence to each summary and merged once for export."""
+        orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+        orchestrator.market_intelligence_agent = fake_agent()
+        orchestrator.async_tools = False
+
+        def _run(self, query: str) -> str:
+            _, is_new = self.evidence_index.add({"link": "https://acme.com/pricing", "snippet": "Plans"}, self.name)
+            return json.dumps({"results": "full" if is_new else "already_seen"})
+
+        with patch.object(tools.CompetitorResearchTool, '_run', _run), \
+             patch.object(tools.CustomerInsightTool, '_run', _run), \
+             patch.object(tools.MarketTrendTool, '_run', _run):
+            asyncio.run(orchestrator.run_parallel_intelligence(
+                {"brand": "Acme", "product": "project software"}, prefetch=False, llm_cache=False,
+                metrics=MetricsRecorder(), direct=True
+            ))
+
+        prompts = [call.args[0][1]["content"] for call in orchestrator.market_intelligence_agent.llm.call.call_args_list]
+        self.assertEqual(len(prompts), 3)
+        for prompt in prompts:
+            self.assertIn('"full"', prompt)
+        evidence = orchestrator.evidence_index.export()
+        self.assertEqual(len(evidence), 1)
+        self.assertEqual(len(evidence[0]["sources"]), 3)
+
+    def test_async_runs_use_search_loop_not_crew_threads(self):
+        """Test async direct runs start no crew thread and summarize on the shared summary pool."""
+        orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+        orchestrator.market_intelligence_agent = agent = fake_agent()
+        orchestrator.async_tools = True
+        self.addCleanup(search_client.close_search_loop)
+        summary_threads = []
+        agent.llm.call.side_effect = lambda messages: summary_threads.append(threading.current_thread().name) or "Report"
+
+        async def _run(self, query: str) -> str:
+            return "{}"
+
+        with patch.object(async_tools.AsyncCompetitorResearchTool, '_run', _run), \
+             patch.object(async_tools.AsyncCustomerInsightTool, '_run', _run), \
+             patch.object(async_tools.AsyncMarketTrendTool, '_run', _run), \
+             patch.object(orchestrator, 'run_crew_sync', create=True) as run_crew_sync:
+            results = asyncio.run(orchestrator.run_parallel_intelligence(
+                {"brand": "Acme", "product": "project software"}, prefetch=False, llm_cache=False,
+                metrics=MetricsRecorder(), direct=True
+            ))
+
+        self.assertEqual(results, dict.fromkeys(["competitor_analysis", "customer_insights", "market_trends"], "Report"))
+        run_crew_sync.assert_not_called()
+        self.assertEqual(len(summary_threads), 3)
+        self.assertTrue(all(name.startswith("direct-summary") for name in summary_threads))
+        self.assertEqual(orchestrator.crew_status["running"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
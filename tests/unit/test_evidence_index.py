@@ -0,0 +1,114 @@
+"""
+Unit tests for cross-tool evidence deduplication.
+"""
+
+import unittest
+import os
+import sys
+import json
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.tools.evidence_index import EvidenceIndex, canonical_url
+
+
+class TestEvidenceIndex(unittest.TestCase):
+    """Test canonical URLs and duplicate evidence detection."""
+
+    def test_canonical_url_normalization(self):
+        """Test that trivially different links map to the same page."""
+        expected = canonical_url("https://www.g2.com/products/acme/reviews")
+
+        self.assertEqual(canonical_url("http://g2.com/products/acme/reviews/"), expected)
+        self.assertEqual(canonical_url("https://www.g2.com/products/acme/reviews?utm_source=x#top"), expected)
+        self.assertNotEqual(canonical_url("https://g2.com/products/other/reviews"), expected)
+
+    def test_same_url_is_not_new(self):
+        """Test that a page seen by one tool is a reference for the next."""
+        index = EvidenceIndex()
+
+        first_id, first_new = index.add({"link": "https://reddit.com/r/x/1", "snippet": "a"}, "competitor")
+        second_id, second_new = index.add({"link": "https://www.reddit.com/r/x/1/", "snippet": "b"}, "customer")
+
+        self.assertTrue(first_new)
+        self.assertFalse(second_new)
+        self.assertEqual(first_id, second_id)
+        self.assertEqual(index.items[first_id]["sources"], {"competitor", "customer"})
+
+    def test_near_duplicate_snippets(self):
+        """Test that syndicated snippets on different URLs are detected."""
+        index = EvidenceIndex(similarity_threshold=0.7)
+        snippet = "Acme is the leading project management tool for creative agencies with 10,000 customers"
+
+        index.add({"link": "https://a.com/post", "snippet": snippet}, "competitor")
+        _, is_new = index.add({"link": "https://b.com/copy", "snippet": snippet + " worldwide"}, "trend")
+        _, other_new = index.add({"link": "https://c.com/x", "snippet": "Completely different text about pricing"}, "trend")
+
+        self.assertFalse(is_new)
+        self.assertTrue(other_new)
+        self.assertEqual(index.stats(), {"unique_evidence": 2, "duplicates_suppressed": 1})
+
+    def test_format_results_returns_only_new_evidence(self):
+        """Test that tool output lists repeated pages by ID only."""
+        from brand_positioning.tools.tools import format_results
+
+        index = EvidenceIndex()
+        shared = {"title": "G2 reviews", "snippet": "Users love it", "link": "https://g2.com/acme"}
+        first = json.loads(format_results("acme", [{"organic_results": [shared]}], "competitor", index))
+        second = json.loads(format_results("acme", [{"organic_results": [
+            shared,
+            {"title": "New", "snippet": "Fresh finding about churn", "link": "https://blog.com/churn"}
+        ]}], "customer", index))
+
+        self.assertEqual(first["results"][0]["id"], "E1")
+        self.assertEqual(second["already_seen"], ["E1"])
+        self.assertEqual([r["link"] for r in second["results"]], ["https://blog.com/churn"])
+
+    def test_merge_keeps_sources_and_counts(self):
+        """Test that merging per-crew indexes yields one entry per page with every source."""
+        shared = {"title": "G2 reviews", "snippet": "Users love it", "link": "https://g2.com/acme"}
+        competitor, customer = EvidenceIndex(), EvidenceIndex()
+        competitor.add(shared, "competitor")
+        competitor.add(shared, "competitor")
+        customer.add(shared, "customer")
+        customer.add({"title": "New", "snippet": "Fresh finding about churn", "link": "https://blog.com/churn"}, "customer")
+
+        merged = EvidenceIndex()
+        merged.merge(competitor)
+        merged.merge(customer)
+
+        self.assertEqual([item["sources"] for item in merged.export()], [["competitor", "customer"], ["customer"]])
+        self.assertEqual(merged.stats(), {"unique_evidence": 2, "duplicates_suppressed": 2})
+
+
+class TestCrewEvidenceScope(unittest.TestCase):
+    """Test that each intelligence crew dedupes only against its own evidence."""
+
+    @patch.dict(os.environ, {
+        'OPENAI_API_KEY': 'test_openai_key',
+        'SERP_API_KEY': 'test_serp_key'
+    })
+    def test_crews_get_their_own_index(self):
+        """Test a page one crew saw first still reaches the other crew in full."""
+        from brand_positioning.core.parallel_crews import ParallelCrewsOrchestrator
+
+        orchestrator = ParallelCrewsOrchestrator(async_tools=False)
+        brand_info = {"brand": "Acme", "product": "project software", "target": "Agencies"}
+        competitor_tool = orchestrator.create_competitor_crew(brand_info).tasks[0].tools[0]
+        customer_tool = orchestrator.create_customer_crew(brand_info).tasks[0].tools[0]
+
+        shared = {"organic_results": [{"title": "G2 reviews", "snippet": "Users love it", "link": "https://g2.com/acme"}]}
+        with patch('brand_positioning.tools.tools.search_many', return_value=[shared]):
+            first = json.loads(competitor_tool._run("project software"))
+            second = json.loads(customer_tool._run("project software"))
+
+        self.assertEqual(first["results"][0]["link"], "https://g2.com/acme")
+        self.assertEqual(second["results"][0]["link"], "https://g2.com/acme")
+        self.assertNotIn("already_seen", second)
+        self.assertEqual(orchestrator.merge_evidence().export()[0]["sources"], ["competitor", "customer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Unit tests for incremental re-analysis of stale intelligence domains.
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import tempfile
+import time
+from unittest.mock import patch, AsyncMock
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core import parallel_crews
+from brand_positioning.core.incremental import evidence_hash, plan_stage, REUSED, REFRESHED
+from brand_positioning.core.parallel_crews import ParallelCrewsOrchestrator
+from brand_positioning.core.result_store import ResultStore
+from brand_positioning.metrics import MetricsRecorder
+
+
+class TestStagePlanning(unittest.TestCase):
+    """Test evidence hashing and reuse decisions."""
+
+    def test_evidence_hash_ignores_order_and_tracking(self):
+        """Test that reordered results and tracking parameters hash the same."""
+        first = [{"organic_results": [
+            {"link": "https://g2.com/acme", "title": "Acme", "snippet": "Reviews"},
+            {"link": "https://capterra.com/acme", "title": "Acme", "snippet": "Pricing"}
+        ]}]
+        second = [{"organic_results": [
+            {"link": "https://capterra.com/acme", "title": "Acme", "snippet": "Pricing"},
+            {"link": "https://g2.com/acme?utm_source=serp", "title": "Acme", "snippet": "Reviews"}
+        ]}]
+        changed = [{"organic_results": [{"link": "https://g2.com/acme", "title": "Acme", "snippet": "New reviews"}]}]
+
+        self.assertEqual(evidence_hash(first), evidence_hash(second))
+        self.assertNotEqual(evidence_hash(first), evidence_hash(changed))
+        self.assertIsNone(evidence_hash([{"error": "quota exhausted"}]))
+
+    def test_plan_stage_decisions(self):
+        """Test reuse only for matching inputs within TTL."""
+        stored = {"input_hash": "abc", "output": "report", "age_hours": 30.0}
+
+        self.assertEqual(plan_stage(stored, "abc")["status"], REUSED)
+        self.assertEqual(plan_stage(stored, "abc", ttl_hours=24)["reason"], "expired")
+        self.assertEqual(plan_stage(stored, "xyz")["reason"], "inputs changed")
+        self.assertEqual(plan_stage(None, "abc")["reason"], "no stored result")
+        self.assertEqual(plan_stage(stored, None)["status"], REFRESHED)
+
+
+class TestIncrementalIntelligence(unittest.TestCase):
+    """Test that only stale domains are re-run by the orchestrator."""
+
+    def setUp(self):
+        """Create a stage store and an orchestrator without real agents."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.temp_dir.name, "results.sqlite3"))
+        self.brand_info = {"brand": "Acme", "product": "Project tool", "target": "Agencies"}
+        self.orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+        self.orchestrator.metrics = MetricsRecorder()
+        self.hashes = {"competitor_analysis": "c1", "customer_insights": "u1", "market_trends": "t1"}
+
+        patcher = patch.object(parallel_crews, 'domain_evidence_hashes', new=AsyncMock(side_effect=lambda _: dict(self.hashes)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(parallel_crews, 'start_intelligence_prefetch')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary store."""
+        self.temp_dir.cleanup()
+
+    def run_intelligence(self, outputs):
+        """Run incremental intelligence with crews that return the given outputs."""
+        async def crews(brand_info, status_callback=None, prefetch=None, llm_cache=None, domains=None, metrics=None):
+            return {domain: outputs[domain] for domain in domains}
+
+        stages = {}
+        with patch.object(self.orchestrator, 'run_parallel_intelligence', side_effect=crews) as run:
+            results = asyncio.run(self.orchestrator.run_incremental_intelligence(self.brand_info, self.store, stages))
+        return results, stages, run.call_args.kwargs["domains"]
+
+    def test_only_changed_or_expired_domains_rerun(self):
+        """Test that unchanged domains are served from the store."""
+        first = {"competitor_analysis": "C", "customer_insights": "U", "market_trends": "T"}
+        results, stages, domains = self.run_intelligence(first)
+        self.assertEqual(results, first)
+        self.assertEqual(sorted(domains), sorted(first))
+
+        # Trends evidence changed; everything else unchanged
+        self.hashes["market_trends"] = "t2"
+        results, stages, domains = self.run_intelligence({"market_trends": "T2"})
+        self.assertEqual(domains, ["market_trends"])
+        self.assertEqual(results["competitor_analysis"], "C")
+        self.assertEqual(results["market_trends"], "T2")
+        self.assertEqual(stages["competitor_analysis"]["status"], REUSED)
+        self.assertEqual(stages["market_trends"]["reason"], "inputs changed")
+
+        # Past the trends TTL the domain is refreshed even with the same evidence
+        later = time.time() + 48 * 3600
+        with patch('brand_positioning.core.result_store.time.time', return_value=later):
+            results, stages, domains = self.run_intelligence({"market_trends": "T3"})
+        self.assertEqual(domains, ["market_trends"])
+        self.assertEqual(stages["market_trends"]["reason"], "expired")
+
+    def test_failed_domain_not_stored(self):
+        """Test that a crew error is retried on the next run instead of reused."""
+        self.run_intelligence({"competitor_analysis": "C", "customer_insights": "Error: timeout", "market_trends": "T"})
+        _, _, domains = self.run_intelligence({"customer_insights": "U"})
+
+        self.assertEqual(domains, ["customer_insights"])
+
+
+class TestIncrementalSearches(unittest.TestCase):
+    """Test that hashing searches are not repeated by the refreshed crews."""
+
+    def test_refreshed_crews_reuse_hashing_searches(self):
+        """Test each query reaches SerpAPI once even with the search cache off."""
+        from brand_positioning.tools import search_client, tools
+
+        fetched = []
+
+        def fetch(params, cache):
+            fetched.append(params["q"])
+            return {"organic_results": [{"title": params["q"], "snippet": "s", "link": "https://example.com"}]}
+
+        async def crews(brand_info, status_callback=None, prefetch=None, llm_cache=None, domains=None, metrics=None):
+            tool = tools.CompetitorResearchTool()
+            return {domain: await asyncio.to_thread(tool._run, brand_info["product"]) for domain in domains}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = ResultStore(os.path.join(temp_dir, "results.sqlite3"))
+            orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+            orchestrator.metrics = MetricsRecorder()
+            with patch.object(search_client, 'get_search_cache', return_value=None), \
+                 patch.object(search_client, '_fetch', side_effect=fetch), \
+                 patch.object(orchestrator, 'run_parallel_intelligence', side_effect=crews):
+                asyncio.run(orchestrator.run_incremental_intelligence(
+                    {"brand": "Acme", "product": "Project tool"}, store, {}
+                ))
+
+        self.assertTrue(fetched)
+        self.assertEqual(sorted(fetched), sorted(set(fetched)))
+
+
+if __name__ == '__main__':
+    unittest.main()
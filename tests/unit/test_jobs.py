@@ -0,0 +1,137 @@
+"""
+Unit tests for the background analysis job runner.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core import jobs
+from brand_positioning.core.jobs import JobRunner
+
+
+class TestJobRunner(unittest.TestCase):
+    """Test submit, poll, cancel and result on the job runner."""
+
+    def setUp(self):
+        """Create a runner with stand-in workflows in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "jobs.sqlite3")
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+        def quick(brand_info, status_callback=None):
+            status_callback("Searching...", 40)
+            return {"success": True, "brand_info": brand_info, "intelligence": {"market_trends": "up"}}
+
+        def blocking(brand_info, status_callback=None, stream_callback=None):
+            self.started.set()
+            self.release.wait(5)
+            status_callback("Still working...", 60)
+            return {"success": True, "brand_info": brand_info}
+
+        def failing(brand_info, status_callback=None):
+            return {"success": False, "error": "SerpAPI down"}
+
+        modes = {"quick": quick, "full": blocking, "focused": failing}
+        patcher = patch.object(jobs, '_analysis_modes', return_value=modes)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner = JobRunner(self.path, max_workers=1)
+
+    def tearDown(self):
+        """Stop workers and remove the job table."""
+        self.release.set()
+        self.runner.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_submit_poll_and_result(self):
+        """Test that a completed job exposes its persisted result."""
+        job_id = self.runner.submit("quick", {"brand": "Acme"})
+        result = self.runner.result(job_id, timeout=5)
+
+        self.assertEqual(result["intelligence"], {"market_trends": "up"})
+        job = self.runner.poll(job_id)
+        self.assertEqual(job["status"], jobs.COMPLETED)
+        self.assertEqual(job["progress"], 100)
+        self.assertEqual(job["brand_info"], {"brand": "Acme"})
+
+    def test_failed_job_records_error(self):
+        """Test that an unsuccessful analysis is stored as failed with its error."""
+        job_id = self.runner.submit("focused", {"brand": "Acme"})
+        self.runner.result(job_id, timeout=5)
+
+        job = self.runner.poll(job_id)
+        self.assertEqual(job["status"], jobs.FAILED)
+        self.assertEqual(job["error"], "SerpAPI down")
+
+    def test_cancel_queued_and_running_jobs(self):
+        """Test that queued jobs never start and running jobs stop at their next update."""
+        running = self.runner.submit("full", {"brand": "Running"})
+        self.assertTrue(self.started.wait(5))
+        queued = self.runner.submit("quick", {"brand": "Queued"})
+
+        self.assertTrue(self.runner.cancel(queued))
+        self.assertTrue(self.runner.cancel(running))
+        self.release.set()
+        self.runner.result(running, timeout=5)
+
+        self.assertEqual(self.runner.poll(queued)["status"], jobs.CANCELLED)
+        self.assertEqual(self.runner.poll(running)["status"], jobs.CANCELLED)
+        self.assertFalse(self.runner.cancel(running))
+
+    def test_cancel_reaches_workflow_between_updates(self):
+        """Test a workflow taking cancel_event sees the cancellation without a progress update."""
+        def crews(brand_info, status_callback=None, cancel_event=None):
+            self.started.set()
+            if cancel_event.wait(5):
+                raise jobs.JobCancelled()
+            return {"success": True}
+
+        with patch.object(jobs, '_analysis_modes', return_value={"quick": crews}):
+            job_id = self.runner.submit("quick", {"brand": "Acme"})
+        self.assertTrue(self.started.wait(5))
+        self.assertTrue(self.runner.cancel(job_id))
+        self.runner.result(job_id, timeout=2)
+
+        self.assertEqual(self.runner.poll(job_id)["status"], jobs.CANCELLED)
+
+    def test_finished_jobs_released_and_pruned(self):
+        """Test finished jobs drop their in-memory state and expire after the retention period."""
+        job_id = self.runner.submit("quick", {"brand": "Acme"})
+        self.runner.result(job_id, timeout=5)
+        self.assertNotIn(job_id, self.runner._futures)
+        self.assertNotIn(job_id, self.runner._cancel_events)
+
+        self.runner._update(job_id, finished_at=0)
+        self.assertEqual(JobRunner(self.path, max_workers=1, retention_hours=0).prune(), 0)
+        self.assertIsNotNone(self.runner.poll(job_id))
+        self.assertEqual(self.runner.prune(), 1)
+        self.assertIsNone(self.runner.poll(job_id))
+
+    def test_unknown_mode_rejected(self):
+        """Test that only the three analysis modes can be submitted."""
+        with self.assertRaises(ValueError):
+            self.runner.submit("bogus", {})
+
+    def test_restart_marks_unfinished_jobs_failed(self):
+        """Test that jobs interrupted by a restart are not left running forever."""
+        job_id = self.runner.submit("full", {"brand": "Acme"})
+        self.assertTrue(self.started.wait(5))
+
+        restarted = JobRunner(self.path, max_workers=1)
+        job = restarted.poll(job_id)
+        restarted.shutdown()
+
+        self.assertEqual(job["status"], jobs.FAILED)
+        self.assertEqual(job["error"], "Interrupted by restart")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the LLM completion cache.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.agents.llm_cache import LLMCache, LLMCacheSession
+
+
+class TestLLMCache(unittest.TestCase):
+    """Test completion cache storage, keys and eviction."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = LLMCache(
+            os.path.join(self.temp_dir.name, "llm.sqlite3"), ttl_seconds=60, max_entries=2
+        )
+
+    def tearDown(self):
+        """Remove the temporary cache."""
+        self.temp_dir.cleanup()
+
+    def test_key_covers_model_temperature_and_prompt(self):
+        """Test that any change to model, temperature or prompt changes the key."""
+        messages = [{"role": "user", "content": "Position Acme"}]
+        key = LLMCache.make_key("gpt-4o", 0.1, messages)
+
+        self.assertEqual(key, LLMCache.make_key("gpt-4o", 0.1, list(messages)))
+        self.assertNotEqual(key, LLMCache.make_key("gpt-4o-mini", 0.1, messages))
+        self.assertNotEqual(key, LLMCache.make_key("gpt-4o", 0.7, messages))
+        self.assertNotEqual(key, LLMCache.make_key("gpt-4o", 0.1, [{"role": "user", "content": "Position Beta"}]))
+
+    def test_hit_reports_saved_tokens_and_evicts_lru(self):
+        """Test that hits return stored token counts and old entries are evicted."""
+        self.cache.set("a", "answer a", prompt_tokens=100, completion_tokens=20)
+        self.cache.set("b", "answer b")
+        self.assertEqual(self.cache.get("a"), ("answer a", 120))
+
+        self.cache.set("c", "answer c")
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.evictions, 1)
+
+
+class TestAgentLLMCaching(unittest.TestCase):
+    """Test that agent LLM calls are served from the cache."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = LLMCache(
+            os.path.join(self.temp_dir.name, "llm.sqlite3"), ttl_seconds=60, max_entries=10
+        )
+
+    def tearDown(self):
+        """Remove the temporary cache."""
+        self.temp_dir.cleanup()
+
+    def _call_twice(self, session):
+        from crewai import LLM
+        from brand_positioning.agents import llm as llm_module
+
+        with patch.object(llm_module, 'get_llm_cache', return_value=self.cache), \
+             patch.object(LLM, 'call', return_value="strategy") as mock_call:
+            agent_llm = llm_module.AgentLLM(model="gpt-4o", api_key="test", temperature=0.1)
+            agent_llm.cache_session = session
+            results = [agent_llm.call([{"role": "user", "content": "Position Acme"}]) for _ in range(2)]
+        return results, mock_call.call_count
+
+    def test_repeat_prompt_served_from_cache(self):
+        """Test that the second identical prompt skips the provider."""
+        session = LLMCacheSession(enabled=True)
+        results, provider_calls = self._call_twice(session)
+
+        self.assertEqual(results, ["strategy", "strategy"])
+        self.assertEqual(provider_calls, 1)
+        stats = session.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["tokens_saved"], 0)
+
+    def test_run_can_bypass_cache(self):
+        """Test that a disabled session always calls the provider."""
+        session = LLMCacheSession(enabled=False)
+        _, provider_calls = self._call_twice(session)
+
+        self.assertEqual(provider_calls, 2)
+        self.assertEqual(session.stats()["hits"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
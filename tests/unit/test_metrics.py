@@ -0,0 +1,110 @@
+"""
+Unit tests for per-analysis timing and token instrumentation.
+"""
+
+import unittest
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.metrics import MetricsRecorder, STAGE, KICKOFF, span, otlp_payload
+from brand_positioning.rate_limiter import TokenBucket
+
+
+class TestMetricsRecorder(unittest.TestCase):
+    """Test span aggregation and trace export."""
+
+    def test_summary_aggregates_spans_and_counters(self):
+        """Test that stages, kickoffs and counters roll up into the metrics block."""
+        recorder = MetricsRecorder()
+        with recorder.span(STAGE, "positioning"):
+            with recorder.span(KICKOFF, "positioning"):
+                time.sleep(0.01)
+        recorder.count("serp_cache_hits", 2)
+
+        summary = recorder.summary()
+        self.assertGreater(summary["stages"]["positioning"], 0)
+        self.assertEqual(summary["kickoffs"]["calls"], 1)
+        self.assertEqual(summary["serp"]["cache_hits"], 2)
+        self.assertEqual(summary["serp"]["calls"], 0)
+        self.assertEqual(summary["cost_usd"]["total"], 0)
+
+    def test_export_spans_links_parents(self):
+        """Test OTLP export with nested spans and typed attributes."""
+        recorder = MetricsRecorder()
+        with recorder.span(STAGE, "intelligence") as outer:
+            with recorder.span(KICKOFF, "market_trends", retries=0):
+                pass
+        with self.assertRaises(ValueError):
+            with recorder.span(STAGE, "actions"):
+                raise ValueError("boom")
+
+        spans = {s["name"]: s for s in recorder.export_spans()}
+        self.assertEqual(spans["kickoff:market_trends"]["parentSpanId"], outer["span_id"])
+        self.assertIn({"key": "retries", "value": {"intValue": "0"}}, spans["kickoff:market_trends"]["attributes"])
+        self.assertEqual(spans["stage:actions"]["status"]["code"], "STATUS_CODE_ERROR")
+        self.assertEqual(len(otlp_payload(list(spans.values()))["resourceSpans"][0]["scopeSpans"][0]["spans"]), 3)
+
+    def test_span_without_recorder_is_noop(self):
+        """Test that instrumented code runs unchanged outside an analysis."""
+        with span("serp", "query") as record:
+            record["attributes"]["queue_wait"] = 0.5
+
+
+class TestSearchInstrumentation(unittest.TestCase):
+    """Test that searches on worker threads are recorded against their analysis."""
+
+    def test_search_many_records_requests_and_coalescing(self):
+        """Test network calls become spans and coalesced duplicates are counted."""
+        from brand_positioning.tools import search_client
+
+        def slow_search(params):
+            time.sleep(0.05)
+            return {"organic_results": [{"title": params["q"]}]}
+
+        recorder = MetricsRecorder()
+        with patch.object(search_client, 'get_search_cache', return_value=None), \
+             patch.object(search_client, 'get_serp_limiter', return_value=TokenBucket(rate_per_minute=600, capacity=10)), \
+             patch.object(search_client.SearchClient, 'search', side_effect=slow_search):
+            search_client.search_many([{"q": "a"}, {"q": "b"}, {"q": "a"}], max_workers=3, metrics=recorder)
+
+        summary = recorder.summary()
+        self.assertEqual(summary["serp"]["calls"], 2)
+        self.assertEqual(summary["serp"]["coalesced"], 1)
+        self.assertGreaterEqual(summary["serp"]["wall_seconds"], 0.1)
+        self.assertAlmostEqual(summary["cost_usd"]["serp"], 2 * search_client.Config.SERPAPI_COST_PER_SEARCH)
+
+
+class TestLLMInstrumentation(unittest.TestCase):
+    """Test that agent LLM calls record tokens and queue wait."""
+
+    @patch.dict(os.environ, {
+        'OPENAI_API_KEY': 'test_openai_key',
+        'SERP_API_KEY': 'test_serp_key'
+    })
+    def test_llm_call_span_has_tokens(self):
+        """Test tokens in and out are counted for each completion."""
+        from crewai import LLM
+        from brand_positioning.agents import llm as llm_module
+
+        recorder = MetricsRecorder()
+        with patch.object(llm_module, 'get_llm_limiter', return_value=TokenBucket(rate_per_minute=60, capacity=5)), \
+             patch.object(llm_module, 'get_llm_cache', return_value=None), \
+             patch.object(LLM, 'call', return_value="A focused positioning statement"):
+            agent_llm = llm_module.AgentLLM(model="gpt-4o", api_key="test", temperature=0.1)
+            agent_llm.metrics = recorder
+            agent_llm.call([{"role": "user", "content": "Position Acme for agencies"}])
+
+        summary = recorder.summary()
+        self.assertEqual(summary["llm"]["calls"], 1)
+        self.assertGreater(summary["llm"]["tokens_in"], 0)
+        self.assertGreater(summary["llm"]["tokens_out"], 0)
+        self.assertGreater(summary["cost_usd"]["llm"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Unit tests for the process-pool analysis backend.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.config import Config
+from brand_positioning.core import jobs
+from brand_positioning.core.jobs import JobCancelled, JobRunner
+from brand_positioning.core.process_pool import AnalysisProcessPool
+
+
+# Workflows run in the worker processes, so they must be importable module-level functions
+def reporting_workflow(brand_info, status_callback=None, stream_callback=None):
+    status_callback("Searching...", 30)
+    if stream_callback:
+        stream_callback({"positioning_strategy": "Own agencies"})
+    status_callback("Writing...", 80)
+    return {
+        "success": True,
+        "brand_info": brand_info,
+        "pid": os.getpid(),
+        "serp_rate": Config.REQUESTS_PER_MINUTE,
+        "finished_at": time  # Not serializable: must come back as a string
+    }
+
+
+def credentials_workflow(brand_info, status_callback=None):
+    return {"success": True, "serp_key": Config.SERP_API_KEY, "openai_env": os.environ.get("OPENAI_API_KEY")}
+
+
+def waiting_workflow(brand_info, status_callback=None, cancel_event=None):
+    return {"success": True, "cancelled": cancel_event.wait(5)}
+
+
+def slow_workflow(brand_info, status_callback=None):
+    for step in range(50):
+        status_callback(f"Step {step}", step)
+        time.sleep(0.02)
+    return {"success": True, "steps": 50}
+
+
+class TestAnalysisProcessPool(unittest.TestCase):
+    """Test analyses run in worker processes with progress and cancellation relayed."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one small pool without warm imports for every test."""
+        cls.pool = AnalysisProcessPool(max_workers=2, warm_modules=[])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the workers."""
+        cls.pool.shutdown()
+
+    def test_result_is_plain_dict_from_worker(self):
+        """Test the result comes from another process as JSON types, with progress and partials relayed."""
+        updates, partials = [], []
+        result = self.pool.run(
+            reporting_workflow, {"brand": "Acme"},
+            status_callback=lambda message, progress=None: updates.append((message, progress)),
+            stream_callback=partials.append
+        )
+
+        self.assertNotEqual(result["pid"], os.getpid())
+        self.assertIsInstance(result["finished_at"], str)
+        self.assertEqual(updates, [("Searching...", 30), ("Writing...", 80)])
+        self.assertEqual(partials, [{"positioning_strategy": "Own agencies"}])
+        # Two workers each get half of the rate limit
+        self.assertEqual(result["serp_rate"], Config.REQUESTS_PER_MINUTE / 2)
+
+    def test_keys_set_after_start_reach_worker(self):
+        """Test API keys entered after the workers started are used by the worker's analysis."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-entered-later", "SERP_API_KEY": "serp-entered-later"}):
+            result = self.pool.run(credentials_workflow, {"brand": "Acme"})
+
+        self.assertEqual(result["serp_key"], "serp-entered-later")
+        self.assertEqual(result["openai_env"], "sk-entered-later")
+
+    def test_cancel_stops_worker_analysis(self):
+        """Test an exception from status_callback stops the worker's analysis and frees the worker."""
+        def status_callback(message, progress=None):
+            if progress >= 2:
+                raise JobCancelled()
+
+        started = time.monotonic()
+        with self.assertRaises(JobCancelled):
+            self.pool.run(slow_workflow, {"brand": "Acme"}, status_callback=status_callback)
+        self.assertLess(time.monotonic() - started, 0.8)
+
+        result = self.pool.run(reporting_workflow, {"brand": "Acme"}, status_callback=lambda *args: None)
+        self.assertTrue(result["success"])
+
+    def test_cancel_event_reaches_worker(self):
+        """Test a cancel_event set in this process is seen by a worker that is not reporting progress."""
+        cancel_event = threading.Event()
+        threading.Timer(0.2, cancel_event.set).start()
+        started = time.monotonic()
+        result = self.pool.run(waiting_workflow, {"brand": "Acme"}, cancel_event=cancel_event)
+
+        self.assertTrue(result["cancelled"])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_job_runner_uses_process_pool(self):
+        """Test a submitted job runs in a worker and its result is persisted."""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+             patch.object(jobs, '_analysis_modes', return_value={"full": reporting_workflow}):
+            runner = JobRunner(os.path.join(temp_dir, "jobs.sqlite3"), max_workers=1, process_pool=self.pool)
+            job_id = runner.submit("full", {"brand": "Acme"})
+            result = runner.result(job_id, timeout=30)
+            runner.shutdown()
+
+        self.assertNotEqual(result["pid"], os.getpid())
+        self.assertEqual(result["brand_info"], {"brand": "Acme"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the progressive positioning pipeline.
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.config import Config
+from brand_positioning.core import parallel_crews
+from brand_positioning.core.jobs import JobCancelled
+from brand_positioning.core.parallel_crews import ParallelCrewsOrchestrator
+
+
+class TestProgressivePipeline(unittest.TestCase):
+    """Test that domains are handed downstream as they finish and digests are merged."""
+
+    def setUp(self):
+        """Create an orchestrator whose crews are just their run times."""
+        self.orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+
+        def run_crew_sync(crew, name="crew"):
+            time.sleep(crew)
+            return f"{name} report"
+
+        patcher = patch.object(self.orchestrator, 'run_crew_sync', side_effect=run_crew_sync, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_domains_handed_downstream_as_they_finish(self):
+        """Test fast domains reach on_result before the slow crew completes."""
+        crews = {"competitor_analysis": 0.01, "customer_insights": 0.05, "market_trends": 0.3}
+        handed = []
+
+        async def run():
+            started = time.monotonic()
+            on_result = lambda domain, output: handed.append((domain, time.monotonic() - started))
+            return await self.orchestrator.run_crews_with_deadlines({"brand": "Acme"}, crews, {}, on_result)
+
+        with patch.object(Config, 'STRAGGLER_POLICY', 'wait'), \
+             patch.object(Config, 'INTELLIGENCE_DEADLINE_SECONDS', 5):
+            results = asyncio.run(run())
+
+        self.assertEqual([domain for domain, _ in handed], ["competitor_analysis", "customer_insights", "market_trends"])
+        self.assertLess(handed[1][1], 0.2)
+        self.assertEqual(results["market_trends"], "market_trends report")
+
+    def test_cancelled_job_stops_waiting_on_crews(self):
+        """Test a set cancel_event ends the wait on running crews without waiting for them."""
+        self.orchestrator.cancel_event = threading.Event()
+        crews = {"competitor_analysis": 0.01, "market_trends": 5}
+
+        async def run():
+            asyncio.get_running_loop().call_later(0.1, self.orchestrator.cancel_event.set)
+            return await self.orchestrator.run_crews_with_deadlines({"brand": "Acme"}, crews, {})
+
+        started = time.monotonic()
+        with patch.object(Config, 'STRAGGLER_POLICY', 'wait'), \
+             patch.object(Config, 'INTELLIGENCE_DEADLINE_SECONDS', 0), \
+             self.assertRaises(JobCancelled):
+            asyncio.run(run())
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_merge_falls_back_to_findings_without_digest(self):
+        """Test failed, missing and skipped digests fall back to the domain's own findings."""
+        intelligence = {"competitor_analysis": "C", "customer_insights": "U", "market_trends": "T"}
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            digests = {
+                "competitor_analysis": self.orchestrator._start_crew(loop, 0.01, "competitor_digest"),
+                "customer_insights": loop.create_future(),
+                "market_trends": None
+            }
+            digests["customer_insights"].set_result("Error: rate limited")
+            return await self.orchestrator._collect_digests(digests, intelligence)
+
+        merged, status = asyncio.run(run())
+
+        self.assertEqual(merged["competitor_analysis"], "competitor_digest report")
+        self.assertEqual(merged["customer_insights"], "U")
+        self.assertEqual(merged["market_trends"], "T")
+        self.assertEqual(status, {"competitor_analysis": "digested", "customer_insights": "raw", "market_trends": "raw"})
+
+    def test_each_digest_runs_on_its_own_agent(self):
+        """Test concurrent digests check out separate agents and return them when they finish."""
+        pool = MagicMock()
+        pool.acquire.side_effect = lambda factory: MagicMock()
+        crews = []
+
+        async def run():
+            return await asyncio.gather(*[
+                self.orchestrator._start_digest({"brand": "Acme"}, domain, "findings")
+                for domain in ("competitor_analysis", "customer_insights")
+            ])
+
+        with patch.object(parallel_crews, 'get_agent_pool', return_value=pool), \
+             patch.object(parallel_crews, 'create_domain_digest_task', return_value=MagicMock()), \
+             patch.object(parallel_crews, 'Crew', side_effect=lambda agents, **kwargs: crews.append(agents[0]) or 0.01), \
+             patch.object(self.orchestrator, 'bind_llm_cache', create=True), \
+             patch.object(self.orchestrator, 'bind_metrics', create=True), \
+             patch.object(self.orchestrator, 'llm_cache_session', None, create=True), \
+             patch.object(self.orchestrator, 'metrics', None, create=True):
+            asyncio.run(run())
+
+        self.assertEqual(len(crews), 2)
+        self.assertIsNot(crews[0], crews[1])
+        released = [call.args[0] for call in pool.release.call_args_list]
+        self.assertCountEqual(released, crews)
+
+    def test_digest_wait_is_finite_without_crew_deadline(self):
+        """Test positioning stops waiting for a hung digest even when CREW_DEADLINE_SECONDS is 0."""
+        intelligence = {"competitor_analysis": "C"}
+
+        async def run():
+            digests = {"competitor_analysis": asyncio.get_running_loop().create_future()}
+            return await self.orchestrator._collect_digests(digests, intelligence)
+
+        with patch.object(Config, 'CREW_DEADLINE_SECONDS', 0), \
+             patch.object(parallel_crews, 'DIGEST_TIMEOUT_SECONDS', 0.05):
+            merged, status = asyncio.run(run())
+
+        self.assertEqual(merged, intelligence)
+        self.assertEqual(status, {"competitor_analysis": "raw"})
+
+
+if __name__ == '__main__':
+    unittest.main()
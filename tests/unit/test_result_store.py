@@ -0,0 +1,98 @@
+"""
+Unit tests for the persistent analysis result store.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core import jobs
+from brand_positioning.core.jobs import JobRunner
+from brand_positioning.core.result_store import ResultStore, fingerprint
+
+
+class TestResultStore(unittest.TestCase):
+    """Test storing results and serving them by brand fingerprint."""
+
+    def setUp(self):
+        """Create a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.temp_dir.name, "results.sqlite3"))
+        self.brand_info = {"brand": "Acme", "product": "Project tool", "target": "Agencies"}
+
+    def tearDown(self):
+        """Remove the temporary store."""
+        self.temp_dir.cleanup()
+
+    def test_fingerprint_normalizes_brand_info(self):
+        """Test that spacing and case don't change a brand's fingerprint."""
+        same = {"brand": "ACME ", "product": "project   tool", "target": "agencies", "notes": "ignored"}
+
+        self.assertEqual(fingerprint(self.brand_info, "focused"), fingerprint(same, "focused"))
+        self.assertNotEqual(fingerprint(self.brand_info, "focused"), fingerprint(self.brand_info, "full"))
+
+    def test_latest_respects_max_age(self):
+        """Test that the newest result is served only while fresh enough."""
+        evidence = [{"id": "E1", "link": "https://g2.com/acme", "sources": ["competitor"]}]
+        self.store.save(self.brand_info, "full", {"success": True, "positioning_strategy": "old"})
+        self.store.save(self.brand_info, "full", {"success": True, "positioning_strategy": "new", "evidence": evidence})
+
+        latest = self.store.latest(self.brand_info, "full", max_age_hours=1)
+        self.assertEqual(latest["result"]["positioning_strategy"], "new")
+        self.assertEqual(latest["evidence"], evidence)
+        self.assertEqual(len(self.store.history(self.brand_info, "full")), 2)
+
+        with patch('brand_positioning.core.result_store.time.time', return_value=time.time() + 7200):
+            self.assertIsNone(self.store.latest(self.brand_info, "full", max_age_hours=1))
+        self.assertIsNone(self.store.latest(self.brand_info, "focused"))
+
+
+class TestJobRunnerResultReuse(unittest.TestCase):
+    """Test that submitted jobs are served from the store when a fresh result exists."""
+
+    def setUp(self):
+        """Create a runner backed by a result store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.calls = []
+
+        def focused(brand_info, status_callback=None):
+            self.calls.append(brand_info["brand"])
+            return {"success": True, "brand_info": brand_info, "niche_positioning": "Own agencies"}
+
+        patcher = patch.object(jobs, '_analysis_modes', return_value={"focused": focused})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        store = ResultStore(os.path.join(self.temp_dir.name, "results.sqlite3"))
+        self.runner = JobRunner(os.path.join(self.temp_dir.name, "jobs.sqlite3"), max_workers=1, result_store=store)
+        self.brand_info = {"brand": "Acme", "product": "Project tool", "target": "Agencies"}
+
+    def tearDown(self):
+        """Stop workers and remove temporary files."""
+        self.runner.shutdown()
+        self.temp_dir.cleanup()
+
+    def test_repeat_submission_served_instantly(self):
+        """Test that a second submission reuses the stored result unless refreshed."""
+        first = self.runner.submit("focused", self.brand_info)
+        self.runner.result(first, timeout=5)
+
+        second = self.runner.submit("focused", self.brand_info)
+        served = self.runner.poll(second)
+        self.assertEqual(served["status"], jobs.COMPLETED)
+        self.assertEqual(served["result"]["niche_positioning"], "Own agencies")
+        self.assertIn("stored_result", served["result"])
+
+        refreshed = self.runner.submit("focused", self.brand_info, refresh=True)
+        self.runner.result(refreshed, timeout=5)
+        self.assertEqual(self.calls, ["Acme", "Acme"])
+
+
+if __name__ == '__main__':
+    unittest.main()
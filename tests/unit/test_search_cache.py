@@ -0,0 +1,94 @@
+"""
+Unit tests for the SerpAPI response cache.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.tools.search_cache import SearchCache
+
+
+class TestSearchCache(unittest.TestCase):
+    """Test search cache storage, expiry and eviction."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache.sqlite3")
+        self.cache = SearchCache(self.path, ttl_seconds=60, max_entries=3)
+
+    def tearDown(self):
+        """Remove the temporary cache."""
+        self.temp_dir.cleanup()
+
+    def test_miss_then_hit(self):
+        """Test that stored responses are served on the next lookup."""
+        params = {"q": "coffee competitors", "num": 5, "api_key": "key"}
+
+        self.assertIsNone(self.cache.get(params))
+        self.cache.set(params, {"organic_results": [{"title": "A"}]}, fetch_seconds=1.5)
+
+        self.assertEqual(self.cache.get(params), {"organic_results": [{"title": "A"}]})
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["seconds_saved"], 1.5)
+
+    def test_api_key_not_part_of_key(self):
+        """Test that different API keys share the same cached response."""
+        self.cache.set({"q": "tea", "num": 5, "api_key": "one"}, {"organic_results": []})
+
+        self.assertIsNotNone(self.cache.get({"q": "tea", "num": 5, "api_key": "two"}))
+        self.assertIsNone(self.cache.get({"q": "tea", "num": 8, "api_key": "one"}))
+
+    def test_ttl_expiry(self):
+        """Test that expired entries count as misses."""
+        cache = SearchCache(self.path, ttl_seconds=0.01, max_entries=3)
+        cache.set({"q": "stale"}, {"organic_results": []})
+        time.sleep(0.05)
+
+        self.assertIsNone(cache.get({"q": "stale"}))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        for query in ["a", "b", "c"]:
+            self.cache.set({"q": query}, {"organic_results": []})
+            time.sleep(0.01)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        self.cache.get({"q": "a"})
+        self.cache.set({"q": "d"}, {"organic_results": []})
+
+        self.assertIsNotNone(self.cache.get({"q": "a"}))
+        self.assertIsNone(self.cache.get({"q": "b"}))
+        self.assertEqual(self.cache.stats()["entries"], 3)
+
+    def test_google_search_uses_cache(self):
+        """Test that repeat searches skip SerpAPI and errors are not cached."""
+        from brand_positioning.tools import search_client
+
+        with patch.object(search_client, 'get_search_cache', return_value=self.cache), \
+             patch.object(search_client.SearchClient, 'search') as mock_search:
+            mock_search.return_value = {"organic_results": [{"title": "X"}]}
+
+            first = search_client.google_search({"q": "repeat", "num": 5})
+            second = search_client.google_search({"q": "repeat", "num": 5})
+
+            self.assertEqual(first, second)
+            self.assertEqual(mock_search.call_count, 1)
+
+            mock_search.return_value = {"error": "Invalid API key"}
+            search_client.google_search({"q": "broken", "num": 5})
+            search_client.google_search({"q": "broken", "num": 5})
+            self.assertEqual(mock_search.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
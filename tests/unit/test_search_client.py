@@ -0,0 +1,281 @@
+"""
+Unit tests for the shared search client and rate limiter.
+"""
+
+import unittest
+import os
+import sys
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.rate_limiter import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test token bucket rate limiting."""
+
+    def test_burst_within_capacity_does_not_block(self):
+        """Test that callers only wait once the budget is exhausted."""
+        bucket = TokenBucket(rate_per_minute=60, capacity=3)
+
+        for _ in range(3):
+            self.assertEqual(bucket.acquire(), 0.0)
+
+        self.assertGreater(bucket.try_acquire(), 0.0)
+
+    def test_refill_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        bucket = TokenBucket(rate_per_minute=6000, capacity=1)
+        bucket.acquire()
+
+        waited = bucket.acquire()
+        self.assertGreater(waited, 0.0)
+        self.assertLess(waited, 0.1)
+
+    def test_zero_rate_is_unlimited(self):
+        """Test that a rate of 0 never blocks and a negative rate is rejected."""
+        bucket = TokenBucket(rate_per_minute=0)
+
+        for _ in range(100):
+            self.assertEqual(bucket.try_acquire(), 0.0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate_per_minute=-1)
+
+    def test_async_acquire(self):
+        """Test that async callers wait without blocking the event loop."""
+        import asyncio
+        bucket = TokenBucket(rate_per_minute=6000, capacity=1)
+
+        async def acquire_twice():
+            await bucket.acquire_async()
+            return await bucket.acquire_async()
+
+        self.assertGreater(asyncio.run(acquire_twice()), 0.0)
+
+    @patch.dict(os.environ, {
+        'OPENAI_API_KEY': 'test_openai_key',
+        'SERP_API_KEY': 'test_serp_key'
+    })
+    def test_llm_calls_go_through_llm_limiter(self):
+        """Test that agent LLM calls take a token from the shared LLM bucket."""
+        from crewai import LLM
+        from brand_positioning.agents import llm as llm_module
+
+        bucket = TokenBucket(rate_per_minute=60, capacity=5)
+        with patch.object(llm_module, 'get_llm_limiter', return_value=bucket), \
+             patch.object(llm_module, 'get_llm_cache', return_value=None), \
+             patch.object(LLM, 'call', return_value="ok"):
+            agent_llm = llm_module.AgentLLM(model="gpt-4o", api_key="test", temperature=0.1)
+            self.assertEqual(agent_llm.call("hello"), "ok")
+
+        self.assertLess(bucket._tokens, 5)
+
+
+class TestSearchMany(unittest.TestCase):
+    """Test concurrent search fan-out."""
+
+    def test_results_preserve_query_order(self):
+        """Test that concurrent results are merged back in query order."""
+        from brand_positioning.tools import search_client
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_search(params):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            # Later queries finish first to prove ordering is preserved
+            time.sleep(0.05 * (4 - int(params["q"])))
+            with lock:
+                active.pop()
+            return {"organic_results": [{"title": params["q"]}]}
+
+        with patch.object(search_client, 'google_search', side_effect=fake_search):
+            results = search_client.search_many([{"q": str(i)} for i in range(4)], max_workers=4)
+
+        self.assertEqual([r["organic_results"][0]["title"] for r in results], ["0", "1", "2", "3"])
+        self.assertGreater(max(peak), 1)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test coalescing of identical in-flight searches."""
+
+    def test_concurrent_identical_searches_share_one_request(self):
+        """Test that concurrent identical queries issue a single SerpAPI request."""
+        from brand_positioning.tools import search_client
+
+        def slow_search(params):
+            time.sleep(0.1)
+            return {"organic_results": [{"title": params["q"]}]}
+
+        with patch.object(search_client, 'get_search_cache', return_value=None), \
+             patch.object(search_client.SearchClient, 'search', side_effect=slow_search) as mock_search:
+
+            results = search_client.search_many([{"q": "same", "num": 5}] * 4, max_workers=4)
+
+        self.assertEqual(mock_search.call_count, 1)
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_errors_propagate_to_all_waiters(self):
+        """Test that a failed leader request raises for every waiting caller."""
+        from brand_positioning.metrics import MetricsRecorder, activate
+        from brand_positioning.tools.search_client import SingleFlight
+
+        flight = SingleFlight()
+        recorder = MetricsRecorder()
+        errors = []
+
+        def failing():
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        def call():
+            with activate(recorder):
+                try:
+                    flight.do("key", failing)
+                except RuntimeError as e:
+                    errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, ["boom"] * 3)
+        self.assertEqual(recorder.summary()["serp"]["coalesced"], 2)
+
+
+class TestPrefetch(unittest.TestCase):
+    """Test the pre-fetch warm store."""
+
+    def test_tools_are_served_from_prefetch(self):
+        """Test that prefetched queries are not requested again by tools."""
+        from brand_positioning.tools import search_client
+
+        def slow_search(params):
+            time.sleep(0.05)
+            return {"organic_results": [{"title": params["q"]}]}
+
+        params_list = [{"q": "a", "num": 5}, {"q": "b", "num": 5}]
+        with patch.object(search_client, 'get_search_cache', return_value=None), \
+             patch.object(search_client.SearchClient, 'search', side_effect=slow_search) as mock_search:
+            prefetcher = search_client.prefetch_searches(params_list)
+            # Still in flight: the tool waits for the prefetch instead of searching again
+            results = search_client.search_many(params_list)
+            prefetcher.wait()
+            self.assertEqual(mock_search.call_count, 2)
+            self.assertEqual(results[1]["organic_results"][0]["title"], "b")
+
+            prefetcher.close()
+            self.assertEqual(search_client._warm, {})
+
+    def test_intelligence_params_cover_every_tool_query(self):
+        """Test that prefetch params match the configured query counts."""
+        from brand_positioning.config import Config
+        from brand_positioning.core.prefetch import intelligence_search_params, focused_search_params
+
+        brand_info = {"brand": "TestBrand", "product": "test platform", "target": "testers"}
+        search_config = Config.get_search_config()
+        expected = (search_config["competitor_searches"] + search_config["customer_searches"]
+                    + search_config["trend_searches"])
+
+        self.assertEqual(len(intelligence_search_params(brand_info)), expected)
+        self.assertEqual(len(focused_search_params(brand_info)), 4)
+
+
+class _StandInSerpHandler(BaseHTTPRequestHandler):
+    """Minimal local SerpAPI stand-in that records client connections."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        body = json.dumps({"organic_results": [{"title": self.path}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSearchClient(unittest.TestCase):
+    """Test the pooled SerpAPI HTTP client against a local stand-in."""
+
+    def setUp(self):
+        """Start the stand-in server."""
+        _StandInSerpHandler.client_ports = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInSerpHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        """Stop the stand-in server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        """Test that sequential searches share one keep-alive connection."""
+        from brand_positioning.tools.search_client import SearchClient
+
+        client = SearchClient(self.base_url, pool_size=2, timeout=5, max_retries=0)
+        params = {"q": "coffee", "num": 5, "api_key": "key"}
+        for _ in range(3):
+            result = client.search(params)
+            self.assertIn("organic_results", result)
+        client.close()
+
+        self.assertEqual(len(_StandInSerpHandler.client_ports), 3)
+        self.assertEqual(len(set(_StandInSerpHandler.client_ports)), 1)
+        # Caller params must not be mutated (they double as cache keys)
+        self.assertEqual(params, {"q": "coffee", "num": 5, "api_key": "key"})
+
+    def test_async_batch_against_stand_in(self):
+        """Test that async searches run on one loop and keep query order."""
+        import asyncio
+        from brand_positioning.config import Config
+        from brand_positioning.tools import search_client
+
+        params_list = [{"q": f"query-{i}", "num": 5} for i in range(3)]
+        with patch.object(Config, 'SERPAPI_BASE_URL', self.base_url), \
+             patch.object(search_client, 'get_search_cache', return_value=None):
+            results = asyncio.run(search_client.search_many_async(params_list))
+
+        titles = [r["organic_results"][0]["title"] for r in results]
+        for i, title in enumerate(titles):
+            self.assertIn(f"q=query-{i}", title)
+        self.assertEqual(search_client._async_clients, {})
+
+    def test_async_tool_calls_share_search_loop(self):
+        """Test that tool calls on separate short-lived loops reuse one keep-alive connection."""
+        import asyncio
+        from brand_positioning.config import Config
+        from brand_positioning.tools import search_client
+
+        self.addCleanup(search_client.close_search_loop)
+        with patch.object(Config, 'SERPAPI_BASE_URL', self.base_url), \
+             patch.object(search_client, 'get_search_cache', return_value=None):
+            search_client.close_search_loop()
+            # Like CrewAI: a fresh asyncio.run() per tool call
+            for i in range(3):
+                results = asyncio.run(search_client.search_many_shared([{"q": f"query-{i}", "num": 5}]))
+                self.assertIn(f"q=query-{i}", results[0]["organic_results"][0]["title"])
+
+        self.assertEqual(len(_StandInSerpHandler.client_ports), 3)
+        self.assertEqual(len(set(_StandInSerpHandler.client_ports)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
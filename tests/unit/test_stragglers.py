@@ -0,0 +1,126 @@
+"""
+Unit tests for intelligence crew deadlines and straggler policies.
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.config import Config
+from brand_positioning.core import parallel_crews
+from brand_positioning.core.parallel_crews import ParallelCrewsOrchestrator, pooled_orchestrator
+
+
+class TestStragglerPolicies(unittest.TestCase):
+    """Test wait, partial and hedge handling of a slow crew."""
+
+    def setUp(self):
+        """Create an orchestrator whose crews are just their run times."""
+        self.orchestrator = ParallelCrewsOrchestrator.__new__(ParallelCrewsOrchestrator)
+        self.orchestrator.domain_indexes = {}
+        self.launched = []
+        self.hedge_agents = []
+        self.released = []
+
+        def run_crew_sync(crew, name="crew"):
+            self.launched.append(name)
+            time.sleep(crew)
+            return f"{name} report"
+
+        patcher = patch.object(self.orchestrator, 'run_crew_sync', side_effect=run_crew_sync, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(self.orchestrator, 'acquire_hedge_agent', side_effect=lambda: f"agent-{len(self.released)}")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(self.orchestrator, 'release_hedge_agent', side_effect=self.released.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_crews(self, policy, crew_deadline=0.1, stage_deadline=0.5, trends_seconds=0.3, hedge_seconds=0.01):
+        """Run two fast crews and a slow trends crew under the given policy."""
+        crews = {"competitor_analysis": 0.01, "customer_insights": 0.01, "market_trends": trends_seconds}
+        def factory(brand_info, hedge_agent=None):
+            self.hedge_agents.append(hedge_agent)
+            return hedge_seconds
+
+        factories = dict.fromkeys(crews, factory)
+        with patch.object(Config, 'STRAGGLER_POLICY', policy), \
+             patch.object(Config, 'CREW_DEADLINE_SECONDS', crew_deadline), \
+             patch.object(Config, 'INTELLIGENCE_DEADLINE_SECONDS', stage_deadline):
+            started = time.monotonic()
+            results = asyncio.run(self.orchestrator.run_crews_with_deadlines({"brand": "Acme"}, crews, factories))
+        return results, self.orchestrator.crew_status, time.monotonic() - started
+
+    def test_wait_keeps_waiting_for_straggler(self):
+        """Test the wait policy ignores the crew deadline and gets every report."""
+        results, status, _ = self.run_crews("wait")
+
+        self.assertEqual(results["market_trends"], "market_trends report")
+        self.assertEqual(sorted(status["completed"]), sorted(results))
+        self.assertEqual((status["timed_out"], status["hedged"], status["running"]), ([], [], []))
+
+    def test_partial_proceeds_without_straggler(self):
+        """Test the partial policy returns at the crew deadline with the finished domains."""
+        results, status, elapsed = self.run_crews("partial")
+
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(results["competitor_analysis"], "competitor_analysis report")
+        self.assertTrue(results["market_trends"].startswith("Error:"))
+        self.assertEqual(status["timed_out"], ["market_trends"])
+        self.assertEqual(status["running"], ["market_trends"])
+        self.assertEqual(list(results), ["competitor_analysis", "customer_insights", "market_trends"])
+
+    def test_hedge_relaunches_straggler(self):
+        """Test the hedge policy takes the relaunched crew's faster report."""
+        results, status, elapsed = self.run_crews("hedge")
+
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(results["market_trends"], "market_trends_hedge report")
+        self.assertEqual(status["hedged"], ["market_trends"])
+        self.assertIn("market_trends", status["completed"])
+        self.assertIn("market_trends_hedge", self.launched)
+
+    def test_hedge_runs_on_its_own_agent_and_evidence(self):
+        """Test the hedge gets a separate agent, released when it ends, and its evidence replaces the straggler's."""
+        straggler_index, hedge_index = object(), object()
+        self.orchestrator.domain_indexes = {"market_trends": straggler_index, "market_trends_hedge": hedge_index}
+        self.run_crews("hedge")
+
+        self.assertEqual(self.hedge_agents, ["agent-0"])
+        self.assertEqual(self.released, ["agent-0"])
+        self.assertIs(self.orchestrator.domain_indexes["market_trends"], hedge_index)
+        self.assertNotIn("market_trends_hedge", self.orchestrator.domain_indexes)
+
+    def test_orchestrator_with_running_crew_not_pooled(self):
+        """Test an orchestrator is only returned to the pool when none of its crews is still running."""
+        pool = MagicMock()
+        pool.acquire.return_value = self.orchestrator
+        with patch.object(parallel_crews, 'get_agent_pool', return_value=pool):
+            self.run_crews("partial")
+            with pooled_orchestrator():
+                pass
+            pool.release.assert_not_called()
+
+            self.run_crews("wait")
+            with pooled_orchestrator():
+                pass
+            pool.release.assert_called_once()
+
+    def test_stage_deadline_bounds_every_policy(self):
+        """Test a hung crew cannot hold the stage past its deadline."""
+        results, status, elapsed = self.run_crews("wait", stage_deadline=0.1, trends_seconds=1.0)
+
+        self.assertLess(elapsed, 0.5)
+        self.assertIn("timed out after 0.1s", results["market_trends"])
+        self.assertEqual(status["timed_out"], ["market_trends"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Unit tests for streaming strategy and action output.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from brand_positioning.core.streaming import PartialResultStream
+
+
+class TestPartialResultStream(unittest.TestCase):
+    """Test accumulation and publishing of partial results."""
+
+    def test_tokens_accumulate_after_final_answer(self):
+        """Test that only the answer text, not the agent's reasoning, is published."""
+        published = []
+        stream = PartialResultStream(published.append, {"brand_info": {"brand": "Acme"}}, min_interval=0)
+        on_token = stream.token_callback("positioning_strategy")
+
+        for chunk in ["Thought: I know it\n", "Final Answer:", " Own the", " agency niche"]:
+            on_token(chunk)
+
+        self.assertEqual(published[-1]["positioning_strategy"], "Own the agency niche")
+        self.assertEqual(published[-1]["streaming"], "positioning_strategy")
+        self.assertEqual(published[-1]["brand_info"]["brand"], "Acme")
+
+    def test_publishing_is_throttled(self):
+        """Test that a burst of tokens does not redraw the page per token."""
+        published = []
+        stream = PartialResultStream(published.append, {}, min_interval=60)
+        on_token = stream.token_callback("strategic_actions")
+
+        for _ in range(50):
+            on_token("word ")
+        stream.update(strategic_actions="final", streaming=None)
+
+        self.assertLessEqual(len(published), 2)
+        self.assertEqual(published[-1]["strategic_actions"], "final")
+
+
+class TestTokenCallbackBinding(unittest.TestCase):
+    """Test that streamed LLM chunks reach the bound agent's callback."""
+
+    def test_stream_chunks_forwarded_to_bound_llm_only(self):
+        """Test that chunks from one agent's LLM go to that agent's callback."""
+        from crewai.utilities.events import crewai_event_bus
+        from crewai.utilities.events.llm_events import LLMStreamChunkEvent
+        from brand_positioning.agents.llm import AgentLLM, bind_token_callback
+
+        streaming_agent = MagicMock(llm=AgentLLM(model="gpt-4o", api_key="test"))
+        other_agent = MagicMock(llm=AgentLLM(model="gpt-4o", api_key="test"))
+        received = []
+
+        bind_token_callback([streaming_agent], received.append)
+        crewai_event_bus.emit(streaming_agent.llm, event=LLMStreamChunkEvent(chunk="Hello"))
+        crewai_event_bus.emit(other_agent.llm, event=LLMStreamChunkEvent(chunk="ignored"))
+        self.assertTrue(streaming_agent.llm.stream)
+
+        bind_token_callback([streaming_agent], None)
+        crewai_event_bus.emit(streaming_agent.llm, event=LLMStreamChunkEvent(chunk="after"))
+
+        self.assertEqual(received, ["Hello"])
+        self.assertFalse(streaming_agent.llm.stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
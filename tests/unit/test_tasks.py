@@ -9,7 +9,11 @@ import sys
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from brand_positioning.core.tasks import create_positioning_strategy_task, create_strategic_action_task
+from brand_positioning.core.tasks import (
+    create_domain_digest_task,
+    create_positioning_strategy_task,
+    create_strategic_action_task
+)
 from brand_positioning.core.parallel_tasks import (
     create_competitor_analysis_task,
     create_customer_insights_task,
@@ -71,6 +75,30 @@ class TestTasks(unittest.TestCase):
         self.assertIn("POSITIONING STRATEGY", task.description)
         self.assertIn("Test positioning strategy results", task.description)
 
+    def test_domain_digest_task_creation(self):
+        """Test digest task embeds one domain's findings and runs synchronously."""
+        findings = "Acme charges $49/seat (https://g2.com/acme)"
+        task = create_domain_digest_task(self.test_brand_info, "competitor_analysis", findings)
+        
+        self.assertIn("TestBrand", task.description)
+        self.assertIn("COMPETITOR ANALYSIS FINDINGS", task.description)
+        self.assertIn(findings, task.description)
+        self.assertFalse(task.async_execution)
+
+    def test_focused_tasks_share_attached_research(self):
+        """Test attached research replaces the tool steps and reaches the strategic move."""
+        from brand_positioning.core.focused_tasks import create_niche_positioning_task, create_strategic_move_task
+        
+        research = '{"Competitor Gap Research": {"competitor_count": 2}}'
+        niche = create_niche_positioning_task(self.test_brand_info, None, research)
+        move = create_strategic_move_task(self.test_brand_info, None, "Niche: agencies", research)
+        
+        self.assertIn(research, niche.description)
+        self.assertNotIn("Use the Competitor Gap Research tool", niche.description)
+        self.assertIn("Use the Competitor Gap Research tool", create_niche_positioning_task(self.test_brand_info, None).description)
+        self.assertIn(research, move.description)
+        self.assertIn("Niche: agencies", move.description)
+
     def test_competitor_analysis_task_creation(self):
         """Test competitor analysis task creation."""
         task = create_competitor_analysis_task(self.test_brand_info)
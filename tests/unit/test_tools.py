@@ -5,7 +5,10 @@ Unit tests for research tools.
 import unittest
 import os
 import sys
-from unittest.mock import patch
+import asyncio
+import inspect
+import json
+from unittest.mock import patch, AsyncMock
 
 # Add src to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -66,5 +69,47 @@ class TestTools(unittest.TestCase):
         self.assertIn('total_serp_calls', search_config)
 
 
+    def test_async_tool_variants_match_sync_tools(self):
+        """Test that asyncio tool variants keep names and queries of the blocking tools."""
+        from brand_positioning.tools.tools import CompetitorResearchTool
+        from brand_positioning.tools.async_tools import (
+            AsyncCompetitorResearchTool,
+            AsyncCompetitorGapTool
+        )
+        
+        sync_tool = CompetitorResearchTool()
+        async_tool = AsyncCompetitorResearchTool()
+        
+        self.assertEqual(async_tool.name, sync_tool.name)
+        self.assertEqual(async_tool.build_queries("coffee"), sync_tool.build_queries("coffee"))
+        self.assertTrue(inspect.iscoroutinefunction(async_tool._run))
+        self.assertTrue(inspect.iscoroutinefunction(AsyncCompetitorGapTool()._run))
+
+    def test_async_tool_formats_results(self):
+        """Test that asyncio tools return the same JSON structure."""
+        from brand_positioning.tools.async_tools import AsyncCustomerInsightTool
+        
+        batch = [{"organic_results": [{"title": "T", "snippet": "S", "link": "L"}]}]
+        with patch('brand_positioning.tools.async_tools.search_many_shared',
+                   new=AsyncMock(return_value=batch)):
+            result = json.loads(asyncio.run(AsyncCustomerInsightTool()._run("coffee")))
+        
+        self.assertEqual(result["total_results"], 1)
+        self.assertEqual(result["results"][0]["link"], "L")
+
+    def test_shared_focused_research_is_one_batch(self):
+        """Test shared research runs both focused tools' searches in one batch and splits the results."""
+        from brand_positioning.tools.focused_tools import gather_focused_research
+        
+        batch = [{"organic_results": [{"title": f"R{i}", "snippet": f"S{i}"}]} for i in range(4)]
+        with patch('brand_positioning.tools.focused_tools.search_many', return_value=batch) as mock_search:
+            research = json.loads(gather_focused_research("Acme", "project software"))
+        
+        self.assertEqual(mock_search.call_count, 1)
+        self.assertEqual(len(mock_search.call_args.args[0]), 4)
+        self.assertEqual(research["Competitor Gap Research"]["competitor_count"], 2)
+        self.assertEqual(research["Positioning Opportunity Finder"]["strategic_insights"][1]["title"], "R3")
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file